@@ -1,43 +1,320 @@
 import os
 import shutil
+import uuid
+from contextlib import contextmanager
+from urllib.parse import urlsplit
 from pathlib import Path
 import pytest
 from dotenv import load_dotenv
-from playwright.sync_api import sync_playwright, Page
+from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+from modules.utils.auth import ensure_storage_state, fresh_storage_state
+from modules.utils.backend import EndpointNotFound, PanorraApi, PROFILE_FIELDS
+from modules.utils.parallel import auto_worker_count
+from modules.utils.context_pool import ContextPool
+from modules.utils.screencast import ScreencastBuffer
+from modules.utils.video import VideoPipeline
+from modules.utils.screenshots import ScreenshotWriter
+from modules.utils.tracing import TraceChunk
+from modules.utils.async_support import SyncCompatibleLoopPolicy, released_sync_loop
+from modules.utils.shared_page import SharedPage, isolating_calls
+from modules.utils.har import HAR_AUTH_STATE, har_file, apply_har
+from modules.utils.asset_cache import AssetCache
+from modules.utils.blocking import BLOCK_PROFILES, apply_blocking
+from modules.utils.throttling import THROTTLE_PROFILES, Throttling, resolve_throttling, throttle_tag
+from modules.utils.history import HistoryStore, current_commit, longest_first, shard
+from modules.utils.perf import BUDGET_METRICS, PerfRecorder, install_perf, load_budgets, budget_violations
+from modules.stub_server import StubServer, DEFAULT_USERNAME, DEFAULT_PASSWORD
+from modules.browser_server import BrowserServer
 
 def pytest_addoption(parser):
     """Adds custom command-line options to pytest."""
     parser.addoption("--username", action="store", default=None, help="Username for login")
     parser.addoption("--password", action="store", default=None, help="Password for login")
+    parser.addoption("--auth-state-ttl", action="store", type=int, default=None,
+                     help="Seconds a cached login storage state is reused (0 forces a fresh login)")
+    parser.addoption("--record-video", action="store", choices=["on", "on-failure", "off"],
+                     default=os.getenv("RECORD_VIDEO", "on"),
+                     help="Record videos of smoke/regression tests; 'on-failure' only keeps a rolling "
+                          "screencast buffer and writes it when the test fails or is rerun")
+    parser.addoption("--record-trace", action="store", choices=["on", "on-failure", "off"],
+                     default=os.getenv("RECORD_TRACE", "on-failure"),
+                     help="Keep each test's Playwright trace (DOM snapshots, network, console) under results/traces/; "
+                          "'on-failure' drops the traces of passing tests")
+    parser.addoption("--video-buffer-seconds", action="store", type=int,
+                     default=int(os.getenv("VIDEO_BUFFER_SECONDS", "20")),
+                     help="Seconds of frames kept per test in '--record-video on-failure' mode")
+    parser.addoption("--video-format", action="store", choices=["mp4", "webm"], default=os.getenv("VIDEO_FORMAT", "mp4"),
+                     help="Format videos are transcoded to in the background (needs ffmpeg, else kept as webm)")
+    parser.addoption("--screenshot-format", action="store", choices=["png", "jpeg", "webp"],
+                     default=os.getenv("SCREENSHOT_FORMAT", "png"),
+                     help="Image format of saved screenshots (webp needs Pillow)")
+    parser.addoption("--screenshot-quality", action="store", type=int, default=int(os.getenv("SCREENSHOT_QUALITY", "80")),
+                     help="Quality (0-100) of jpeg/webp screenshots")
+    parser.addoption("--har-record", action="store_true", default=False,
+                     help="Record each test's network traffic into HAR files")
+    parser.addoption("--har-replay", action="store_true", default=False,
+                     help="Serve each test's network traffic from its recorded HAR file")
+    parser.addoption("--har-dir", action="store", default=os.getenv("HAR_DIR", "hars"),
+                     help="Directory holding the HAR recordings")
+    parser.addoption("--har-version", action="store", default=os.getenv("HAR_VERSION", "default"),
+                     help="Version (sub-directory) of the HAR recordings to record or replay")
+    parser.addoption("--har-not-found", action="store", choices=["abort", "fallback"], default="abort",
+                     help="On replay, abort requests missing from the HAR or let them fall through to the network")
+    parser.addoption("--video-tail-ms", action="store", type=int, default=int(os.getenv("VIDEO_TAIL_MS", "1500")),
+                     help="Pause kept at the end of a recorded video so the final state is visible")
+    parser.addoption("--asset-cache", action="store_true", default=os.getenv("ASSET_CACHE", "false").lower() == "true",
+                     help="Serve static assets (scripts, styles, images, fonts) from an on-disk cache shared by all workers")
+    parser.addoption("--asset-cache-dir", action="store", default=os.getenv("ASSET_CACHE_DIR", ".asset_cache"),
+                     help="Directory of the shared asset cache (kept between runs)")
+    parser.addoption("--asset-cache-mb", action="store", type=int, default=int(os.getenv("ASSET_CACHE_MB", "512")),
+                     help="Size limit of the asset cache; least recently used assets are evicted beyond it")
+    parser.addoption("--throttle", action="store", default=os.getenv("THROTTLE", ""),
+                     help=f"Comma-separated throttle profiles ({', '.join(THROTTLE_PROFILES)}) for tests without a `throttle` marker")
+    parser.addoption("--perf-metrics", action="store", choices=["on", "off"], default=os.getenv("PERF_METRICS", "on"),
+                     help="Record web performance metrics of every navigation under results/perf/")
+    parser.addoption("--perf-budgets", action="store", default=os.getenv("PERF_BUDGETS", "perf_budgets.json"),
+                     help="JSON file of performance budgets per route")
+    parser.addoption("--perf-budget-mode", action="store", choices=["fail", "warn", "off"],
+                     default=os.getenv("PERF_BUDGET_MODE", "fail"),
+                     help="'fail' reports exceeded budgets as a teardown error of the test, 'warn' only lists them")
+    parser.addoption("--history", action="store", choices=["on", "off"], default=os.getenv("TEST_HISTORY", "on"),
+                     help="Append per-test phase durations and outcomes to the history database")
+    parser.addoption("--history-db", action="store", default=os.getenv("TEST_HISTORY_DB", ".test_history/history.sqlite3"),
+                     help="SQLite database holding the test history (kept between runs)")
+    parser.addoption("--longest-first", action="store_true", default=os.getenv("LONGEST_FIRST", "false").lower() == "true",
+                     help="Run the tests with the longest recorded duration first, so parallel workers finish together")
+    parser.addoption("--shard", action="store", default=os.getenv("TEST_SHARD"),
+                     help="Run only shard I of N ('I/N'), with shards balanced by recorded durations")
+    parser.addoption("--flaky-reruns", action="store", type=int, default=int(os.getenv("FLAKY_RERUNS", "2")),
+                     help="Reruns given to tests whose recorded flake rate reaches --flake-threshold (others fail fast)")
+    parser.addoption("--flake-threshold", action="store", type=float, default=float(os.getenv("FLAKE_THRESHOLD", "0.05")),
+                     help="Flake rate from which a test gets reruns")
+    parser.addoption("--quarantine-threshold", action="store", type=float,
+                     default=float(os.getenv("QUARANTINE_THRESHOLD", "0.3")),
+                     help="Flake rate from which a test is quarantined (needs enough recorded runs)")
+    parser.addoption("--quarantine", action="store", choices=["include", "exclude", "only"],
+                     default=os.getenv("QUARANTINE", "include"),
+                     help="Run quarantined tests with the rest ('include'), skip them ('exclude') or run only them ('only')")
+    parser.addoption("--stub-server", action="store_true", default=os.getenv("STUB_SERVER", "false").lower() == "true",
+                     help="Run against a local stand-in of the Panorra app instead of --base-url")
+    parser.addoption("--stub-latency-ms", action="store", type=int, default=int(os.getenv("STUB_LATENCY_MS", "0")),
+                     help="Delay the stand-in server adds to every response")
+    parser.addoption("--reuse-contexts", action="store_true", default=os.getenv("REUSE_CONTEXTS", "false").lower() == "true",
+                     help="Reuse warm browser contexts (reset between tests) for tests without a video")
+    parser.addoption("--browser-server", action="store_true",
+                     default=os.getenv("BROWSER_SERVER", "false").lower() == "true",
+                     help="Attach to a Chrome kept running between runs (started on first use) instead of launching one")
+    parser.addoption("--browser-server-port", action="store", type=int,
+                     default=int(os.getenv("BROWSER_SERVER_PORT", "9333")),
+                     help="Local DevTools port of the long-lived Chrome used by --browser-server")
 
 # Load environment variables from .env file
 load_dotenv()
 HEADLESS = os.getenv("HEADLESS", "true").lower() == "true"
 
+# Name of the pytest-xdist worker running this process ("main" for serial runs)
+WORKER_ID = os.getenv("PYTEST_XDIST_WORKER", "main")
+
 # Define base directories for test results
 RESULTS_DIR = Path("results")
 VIDEOS_DIR = RESULTS_DIR / "videos"
 SCREENSHOTS_DIR = RESULTS_DIR / "screenshots"
-TEMP_VIDEO_DIR = RESULTS_DIR / "temp_videos"
+PERF_DIR = RESULTS_DIR / "perf"
+TRACES_DIR = RESULTS_DIR / "traces"
+# Scratch files are kept per worker so parallel workers never clean up each other's data
+TEMP_VIDEO_DIR = RESULTS_DIR / "temp_videos" / WORKER_ID
+AUTH_STATE_FILE = RESULTS_DIR / ".auth" / f"state_{WORKER_ID}.json"
+# State and log of the long-lived Chrome of --browser-server, shared by all workers and runs
+BROWSER_SERVER_DIR = Path(os.getenv("BROWSER_SERVER_DIR", ".browser_server"))
+
+# Timeout of the guest homepage load done by the `guest_homepage` fixture
+HOME_LOAD_TIMEOUT = 60000
+
+# A test is only quarantined automatically once it has this many recorded runs
+QUARANTINE_MIN_RUNS = 5
+# Seconds between reruns of a flaky test
+FLAKY_RERUNS_DELAY = 3
+
+# Markers that decide the artifact folder (results/<kind>/<marker>/...)
+ARTIFACT_MARKERS = ("smoke", "regression", "unit")
 
 # Create directories if they don't exist
 for folder in [VIDEOS_DIR, SCREENSHOTS_DIR, TEMP_VIDEO_DIR]:
     folder.mkdir(parents=True, exist_ok=True)
 
+def _environment(config):
+    """Name of the environment under test, used to keep test history of different targets apart."""
+    if os.getenv("TEST_ENVIRONMENT"):
+        return os.environ["TEST_ENVIRONMENT"]
+    if config.getoption("--stub-server"):
+        return "stub"
+    base_url = config.getoption("--base-url") or os.getenv("BASE_URL", "https://dev.panorra.com/")
+    return urlsplit(base_url).netloc or base_url
+
+def _shard_option(config):
+    """Parses `--shard I/N` into (I, N), or None."""
+    value = config.getoption("--shard")
+    if not value:
+        return None
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard expects 'I/N', got '{value}'")
+    if not 1 <= index <= count:
+        raise pytest.UsageError(f"--shard {value}: I must be between 1 and N")
+    return index, count
+
+def pytest_configure(config):
+    """Starts the background writers that finalize videos and screenshots while tests keep running."""
+    if config.getoption("--har-record") and config.getoption("--har-replay"):
+        raise pytest.UsageError("--har-record and --har-replay cannot be used together")
+    # Set once by the controller and inherited by xdist workers, so all rows of a run share it
+    os.environ.setdefault("TEST_RUN_ID", uuid.uuid4().hex)
+    config.history = None
+    if (config.getoption("--history") == "on" or config.getoption("--longest-first") or _shard_option(config)
+            or config.getoption("--quarantine") != "include"):
+        config.history = HistoryStore(config.getoption("--history-db"), os.environ["TEST_RUN_ID"],
+                                      current_commit(), _environment(config))
+    config.video_pipeline = VideoPipeline(config.getoption("--video-format"))
+    config.screenshot_writer = ScreenshotWriter(config.getoption("--screenshot-format"),
+                                                config.getoption("--screenshot-quality"))
+    try:
+        config.perf_budgets = load_budgets(config.getoption("--perf-budgets"))
+    except ValueError as e:
+        raise pytest.UsageError(str(e))
+    config.asset_cache = None
+    if config.getoption("--asset-cache"):
+        config.asset_cache = AssetCache(config.getoption("--asset-cache-dir"), config.getoption("--asset-cache-mb"))
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    """Sizes `-n auto` from CPU cores and free memory instead of cores alone."""
+    return auto_worker_count(int(os.getenv("WORKER_MEMORY_MB", "1024")))
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Maps `resource_lock` markers onto xdist groups so tests sharing a resource run serially,
+    and rejects unknown `block` or `throttle` profiles and `perf_budget` metrics before any browser is started.
+    Then applies the flake history (reruns and quarantine) and orders (or shards) the tests
+    by their recorded durations when asked to.
+    """
+    for item in items:
+        lock = item.get_closest_marker("resource_lock")
+        if lock:
+            if not lock.args:
+                raise pytest.UsageError(f"{item.nodeid}: resource_lock needs the name of the locked resource, "
+                                        f"e.g. @pytest.mark.resource_lock(\"account\")")
+            item.add_marker(pytest.mark.xdist_group(lock.args[0]))
+        unknown = set(_block_profiles(item)) - set(BLOCK_PROFILES)
+        if unknown:
+            raise pytest.UsageError(f"{item.nodeid}: unknown block profile(s) {sorted(unknown)}; "
+                                    f"available: {', '.join(BLOCK_PROFILES)}")
+        try:
+            resolve_throttling(_throttle_profiles(item))
+        except ValueError as e:
+            raise pytest.UsageError(f"{item.nodeid}: {e}")
+        budget = item.get_closest_marker("perf_budget")
+        if budget and set(budget.kwargs) - set(BUDGET_METRICS):
+            raise pytest.UsageError(f"{item.nodeid}: unknown perf_budget metric(s) "
+                                    f"{sorted(set(budget.kwargs) - set(BUDGET_METRICS))}; available: {', '.join(BUDGET_METRICS)}")
+
+    quarantined = _apply_flake_history(config, items)
+    quarantine = config.getoption("--quarantine")
+    if quarantine != "include":
+        deselected = [item for item in items if (item in quarantined) != (quarantine == "only")]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if item not in deselected]
+
+    shard_option = _shard_option(config)
+    if shard_option:
+        kept, deselected = shard(items, config.history.expected_durations(), *shard_option)
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+        items[:] = kept
+    elif config.getoption("--longest-first"):
+        longest_first(items, config.history.expected_durations())
+
+def _apply_flake_history(config, items):
+    """
+    Gives reruns only to tests whose recorded flake rate reaches `--flake-threshold`, so
+    deterministic failures fail fast. Returns the quarantined tests: chronically flaky ones
+    and those marked `quarantine`.
+    """
+    rates = config.history.flake_rates() if config.history else {}
+    reruns = config.getoption("--flaky-reruns")
+    quarantined = set()
+    for item in items:
+        stats = rates.get(item.nodeid)
+        if item.get_closest_marker("quarantine") or (
+                stats and stats.runs >= QUARANTINE_MIN_RUNS and stats.rate >= config.getoption("--quarantine-threshold")):
+            quarantined.add(item)
+        is_flaky = item in quarantined or (stats and stats.flaky and stats.rate >= config.getoption("--flake-threshold"))
+        if is_flaky and reruns and not item.get_closest_marker("flaky"):
+            item.add_marker(pytest.mark.flaky(reruns=reruns, reruns_delay=FLAKY_RERUNS_DELAY))
+    return quarantined
+
+def _marker_name(node):
+    """Returns the test-kind marker used to group artifacts of a test."""
+    for name in ARTIFACT_MARKERS:
+        if node.get_closest_marker(name):
+            return name
+    return "unmarked"
+
+def _block_profiles(node):
+    """Blocking profiles requested by every `block` marker of a test (module and function level)."""
+    return [profile for marker in node.iter_markers("block") for profile in marker.args]
+
+def _throttle_profiles(node):
+    """Throttle profiles of a test: its `throttle` marker (with no profiles: unthrottled), else --throttle."""
+    marker = node.get_closest_marker("throttle")
+    if marker:
+        return list(marker.args)
+    return [profile.strip() for profile in node.config.getoption("--throttle").split(",") if profile.strip()]
+
+def _access_headers():
+    """The Access-Code header the environment expects on every request (none when unset)."""
+    access_code = os.getenv("ACCESS_CODE")
+    return {"Access-Code": access_code} if access_code else {}
+
+def _context_args():
+    """Common arguments for every browser context created by the suite."""
+    return {
+        "viewport": {'width': 1280, 'height': 720},
+        "extra_http_headers": _access_headers(),
+    }
+
+@pytest.fixture(scope="session")
+def stub_server(request):
+    """Local stand-in of the Panorra app (one per worker), seeded with the suite's account."""
+    server = StubServer(
+        latency_ms=request.config.getoption("--stub-latency-ms"),
+        accounts={request.getfixturevalue("username"): request.getfixturevalue("password")},
+        access_code=os.getenv("ACCESS_CODE"),
+    )
+    server.start()
+    yield server
+    server.stop()
+
 @pytest.fixture(scope="session")
 def base_url(request):
     """Fixture for the base URL of the application under test."""
+    if request.config.getoption("--stub-server"):
+        return request.getfixturevalue("stub_server").url
     return request.config.getoption("--base-url") or os.getenv("BASE_URL", "https://dev.panorra.com/")
 
 # ... (fixtures lainnya tetap sama) ...
 
 @pytest.fixture(scope="session")
 def username(request):
-    return request.config.getoption("--username") or os.getenv("TEST_USERNAME")
+    stub_default = DEFAULT_USERNAME if request.config.getoption("--stub-server") else None
+    return request.config.getoption("--username") or os.getenv("TEST_USERNAME") or stub_default
 
 @pytest.fixture(scope="session")
 def password(request):
-    return request.config.getoption("--password") or os.getenv("TEST_PASSWORD")
+    stub_default = DEFAULT_PASSWORD if request.config.getoption("--stub-server") else None
+    return request.config.getoption("--password") or os.getenv("TEST_PASSWORD") or stub_default
 
 @pytest.fixture(scope="session")
 def access_code(request):
@@ -49,72 +326,512 @@ def playwright_instance():
         yield p
 
 @pytest.fixture(scope="session")
-def browser(playwright_instance):
-    browser = playwright_instance.chromium.launch(headless=HEADLESS, channel="chrome")
+def browser_server(request):
+    """
+    The long-lived Chrome of `--browser-server`, shared by the workers and by later runs.
+    It is started when missing and restarted when its health check fails; stop it with
+    `python -m modules.browser_server stop`.
+    """
+    server = BrowserServer(BROWSER_SERVER_DIR, request.config.getoption("--browser-server-port"), headless=HEADLESS)
+    server.ensure()
+    return server
+
+@pytest.fixture(scope="session")
+def browser(playwright_instance, request):
+    if request.config.getoption("--browser-server"):
+        # Closing a connected browser only closes this run's contexts, Chrome keeps running
+        browser = request.getfixturevalue("browser_server").connect(playwright_instance)
+    else:
+        browser = playwright_instance.chromium.launch(headless=HEADLESS, channel="chrome")
     yield browser
     browser.close()
 
+@pytest.fixture(scope="session")
+def recording_browser(playwright_instance, browser, request):
+    """
+    Browser used for contexts that record a video. `--slowmo` only slows these
+    down, so tests without a recording keep running at full speed.
+    """
+    slowmo = request.config.getoption("--slowmo", 0) or 0
+    if not slowmo:
+        yield browser
+        return
+    if request.config.getoption("--browser-server"):
+        slow_browser = request.getfixturevalue("browser_server").connect(playwright_instance, slow_mo=slowmo)
+    else:
+        slow_browser = playwright_instance.chromium.launch(headless=HEADLESS, channel="chrome", slow_mo=slowmo)
+    yield slow_browser
+    slow_browser.close()
+
+# =====================================================================
+# Async fixtures, for tests that drive several pages at once with asyncio.gather.
+# They are function-scoped: pytest-asyncio runs every test in an event loop of its
+# own and Playwright objects cannot be shared between loops.
+# =====================================================================
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Event loops of async tests run next to the session's sync Playwright (see released_sync_loop)."""
+    return SyncCompatibleLoopPolicy()
+
+@pytest.fixture
+async def async_playwright_instance():
+    async with async_playwright() as p:
+        yield p
+
+@pytest.fixture
+async def async_browser(async_playwright_instance, request):
+    if request.config.getoption("--browser-server"):
+        endpoint = request.getfixturevalue("browser_server").endpoint
+        browser = await async_playwright_instance.chromium.connect_over_cdp(endpoint)
+    else:
+        browser = await async_playwright_instance.chromium.launch(headless=HEADLESS, channel="chrome")
+    yield browser
+    await browser.close()
+
+@pytest.fixture
+def async_context_args(request):
+    """
+    Arguments of `async_context`, honouring the `authenticated` marker. Resolved in a sync
+    fixture because the cached login session comes from the sync fixtures.
+    """
+    context_args = _context_args()
+    authenticated = request.node.get_closest_marker("authenticated")
+    if authenticated and authenticated.kwargs.get("fresh"):
+        context_args["storage_state"] = fresh_storage_state(
+            request.getfixturevalue("browser"), request.getfixturevalue("playwright_instance"),
+            request.getfixturevalue("base_url"), request.getfixturevalue("username"),
+            request.getfixturevalue("password"), _context_args())
+    elif authenticated:
+        context_args["storage_state"] = str(request.getfixturevalue("auth_state"))
+    return context_args
+
+@pytest.fixture
+async def async_context(async_browser, async_context_args):
+    ctx = await async_browser.new_context(**async_context_args)
+    yield ctx
+    await ctx.close()
+
+@pytest.fixture
+async def async_page(async_context):
+    yield await async_context.new_page()
+
+def _video_mode(node):
+    """Video mode of a test: smoke/regression tests follow `--record-video`, others are never recorded."""
+    is_flow_test = node.get_closest_marker("smoke") or node.get_closest_marker("regression")
+    return node.config.getoption("--record-video") if is_flow_test else "off"
+
+def _records_video(node):
+    """True when the test's context records a full video."""
+    return _video_mode(node) == "on"
+
+def _keeps_buffered_video(node, rep):
+    """A buffered video is only written when the test failed or is a rerun attempt."""
+    return bool(rep) and (rep.failed or getattr(node, "execution_count", 1) > 1)
+
+def _video_target(node, status):
+    """Final location of a test's video, without suffix: results/videos/<marker>/<module>/<status>/."""
+    return VIDEOS_DIR / _marker_name(node) / Path(node.fspath).stem / status / f"{node.name}_{status}"
+
+@pytest.fixture(scope="session")
+def auth_state(browser, base_url, username, password, request):
+    """Logs in once per session and returns the path of the saved storage state."""
+    har_state = Path(request.config.getoption("--har-dir")) / request.config.getoption("--har-version") / HAR_AUTH_STATE
+    if request.config.getoption("--har-replay"):
+        # The recorded responses belong to the session that was active while recording
+        if not har_state.exists():
+            pytest.fail(f"No recorded login state at {har_state}; record one with --har-record first")
+        return har_state
+    ttl = request.config.getoption("--auth-state-ttl")
+    if ttl is None:
+        ttl = int(os.getenv("AUTH_STATE_TTL", "3600"))
+    state = ensure_storage_state(browser, request.getfixturevalue("playwright_instance"), base_url, username, password,
+                                 AUTH_STATE_FILE, ttl, _context_args())
+    if request.config.getoption("--har-record"):
+        har_state.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(state, har_state)
+    return state
+
+@pytest.fixture(scope="session")
+def account_api(playwright_instance, base_url, request):
+    """Backend client logged in as the test account; None on replayed runs, which never touch the backend."""
+    if request.config.getoption("--har-replay"):
+        yield None
+        return
+    api = PanorraApi.from_storage_state(playwright_instance, base_url, request.getfixturevalue("auth_state"),
+                                        _access_headers())
+    yield api
+    api.dispose()
+
+@pytest.fixture
+def feed_post(account_api):
+    """
+    Starts the test with no blocked posts and at least one post in the feed (created if
+    needed), and unblocks whatever the test blocked afterwards. Yields the first feed post,
+    or None when the backend cannot seed it and the test runs on the existing feed.
+    """
+    if account_api is None:
+        yield None
+        return
+    try:
+        for post in account_api.blocked_posts():
+            account_api.unblock_post(post["id"])
+        feed = account_api.feed() or [account_api.create_post("Automation test post")]
+    except EndpointNotFound as e:
+        print(f"\n[Seeding unavailable] {e}; running on the existing feed. Set POSTS_API_PATH, "
+              f"BLOCKED_POSTS_API_PATH and (UN)BLOCK_POST_API_PATH for this environment")
+        yield None
+        return
+    yield feed[0]
+    for post in account_api.blocked_posts():
+        account_api.unblock_post(post["id"])
+
+@pytest.fixture
+def profile_snapshot(account_api):
+    """
+    Saves the editable profile fields before the test and writes them back afterwards;
+    None when the backend cannot read the profile and nothing is restored.
+    """
+    if account_api is None:
+        yield None
+        return
+    try:
+        profile = account_api.profile()
+    except EndpointNotFound as e:
+        print(f"\n[Seeding unavailable] {e}; the profile is not restored after the test. "
+              f"Set PROFILE_API_PATH for this environment")
+        yield None
+        return
+    snapshot = {field: profile[field] for field in PROFILE_FIELDS if field in profile}
+    yield snapshot
+    account_api.update_profile(**snapshot)
+
+@pytest.fixture(scope="session")
+def context_pool(browser, base_url):
+    """Pool of warm contexts used when `--reuse-contexts` is enabled."""
+    pool = ContextPool(browser, origins=[base_url])
+    yield pool
+    pool.close()
+
 @pytest.fixture(scope="function")
 def context(browser, request):
-    is_flow_test = request.node.get_closest_marker("smoke") or request.node.get_closest_marker("regression")
-    context_args = {"viewport": {'width': 1280, 'height': 720}}
-    if is_flow_test:
+    records_video = _records_video(request.node)
+    context_args = _context_args()
+    if records_video:
         context_args["record_video_dir"] = str(TEMP_VIDEO_DIR)
-    context_args["extra_http_headers"] = {"Access-Code": os.getenv("ACCESS_CODE")}
-    ctx = browser.new_context(**context_args)
-    request.node.context = ctx
+        browser = request.getfixturevalue("recording_browser")
+    har_record = request.config.getoption("--har-record")
+    har_replay = request.config.getoption("--har-replay")
+    authenticated = request.node.get_closest_marker("authenticated")
+    # Replayed runs answer every request from the recording, so they keep the recorded session
+    fresh_session = bool(authenticated and authenticated.kwargs.get("fresh")) and not har_replay
+    if fresh_session:
+        # A session of its own (new login), for tests that end it, e.g. by logging out
+        context_args["storage_state"] = fresh_storage_state(
+            request.getfixturevalue("browser"), request.getfixturevalue("playwright_instance"),
+            request.getfixturevalue("base_url"), request.getfixturevalue("username"),
+            request.getfixturevalue("password"), _context_args())
+    elif authenticated:
+        context_args["storage_state"] = str(request.getfixturevalue("auth_state"))
+    # Recording contexts are never pooled: their video (and HAR) is only finalized when the context closes.
+    # One-off sessions are not pooled either, their storage state is never shared with another test.
+    pool = None
+    if (request.config.getoption("--reuse-contexts") and not records_video and not fresh_session
+            and not (har_record or har_replay)):
+        pool = request.getfixturevalue("context_pool")
+    ctx = pool.acquire(context_args) if pool else browser.new_context(**context_args)
+    throttle_profiles = _throttle_profiles(request.node)
+    request.node.throttling = Throttling(ctx, throttle_profiles) if throttle_profiles else None
+    if har_record or har_replay:
+        har = har_file(request.config.getoption("--har-dir"), request.config.getoption("--har-version"), request.node)
+        not_found = request.config.getoption("--har-not-found")
+        if har_replay and not har.exists() and not_found == "abort":
+            ctx.close()
+            pytest.fail(f"No HAR recording at {har}; record one with --har-record first")
+        if har_record or har.exists():
+            apply_har(ctx, har, record=har_record, not_found=not_found)
+    elif request.config.asset_cache and not throttle_profiles:
+        # HAR runs already control every response, the cache would only hide traffic from them.
+        # Throttled runs measure loads over the emulated network, which cached assets would skip.
+        request.config.asset_cache.attach(ctx)
+    block_profiles = _block_profiles(request.node)
+    if block_profiles:
+        # Registered last so blocked requests never reach the cache or the network
+        apply_blocking(ctx, block_profiles, request.getfixturevalue("base_url"))
+    perf, trace = _start_test_recording(request, ctx)
     yield ctx
+    _finish_test_recording(request, ctx, perf, trace)
+    if request.node.throttling:
+        request.node.throttling.stop()
+    rep = getattr(request.node, "rep_call", None)
+    if pool:
+        # A failed test may have left state the reset does not know about
+        dirty = rep is None or not rep.passed or getattr(request.node, "context_dirty", False)
+        pool.release(ctx, dirty=dirty)
+        return
     video_path = Path(ctx.pages[0].video.path()) if ctx.pages and ctx.pages[0].video else None
+    tail_ms = request.config.getoption("--video-tail-ms")
+    if rep and video_path and tail_ms > 0 and not ctx.pages[0].is_closed():
+        # Keep the final state on screen for a moment so it is visible in the recording
+        ctx.pages[0].wait_for_timeout(tail_ms)
     ctx.close()
-    rep = getattr(request.node, "rep_call", None)
     if rep and video_path and video_path.exists():
+        status = "passed" if rep.passed else "failed"
+        request.config.video_pipeline.submit(video_path, _video_target(request.node, status))
+
+def _start_test_recording(request, ctx):
+    """Starts the test's performance recorder and trace chunk on `ctx`."""
+    perf = None
+    if request.config.getoption("--perf-metrics") == "on":
+        perf = PerfRecorder(PERF_DIR, request.node, _marker_name(request.node),
+                            tags={"throttle": throttle_tag(_throttle_profiles(request.node))})
+        install_perf(ctx, perf)
+    trace = TraceChunk(ctx, request.node.nodeid) if request.config.getoption("--record-trace") != "off" else None
+    request.node.context = ctx
+    request.node.perf = perf
+    return perf, trace
+
+def _finish_test_recording(request, ctx, perf, trace):
+    if trace:
+        _save_trace(request.node, trace, getattr(request.node, "rep_call", None), request.config.getoption("--record-trace"))
+    if perf:
         try:
-            status = "passed" if rep.passed else "failed"
-            test_func_name = request.node.name
-            test_module_name = Path(request.node.fspath).stem
-            marker = next(request.node.iter_markers(), None)
-            marker_name = marker.name if marker else "unmarked"
-            video_dir_final = VIDEOS_DIR / marker_name / test_module_name / status
-            video_dir_final.mkdir(parents=True, exist_ok=True)
-            video_file_final = video_dir_final / f"{test_func_name}_{status}.webm"
-            video_path.rename(video_file_final)
-            print(f"\n[Video saved] {video_file_final}")
+            perf.flush(ctx)
         except Exception as e:
-            print(f"\n[Video save failed] {e}")
+            # e.g. the test closed the context itself
+            print(f"\n[Perf metrics lost] {e}")
+
+def _save_trace(node, trace, rep, mode):
+    """Ends the test's trace chunk, keeping it as results/traces/<marker>/<module>/<test>_<status>_<attempt>.zip."""
+    rep_setup = getattr(node, "rep_setup", None)
+    failed = bool((rep and rep.failed) or (rep_setup and rep_setup.failed))
+    if mode == "on-failure" and not failed:
+        try:
+            trace.stop()
+        except Exception:
+            pass  # The test closed the context, the chunk was dropped with it
+        return
+    status = "failed" if failed else "passed"
+    attempt = getattr(node, "execution_count", 1)
+    path = TRACES_DIR / _marker_name(node) / Path(node.fspath).stem / f"{node.name}_{status}_{attempt}.zip"
+    try:
+        print(f"\n[Trace saved] {trace.stop(path)}")
+    except Exception as e:
+        print(f"\n[Trace failed] {e}")
 
 @pytest.fixture(scope="function")
 def page(context, request):
     page = context.new_page()
+    if request.node.throttling:
+        request.node.throttling.cover(page)
     request.node.page = page
-    yield page
+    with _buffered_video(request, page):
+        yield page
+
+@contextmanager
+def _buffered_video(request, page):
+    """In '--record-video on-failure' mode, keeps a screencast buffer of `page` and writes it when the test failed."""
+    if _video_mode(request.node) != "on-failure":
+        yield
+        return
+    buffer = ScreencastBuffer(page, seconds=request.config.getoption("--video-buffer-seconds"))
+    yield
+    rep = getattr(request.node, "rep_call", None)
+    keep = _keeps_buffered_video(request.node, rep)
+    tail_ms = request.config.getoption("--video-tail-ms")
+    if keep and tail_ms > 0 and not page.is_closed():
+        page.wait_for_timeout(tail_ms)
+    buffer.stop()
+    if keep:
+        status = "passed" if rep.passed else "failed"
+        attempt = getattr(request.node, "execution_count", 1)
+        frames_dir = buffer.dump(TEMP_VIDEO_DIR / f"{request.node.name}_{status}_{attempt}_frames")
+        if frames_dir:
+            request.config.video_pipeline.submit(frames_dir, _video_target(request.node, status))
+
+def _own_page_reason(request):
+    """Why a test cannot use the module's shared guest homepage, or None when it can."""
+    node = request.node
+    if "virtual_clock" in node.fixturenames:
+        return "installs a virtual clock before the page loads"
+    if _block_profiles(node):
+        return "blocks requests"
+    if node.get_closest_marker("authenticated"):
+        return "runs logged in"
+    if node.get_closest_marker("throttle"):
+        return "has throttle profiles of its own"
+    if _records_video(node):
+        return "records a video"
+    if request.config.getoption("--har-record") or request.config.getoption("--har-replay"):
+        return "records or replays its own HAR"
+    calls = isolating_calls(node.function)
+    if calls:
+        return " and ".join(calls)
+    return None
+
+@pytest.fixture(scope="module")
+def shared_guest_homepage(browser, base_url, request):
+    """The guest homepage loaded once for the read-only tests of a module (see `guest_homepage`)."""
+    # Only tests without a `throttle` marker of their own share the page: --throttle applies
+    throttle_profiles = _throttle_profiles(request.node)
+    throttlings = {}
+
+    def new_context():
+        ctx = browser.new_context(**_context_args())
+        if throttle_profiles:
+            throttlings[ctx] = Throttling(ctx, throttle_profiles)
+        elif request.config.asset_cache:
+            request.config.asset_cache.attach(ctx)
+        return ctx
+
+    def prepare_page(page):
+        if page.context in throttlings:
+            throttlings[page.context].cover(page)
+    shared = SharedPage(new_context, base_url, HOME_LOAD_TIMEOUT, prepare_page)
+    yield shared
+    if shared.uses:
+        print(f"\n[Shared homepage] {Path(request.node.fspath).stem}: {shared.loads} load(s) for {shared.uses} test(s)")
+    shared.close()
 
 @pytest.fixture
-def take_screenshot(request, page: Page):
-    """Fixture for taking MANUAL, step-by-step screenshots during a test."""
+def guest_homepage(request, base_url):
+    """
+    The guest homepage, loaded. Read-only tests of a module share one loaded page. A test
+    that routes requests, goes offline, installs a virtual clock etc. (see _own_page_reason)
+    gets a fresh page instead, loaded the same way. A shared page the test navigated away
+    from or otherwise changed is loaded again before the next test gets it.
+    """
+    reason = _own_page_reason(request)
+    if reason:
+        print(f"\n[Shared homepage] not shared, the test {reason}")
+        page = request.getfixturevalue("page")
+        if "virtual_clock" in request.fixturenames:
+            request.getfixturevalue("virtual_clock")  # The clock has to be installed before the page loads
+        page.goto(base_url, timeout=HOME_LOAD_TIMEOUT)
+        yield page
+        return
+    shared = request.getfixturevalue("shared_guest_homepage")
+    recording = {}
+
+    def start_recording(ctx):
+        # Before the page (re)loads, so the first test to get it records and traces the load
+        recording["perf"], recording["trace"] = _start_test_recording(request, ctx)
+    page = shared.acquire(prepare_context=start_recording)
+    request.node.page = page
+    with _buffered_video(request, page), shared.watch():
+        yield page
+    _finish_test_recording(request, shared.context, recording["perf"], recording["trace"])
+    reloads = shared.release()
+    if reloads:
+        print(f"\n[Shared homepage] reloaded for the next test: {reloads}")
+
+@pytest.fixture
+def virtual_clock(page, request):
+    """
+    Installs Playwright's controllable clock before the page loads, so "nothing happens
+    within N seconds" checks can fast-forward the app's timers instead of sleeping.
+    """
+    page.clock.install()
+    # An installed clock cannot be removed, so the context must not be reused
+    request.node.context_dirty = True
+    yield page.clock
+
+@pytest.fixture
+def throttle(context, request):
+    """
+    Switches the throttle profiles of the test's context mid-test: throttle("slow_3g", "cpu_4x"),
+    or throttle() to stop throttling. Navigations recorded afterwards carry the new profiles.
+    """
+    def _throttle(*profiles):
+        if request.node.throttling is None:
+            request.node.throttling = Throttling(context)
+            for page in context.pages:
+                request.node.throttling.cover(page)
+        request.node.throttling.set(*profiles)
+        if request.node.perf:
+            request.node.perf.tags["throttle"] = request.node.throttling.tag
+        print(f"\n[Throttle] {request.node.throttling.tag}")
+    yield _throttle
+
+@pytest.fixture
+def take_screenshot(request):
+    """Fixture for taking MANUAL, step-by-step screenshots during a test (of its `page` or `guest_homepage`)."""
     screenshot_counter = 0
     test_func_name = request.node.name
     test_module_name = Path(request.node.fspath).stem
-    marker = next(request.node.iter_markers(), None)
-    marker_name = marker.name if marker else "unmarked"
+    marker_name = _marker_name(request.node)
     status = "passed"
-    base_path = Path(f"results/screenshots/{marker_name}/{test_module_name}/{status}/")
-    base_path.mkdir(parents=True, exist_ok=True)
+    base_path = SCREENSHOTS_DIR / marker_name / test_module_name / status
+    writer = request.config.screenshot_writer
     def _take_screenshot(step_description: str):
         nonlocal screenshot_counter
         screenshot_counter += 1
-        file_name = f"{test_func_name}_{screenshot_counter:02d}_{step_description}.png"
-        # --- PERUBAHAN DI SINI ---
-        page.screenshot(path=base_path / file_name, full_page=True)
+        file_name = f"{test_func_name}_{screenshot_counter:02d}_{step_description}"
+        # Written in the background; a frame unchanged since the previous step of this attempt is not written again
+        page = getattr(request.node, "page", None) or request.getfixturevalue("page")
+        series = (request.node.nodeid, getattr(request.node, "execution_count", 1))
+        writer.capture(page, base_path / file_name, series=series)
     yield _take_screenshot
 
+def _check_perf_budgets(item, rep):
+    """
+    Evaluates the navigations of a functionally passing test against its budgets. Exceeded
+    budgets fail the teardown report, so they show up as errors apart from test failures.
+    They are never rerun: a rerun that happens to load fast would hide the regression.
+    """
+    mode = item.config.getoption("--perf-budget-mode")
+    perf = getattr(item, "perf", None)
+    rep_call = getattr(item, "rep_call", None)
+    if mode == "off" or not perf or not perf.records or not rep_call or not rep_call.passed or not rep.passed:
+        return
+    marker = item.get_closest_marker("perf_budget")
+    overrides = marker.kwargs if marker else None
+    # The central budgets are for unthrottled loads; throttled navigations only have the marker's
+    unthrottled = [record for record in perf.records if record.get("throttle", "none") == "none"]
+    throttled = [record for record in perf.records if record.get("throttle", "none") != "none"]
+    violations = (budget_violations(unthrottled, item.config.perf_budgets, overrides)
+                  + budget_violations(throttled, {}, overrides))
+    if not violations:
+        return
+    rep.perf_budget_violations = violations
+    if mode == "fail":
+        rep.outcome = "failed"
+        rep.longrepr = "Performance budget exceeded:\n  " + "\n  ".join(violations)
+        # pytest-rerunfailures judged this report (still passing then) in its own makereport
+        # wrapper, which runs inside this one; mark the failure as terminal so it is not rerun
+        terminal_errors = getattr(item, "_terminal_errors", None)
+        if terminal_errors is not None:
+            terminal_errors[rep.when] = True
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Async tests run in an event loop of their own, which the sync Playwright loop must make room for."""
+    if not pyfuncitem.get_closest_marker("asyncio"):
+        yield
+        return
+    with released_sync_loop():
+        yield
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
     """Hook to capture test results and take screenshots on failure or success."""
     outcome = yield
     rep = outcome.get_result()
     
-    if rep.when == "call":
-        item.rep_call = rep
+    if rep.when in ("setup", "call"):
+        setattr(item, f"rep_{rep.when}", rep)
+    if rep.when == "teardown":
+        _check_perf_budgets(item, rep)
+
+    history = item.config.history
+    if history and item.config.getoption("--history") == "on":
+        phases = item.__dict__.setdefault("history_phases", [])
+        # Budget violations are kept apart from failures, so they never count as flakes
+        outcome = "budget" if getattr(rep, "perf_budget_violations", None) and rep.failed else rep.outcome
+        phases.append((rep.when, outcome, rep.duration))
+        if rep.when == "teardown":
+            history.record(item.nodeid, getattr(item, "execution_count", 1), phases)
+            phases.clear()
 
     is_flow_test = item.get_closest_marker("smoke") or item.get_closest_marker("regression")
     if rep.when == "call" and is_flow_test:
@@ -123,23 +840,53 @@ def pytest_runtest_makereport(item, call):
             status = "passed" if rep.passed else "failed"
             test_func_name = item.name
             test_module_name = Path(item.fspath).stem
-            marker = next(item.iter_markers(), None)
-            marker_name = marker.name if marker else "unmarked"
+            marker_name = _marker_name(item)
             
             ss_dir = SCREENSHOTS_DIR / marker_name / test_module_name / status
-            ss_dir.mkdir(parents=True, exist_ok=True)
-            
-            ss_file = ss_dir / f"{test_func_name}_{status}.png"
             
             try:
-                # --- PERUBAHAN DI SINI ---
-                page.screenshot(path=str(ss_file), full_page=True)
+                # Never deduplicated: the final state belongs in the status folder even when it
+                # looks like the test's last step screenshot
+                ss_file = item.config.screenshot_writer.capture(page, ss_dir / f"{test_func_name}_{status}")
                 print(f"\n[Screenshot saved] {ss_file}")
             except Exception as e:
                 print(f"\n[Screenshot failed] {e}")
 
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Lists exceeded performance budgets in their own section, apart from functional failures,
+    and the tests the flake history gives reruns to or quarantines.
+    """
+    if config.history:
+        rates = config.history.flake_rates()
+        flaky = sorted((stats.rate, nodeid, stats) for nodeid, stats in rates.items()
+                       if stats.flaky and stats.rate >= config.getoption("--flake-threshold"))
+        if flaky:
+            terminalreporter.section("flaky tests (from history)")
+            for rate, nodeid, stats in reversed(flaky):
+                quarantined = stats.runs >= QUARANTINE_MIN_RUNS and rate >= config.getoption("--quarantine-threshold")
+                terminalreporter.line(f"{nodeid}: flaky in {stats.flaky}/{stats.runs} runs ({rate:.0%})"
+                                      f"{' - quarantined' if quarantined else ''}")
+
+    violations = [(rep.nodeid, violation)
+                  for reports in terminalreporter.stats.values() for rep in reports
+                  for violation in getattr(rep, "perf_budget_violations", None) or []]
+    if violations:
+        terminalreporter.section("performance budgets exceeded")
+        for nodeid, violation in violations:
+            terminalreporter.line(f"{nodeid}: {violation}")
+
 @pytest.hookimpl(trylast=True)
 def pytest_sessionfinish(session):
-    """Clean up temporary video directory after the test session finishes."""
+    """Wait for queued videos and screenshots, then clean up the temporary video directory."""
+    session.config.screenshot_writer.close()
+    session.config.video_pipeline.wait()
+    if session.config.asset_cache:
+        print(f"\n[Asset cache] {session.config.asset_cache.summary()}")
     if TEMP_VIDEO_DIR.exists():
-        shutil.rmtree(TEMP_VIDEO_DIR)
\ No newline at end of file
+        shutil.rmtree(TEMP_VIDEO_DIR)
+
+def pytest_unconfigure(config):
+    """Closes the history database once the terminal summary has been written."""
+    if getattr(config, "history", None):
+        config.history.close()
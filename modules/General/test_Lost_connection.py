@@ -1,5 +1,4 @@
 import pytest
-import re
 from playwright.sync_api import Page, expect
 
 # =====================================================================
@@ -33,9 +32,6 @@ def test_lost_connection_page_appears(page: Page, base_url):
     finally:
         page.context.set_offline(False)
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 # @pytest.mark.regression
 # def test_auto_recovers_to_login_page_for_guest(page: Page, base_url):
 #     """
@@ -102,9 +98,6 @@ def test_browser_back_button_on_lost_connection_page_for_guest(page: Page, base_
     finally:
         page.context.set_offline(False)
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.unit
 def test_lost_connection_page_ui_elements(page: Page, base_url, take_screenshot):
     """
@@ -1,15 +1,16 @@
 import pytest
 from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
 
 LONG_TIMEOUT = 60000      # Wait time extended to 60 seconds
 MEDIUM_TIMEOUT = 13000
 
 @pytest.mark.smoke
-def test_banner_link_loads_new_page_successfully(page: Page, base_url):
+def test_banner_link_loads_new_page_successfully(guest_homepage: Page, base_url):
     """
     Verifies that the banner link opens and loads a new page successfully.
     """
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    page = guest_homepage
     
     banner_link = page.get_by_role("link", name="banner")
     expect(banner_link).to_be_visible(timeout=MEDIUM_TIMEOUT)
@@ -24,17 +25,14 @@ def test_banner_link_loads_new_page_successfully(page: Page, base_url):
     # (Optional) After successful verification, close the new page
     new_page.close()
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.smoke
-def test_verifies_staying_on_homepage_after_load(page: Page, base_url):
+def test_verifies_staying_on_homepage_after_load(guest_homepage: Page, base_url):
     """
     Verifies that after the page loads, there is no automatic redirect
     by checking for the banner element and the current URL.
     """
-    # 1. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     
     # 2. Find the banner element to detect that we are still on the correct page
     #    (this element will not be clicked)
@@ -48,22 +46,18 @@ def test_verifies_staying_on_homepage_after_load(page: Page, base_url):
     #    is still the same as the base_url.
     expect(page).to_have_url(base_url)
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 
 @pytest.mark.regression
-def test_banner_is_visible_when_ads_are_blocked(page: Page, base_url):
+@pytest.mark.block("ads")
+def test_banner_is_visible_when_ads_are_blocked(guest_homepage: Page, base_url):
     """
     Verifies that the "banner button" remains visible on the page
     even when the ad blocker feature (simulation) is active.
     """
-    # 1. Activate the ad blocker simulation by blocking ad domains
-    page.route("**/*doubleclick.net*", lambda route: route.abort())
-    page.route("**/*googlesyndication.com*", lambda route: route.abort())
-    
-    # 2. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The ad blocker simulation (known ad networks) is applied by the `block` marker
+
+    # 2. The homepage is already loaded
+    page = guest_homepage
     
     # 3. (Additional Verification) Ensure the ad element is truly blocked/hidden.
     #    Replace '.ad-container' with the ad selector on your web.
@@ -77,35 +71,29 @@ def test_banner_is_visible_when_ads_are_blocked(page: Page, base_url):
     # This assertion ensures that the banner does not disappear when ads are blocked.
     expect(banner_locator).to_be_visible(timeout=MEDIUM_TIMEOUT)
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 
 @pytest.mark.regression
-def test_malicious_redirect_is_prevented(page: Page, base_url):
+def test_malicious_redirect_is_prevented(guest_homepage: Page, base_url, virtual_clock):
     """
     Verifies the page does not automatically redirect without interaction.
     (Negative False Scenario)
     """
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    page = guest_homepage
     
-    # Wait a few seconds to see if any script tries to redirect
-    page.wait_for_timeout(3000)
+    # Fast-forward a few seconds of app time to see if any script tries to redirect
+    assert_no_activity(page, window_ms=3000)
     
     # Verify that the page is still at the same URL and has not been redirected
     expect(page).to_have_url(base_url)
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 
 @pytest.mark.unit
-def test_homepage_key_elements_are_visible(page: Page, base_url, take_screenshot):
+def test_homepage_key_elements_are_visible(guest_homepage: Page, base_url, take_screenshot):
     """
     Verifies that all key interactive elements on the main page are visible.
     """
     # --- THIS TEST IS UNCHANGED AS PER YOUR REQUEST ---
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    page = guest_homepage
     
     # Verify main elements are visible before interaction
     print("Verifying visibility of key elements...")
@@ -1,7 +1,10 @@
 import pytest
-import os
-import re
-from playwright.sync_api import Page, expect, BrowserContext
+from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
+from modules.pages import HomePage, EditProfilePage, PostDetailPage
+
+# Every test here starts from the cached login session (see the `auth_state` fixture)
+pytestmark = pytest.mark.authenticated
 
 # =====================================================================
 # Constants for Timeout
@@ -11,110 +14,65 @@ LONG_TIMEOUT = 30000      # For long processes like initial page loads
 MEDIUM_TIMEOUT = 13000    # For standard element verification
 SHORT_TIMEOUT = 3000      # For quick verifications
 
-# =====================================================================
-# Helper function for login
-# =====================================================================
-def login_user(page: Page, base_url: str, username: str, password: str):
-    """Centralized function to navigate and perform login."""
-    print("Navigating to login page...")
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    
-    login_link = page.get_by_role("link", name="Log In")
-    expect(login_link).to_be_visible(timeout=MEDIUM_TIMEOUT)
-    login_link.click()
-    
-    page.get_by_placeholder("Enter your email or username").fill(username)
-    page.get_by_placeholder("Enter your password").fill(password)
-    page.get_by_role("button", name="Log In").click(timeout=LONG_TIMEOUT)
-    
-    # Verify login was successful
-    dashboard_heading = page.get_by_role("heading", name="Recommendation for You")
-    expect(dashboard_heading).to_be_visible(timeout=LONG_TIMEOUT)
-    print("Login successful.")
-
 # =====================================================================
 # Final Test Suite
 # =====================================================================
 
 @pytest.mark.smoke
-def test_success_and_error_alerts_flow(page: Page, base_url, username, password):
+@pytest.mark.resource_lock("account")
+def test_success_and_error_alerts_flow(page: Page, base_url, feed_post):
     """
     Verifies the success alert flow (block post) and the error alert flow (invalid profile edit)
     in a single smoke test.
     """
-    # 1. Login to the application
-    login_user(page, base_url, username, password)
-    
     # --- PART 1: VERIFY SUCCESS ALERT ---
     print("\n--- Testing Success Alert: Blocking a Post ---")
     
-    # 2. Click the first post on the main page
-    print("Opening the first post...")
-    page.locator('.d-block.w-100').first.click()
+    # 1-2. Open the post seeded by `feed_post` (the first post of the feed when replaying a HAR
+    #      or when the backend cannot seed it); the blocked post is unblocked again through the API
+    post_page = PostDetailPage(page, base_url, post_id=feed_post and feed_post["id"]).open()
     
     # 3. Open the options menu and block the post
-    print("Blocking the post...")
-    page.locator('.flex-align-center > app-detail-menu > .header-more > #dropdownBasic1').click()
-    page.get_by_role('link', name='Block Post').click()
-    page.get_by_role('button', name='Confirm').click()
+    post_page.block()
     
     # 4. Verify the success alert appears
     print("Verifying success alert...")
-    success_alert = page.get_by_text('Success Block Post')
-    expect(success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    expect(post_page.block_success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
     print("Success alert for blocking post verified.")
 
     # --- PART 2: VERIFY ERROR ALERT ---
     print("\n--- Testing Error Alert: Invalid Profile Edit ---")
 
-    # 5. Navigate to the Edit Profile page
-    print("Navigating to Edit Profile page...")
-    page.get_by_role('button', name='header menu').click()
-    page.get_by_text('Profile').click()
-    page.get_by_role('button', name='Edit Profile').click()
+    # 5. Open the Edit Profile page
+    edit_page = EditProfilePage(page, base_url).open()
     
     # 6. Enter an overly long (invalid) name
     print("Entering an invalid full name...")
     invalid_name = "Arnov Abdillah Rahman Paasdjahjskdakjsdbalsbd njang Banget Nama Nya"
-    full_name_input = page.get_by_role('textbox', name='Enter full name')
-    full_name_input.fill(invalid_name)
+    edit_page.fill(full_name=invalid_name)
     
     # 7. Try to save the profile
-    page.get_by_role('button', name='Save Profile').click()
+    edit_page.save()
     
     # 8. Verify the error alert appears
     print("Verifying error alert...")
-    error_alert = page.get_by_text('Not valid fullname, fullname')
-    expect(error_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    expect(edit_page.fullname_error_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
     print("Error alert for invalid full name verified.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
-def test_cancel_block_post_action(page: Page, base_url, username, password):
+def test_cancel_block_post_action(page: Page, base_url):
     """
     Verifies that the user can cancel the "Block Post" action
     from the confirmation dialog.
     """
-    # 1. Login to the application
-    login_user(page, base_url, username, password)
+    # 1-2. Open the dashboard with the cached login session and click the first post
+    post_page = PostDetailPage(page, base_url).open(via_ui=True)
     
-    # 2. Click the first post to open it
-    print("Opening the first post...")
-    page.locator('.d-block.w-100').first.click()
-    
-    # 3. Open the options menu
-    print("Opening post options menu...")
-    menu_button = page.get_by_role("button", name="button menu")
-    menu_button.click()
-    
-    # 4. Click the "Block Post" link
-    print("Clicking 'Block Post'...")
-    page.get_by_role('link', name='Block Post').click()
+    # 3-4. Open the options menu and click the "Block Post" link
+    post_page.start_block()
     
     # 5. Verify the confirmation dialog appears (by finding the "Cancel" button)
-    cancel_button = page.get_by_role('button', name='Cancel')
+    cancel_button = post_page.cancel_button
     expect(cancel_button).to_be_visible(timeout=MEDIUM_TIMEOUT)
     
     # 6. Click the "Cancel" button to abort the action
@@ -126,47 +84,39 @@ def test_cancel_block_post_action(page: Page, base_url, username, password):
     print("Verifying the action was cancelled...")
     expect(cancel_button).to_be_hidden(timeout=MEDIUM_TIMEOUT)
     print("Block post action was successfully cancelled.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 
 @pytest.mark.regression
-def test_alert_does_not_appear_spontaneously(page: Page, base_url,username , password):
+def test_alert_does_not_appear_spontaneously(page: Page, base_url):
     """
     Verifies that an alert does not appear without a user trigger.
     """
-    login_user(page, base_url, username, password)
+    HomePage(page, base_url).open()
     
     generic_alert = page.locator('[role="alert"]')
     expect(generic_alert).to_be_hidden()
     print("Test passed. No spontaneous alert was found.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
-def test_no_action_on_confirmation_dialog(page: Page, base_url, username, password):
+def test_no_action_on_confirmation_dialog(page: Page, base_url, virtual_clock):
     """
     Verifies that the system waits and no alert appears
     if the user does nothing on the "Block Post" confirmation dialog.
     """
     # 1. Login and navigate to trigger an action
-    login_user(page, base_url, username, password)
-    page.locator('.d-block.w-100').first.click() # Click post
+    post_page = PostDetailPage(page, base_url).open(via_ui=True) # Click post
     
     # 2. Open the menu and click "Block Post" to show the confirmation dialog
-    page.locator('.flex-align-center > app-detail-menu > .header-more > #dropdownBasic1').click()
-    page.get_by_role('link', name='Block Post').click()
+    post_page.start_block()
     
     # 3. Ensure the confirmation dialog (conditional page) has appeared
     print("Confirmation dialog is visible...")
-    confirm_button = page.get_by_role('button', name='Confirm')
+    confirm_button = post_page.confirm_button
     expect(confirm_button).to_be_visible(timeout=MEDIUM_TIMEOUT)
     
-    # 4. User DOES NOTHING. We simulate this by waiting.
+    # 4. User DOES NOTHING. We simulate this by fast-forwarding the app's clock.
     print("User does nothing for 3 seconds...")
-    page.wait_for_timeout(3000)
+    assert_no_activity(page, window_ms=3000)
     
     # 5. Verify that the page state has not changed
     #    - The confirmation dialog should still be visible.
@@ -177,17 +127,15 @@ def test_no_action_on_confirmation_dialog(page: Page, base_url, username, passwo
     expect(confirm_button).to_be_visible()
     
     # Assertion 2: Ensure the success alert did not appear
-    success_alert = page.get_by_text('Success Block Post')
-    expect(success_alert).to_be_hidden()
+    expect(post_page.block_success_alert).to_be_hidden()
     
     print("Test passed. System correctly waited for user input.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 
 @pytest.mark.unit
-def test_login_ui_and_alerts_flow(page: Page, base_url, username, password, take_screenshot):
+@pytest.mark.resource_lock("account")
+@pytest.mark.usefixtures("feed_post")
+def test_login_ui_and_alerts_flow(page: Page, base_url, take_screenshot):
     """
     Complete smoke test:
     1. Login.
@@ -197,45 +145,36 @@ def test_login_ui_and_alerts_flow(page: Page, base_url, username, password, take
     """
     # --- THIS TEST IS UNCHANGED AS PER YOUR REQUEST ---
     # 1. LOGIN
-    login_user(page, base_url, username, password)
+    home = HomePage(page, base_url).open()
     
     # 2. CHECK UI COMPONENTS AFTER LOGIN
     print("\n--- Verifying Dashboard UI Components ---")
     expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible()
-    expect(page.get_by_role("button", name="header menu")).to_be_visible()
+    expect(home.header_menu).to_be_visible()
     expect(page.get_by_role("link", name="banner")).to_be_visible()
     print("Dashboard UI components are visible.")
     take_screenshot("login_success")
 
     # 3. VERIFY SUCCESS ALERT (BLOCK POST)
     print("\n--- Testing Success Alert: Blocking a Post ---")
-    page.locator('.d-block.w-100').first.click()
-    print("Opening the first post...")
-    
-    page.locator('.flex-align-center > app-detail-menu > .header-more > #dropdownBasic1').click()
-    page.get_by_role('link', name='Block Post').click()
-    page.get_by_role('button', name='Confirm').click()
+    post_page = home.open_first_post().wait_until_ready()
+    post_page.block()
     print("Post blocked.")
     
-    success_alert = page.get_by_text('Success Block Post')
-    expect(success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    expect(post_page.block_success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
     print("Success alert verified.")
     take_screenshot("Session_success_alert")
 
     # 4. VERIFY ERROR ALERT (EDIT PROFILE)
     print("\n--- Testing Error Alert: Invalid Profile Edit ---")
-    page.get_by_role('button', name='header menu').click()
-    page.get_by_text('Profile').click()
-    page.get_by_role('button', name='Edit Profile').click()
+    edit_page = EditProfilePage(page, base_url).open()
     print("Navigated to Edit Profile page.")
     
     invalid_name = "This Name Is Clearly Too Long To Be Saved in the Database and Should Be Rejected By The Validation System"
-    page.get_by_role('textbox', name='Enter full name').fill(invalid_name)
-    page.get_by_role('button', name='Save Profile').click()
+    edit_page.fill(full_name=invalid_name).save()
     print("Attempting to save with invalid name...")
     
-    error_alert = page.get_by_text('Not valid fullname, fullname')
-    expect(error_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    expect(edit_page.fullname_error_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
     print("Error alert verified.")
     take_screenshot("Session_error_alert")
     
@@ -1,6 +1,7 @@
 import pytest
 import re
 from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
 
 # =====================================================================
 # Constants for Timeout
@@ -13,12 +14,12 @@ MEDIUM_TIMEOUT = 13000    # Timeout for standard element verification
 # =====================================================================
 
 @pytest.mark.smoke
-def test_app_store_links_with_original_locators(page: Page, base_url):
+def test_app_store_links_with_original_locators(guest_homepage: Page, base_url):
     """
     Verifies the app store links using the original locators from the script.
     """
-    # 1. Navigate to the homepage
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
 
     # --- VERIFY FIRST LINK (GOOGLE PLAY) ---
     print("Verifying the first link (Google Play)...")
@@ -57,18 +58,15 @@ def test_app_store_links_with_original_locators(page: Page, base_url):
     app_store_page.close()
     print("Second link verified successfully.")
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
-def test_no_click_on_find_us_on_does_not_redirect(page: Page, base_url):
+def test_no_click_on_find_us_on_does_not_redirect(guest_homepage: Page, base_url):
     """
     Verifies that the user is not redirected to the app store if they
     only view the page and do not click the link in the "Find Us On" section.
     (Positive False Scenario)
     """
-    # 1. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     
     # 2. Verify that the left navigation panel is visible (as requested)
     print("Verifying that the left navigation panel is visible...")
@@ -78,12 +76,9 @@ def test_no_click_on_find_us_on_does_not_redirect(page: Page, base_url):
     # 5. Verify that the page URL remains the same
     expect(page).to_have_url(base_url)
     print("Test passed. No redirect was triggered.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
-def test_feature_load_failure_does_not_auto_redirect(page: Page, base_url):
+def test_feature_load_failure_does_not_auto_redirect(page: Page, base_url, virtual_clock):
     """
     Verifies that if the "Find Us On" feature fails to load, the system
     does NOT perform an automatic redirect (testing for a bug).
@@ -98,26 +93,23 @@ def test_feature_load_failure_does_not_auto_redirect(page: Page, base_url):
     # 2. Open the main page
     page.goto(base_url, timeout=LONG_TIMEOUT)
     
-    # 3. Wait a moment to allow for any automatic redirect
-    page.wait_for_timeout(3000)
+    # 3. Fast-forward a moment of app time to allow for any automatic redirect
+    assert_no_activity(page, window_ms=3000)
 
     # 4. Main verification: Ensure the page URL does NOT change.
     #    This test will pass if there is NO redirect.
     expect(page).to_have_url(base_url)
     print("Test passed. The system correctly did not redirect on feature load failure.")
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.unit
-def test_homepage_elements_are_visible(page: Page, base_url, take_screenshot):
+def test_homepage_elements_are_visible(guest_homepage: Page, base_url, take_screenshot):
     """
     Verifies that key elements on the homepage are visible, including those
     that require scrolling. This test uses specific locators as requested.
     """
     # --- THIS TEST IS UNCHANGED AS PER YOUR REQUEST ---
-    # 1. Navigate to the homepage
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
 
     # 2. Verify elements visible on initial load (Above the Fold)
     print("Verifying elements visible on initial load...")
@@ -1,6 +1,7 @@
 import pytest
 import re
 from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
 
 # =====================================================================
 # Constants for Timeout
@@ -13,13 +14,13 @@ MEDIUM_TIMEOUT = 15000    # Timeout for element verification
 # =====================================================================
 
 @pytest.mark.smoke
-def test_privacy_policy_link_opens_correctly(page: Page, base_url):
+def test_privacy_policy_link_opens_correctly(guest_homepage: Page, base_url):
     """
     Verifies that the 'Privacy Policy' link is found after scrolling
     and opens the correct page in a new tab.
     """
-    # 1. Navigate to the homepage
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
 
     # 2. Verify that the left navigation panel is visible first.
     print("Verifying that the left navigation panel is visible...")
@@ -49,39 +50,34 @@ def test_privacy_policy_link_opens_correctly(page: Page, base_url):
     print("Privacy Policy page verified successfully.")
     privacy_page.close()
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
-def test_no_click_on_pp_link_takes_no_action(page: Page, base_url):
+def test_no_click_on_pp_link_takes_no_action(guest_homepage: Page, base_url, virtual_clock):
     """
     Verifies that the system takes no action if the user does not click
     the 'Privacy Policy' link.
     """
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    page = guest_homepage
     
     privacy_link = page.get_by_role("link", name="Privacy Policy")
     privacy_link.scroll_into_view_if_needed(timeout=MEDIUM_TIMEOUT)
     expect(privacy_link).to_be_visible()
     
-    page.wait_for_timeout(3000)
+    assert_no_activity(page, window_ms=3000)
     
     expect(page).to_have_url(base_url)
     print("Test passed. No action was taken as expected.")
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
-def test_broken_pp_link_is_handled_gracefully(page: Page, base_url):
+@pytest.mark.block("third_party", "media", "fonts")
+def test_broken_pp_link_is_handled_gracefully(guest_homepage: Page, base_url):
     """
     Verifies that the system handles a broken 'Privacy Policy' link gracefully.
     """
+    page = guest_homepage
+
     print("Simulating a broken link for the Privacy Policy page...")
     page.route("**/privacy-policy", lambda route: route.abort())
-    
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    
+
     privacy_link = page.get_by_role("link", name="Privacy Policy")
     privacy_link.scroll_into_view_if_needed()
     expect(privacy_link).to_be_visible()
@@ -91,17 +87,14 @@ def test_broken_pp_link_is_handled_gracefully(page: Page, base_url):
     expect(page).to_have_url(base_url)
     print("Test passed. Broken link was handled gracefully.")
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.unit
-def test_privacy_policy_page_all_sections_are_visible(page: Page, base_url, take_screenshot):
+def test_privacy_policy_page_all_sections_are_visible(guest_homepage: Page, base_url, take_screenshot):
     """
     Verifies that all key sections on the Privacy Policy page are visible.
     A single manual full-page screenshot is taken at the end for documentation.
     """
-    # 1. Navigate to the homepage and open the Privacy Policy page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     print("Opening the Privacy Policy page...")
     privacy_link = page.get_by_role("link", name="Privacy Policy")
     privacy_link.scroll_into_view_if_needed(timeout=MEDIUM_TIMEOUT)
@@ -0,0 +1,59 @@
+import pytest
+import re
+from playwright.async_api import BrowserContext, Page, expect
+from modules.utils.async_support import run_concurrently
+
+# =====================================================================
+# Constants for Timeout
+# =====================================================================
+LONG_TIMEOUT = 60000      # Timeout for page navigation
+MEDIUM_TIMEOUT = 15000    # Timeout for element verification
+
+# =====================================================================
+# Read-only checks of the guest pages, run concurrently on one context
+# so each page's network wait overlaps with the others
+# =====================================================================
+
+async def _open_footer_link(page: Page, base_url, name):
+    """Open the homepage, then the target of one of its footer links in the same tab."""
+    await page.goto(base_url, timeout=LONG_TIMEOUT)
+    link = page.get_by_role("link", name=name)
+    await expect(link).to_be_attached(timeout=MEDIUM_TIMEOUT)
+    await page.goto(await link.evaluate("link => link.href"), timeout=LONG_TIMEOUT)
+
+
+@pytest.mark.regression
+async def test_guest_pages_load_concurrently(async_context: BrowserContext, base_url):
+    """
+    Verifies the homepage, the "Find Us On" section, the Terms of Service and the
+    Privacy Policy pages, each on a page of its own, all at the same time.
+    """
+    async def homepage(page: Page):
+        await page.goto(base_url, timeout=LONG_TIMEOUT)
+        await expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible(timeout=MEDIUM_TIMEOUT)
+        left_nav_panel = page.locator("div", has_text=re.compile(r'RecentJust for YouNearest')).nth(2)
+        await expect(left_nav_panel).to_be_visible(timeout=MEDIUM_TIMEOUT)
+
+    async def find_us_on(page: Page):
+        await page.goto(base_url, timeout=LONG_TIMEOUT)
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        await expect(page.get_by_role("heading", name="Find Us On")).to_be_visible(timeout=MEDIUM_TIMEOUT)
+        store_links = page.get_by_role("list").filter(has_text=re.compile(r'^$')).get_by_role("link")
+        await expect(store_links.first).to_be_visible(timeout=MEDIUM_TIMEOUT)
+        await expect(store_links.nth(1)).to_be_visible(timeout=MEDIUM_TIMEOUT)
+
+    async def terms_of_service(page: Page):
+        await _open_footer_link(page, base_url, "Terms of Service")
+        await expect(page.get_by_role('heading', name='TERMS OF USE')).to_be_visible(timeout=MEDIUM_TIMEOUT)
+
+    async def privacy_policy(page: Page):
+        await _open_footer_link(page, base_url, "Privacy Policy")
+        await expect(page.get_by_role('heading', name='PRIVACY POLICY')).to_be_visible(timeout=MEDIUM_TIMEOUT)
+
+    await run_concurrently(async_context, {
+        "homepage": homepage,
+        "find_us_on": find_us_on,
+        "terms_of_service": terms_of_service,
+        "privacy_policy": privacy_policy,
+    })
+    print("All guest pages verified.")
@@ -1,6 +1,7 @@
 import pytest
 import re
 from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
 
 # =====================================================================
 # Constants for Timeout
@@ -13,13 +14,13 @@ MEDIUM_TIMEOUT = 15000    # Timeout for element verification
 # =====================================================================
 
 @pytest.mark.smoke
-def test_terms_of_service_link_opens_correctly(page: Page, base_url):
+def test_terms_of_service_link_opens_correctly(guest_homepage: Page, base_url):
     """
     Verifies that the 'Terms of Service' link is found after scrolling
     and opens the correct page in a new tab.
     """
-    # 1. Navigate to the homepage
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
 
     # 2. Verify that the left navigation panel is visible first.
     #    This confirms the main page UI has loaded correctly.
@@ -56,46 +57,40 @@ def test_terms_of_service_link_opens_correctly(page: Page, base_url):
     print("Terms of Service page verified successfully.")
     terms_page.close()
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
-def test_no_click_on_tos_link_takes_no_action(page: Page, base_url):
+def test_no_click_on_tos_link_takes_no_action(guest_homepage: Page, base_url, virtual_clock):
     """
     Verifies that the system takes no action if the user does not click
     the 'Terms of Service' link.
     (Positive False Scenario)
     """
-    # 1. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     
     # 2. Ensure the Terms of Service link exists (but don't click it)
     tos_link = page.get_by_role("link", name="Terms of Service")
     tos_link.scroll_into_view_if_needed(timeout=MEDIUM_TIMEOUT)
     expect(tos_link).to_be_visible()
     
-    # 3. Wait a moment to ensure no automatic action occurs
-    page.wait_for_timeout(3000)
+    # 3. Fast-forward a moment of app time to ensure no automatic action occurs
+    assert_no_activity(page, window_ms=3000)
     
     # 4. Verify that the page URL remains the same (no redirect)
     expect(page).to_have_url(base_url)
     print("Test passed. No action was taken as expected.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
-def test_tos_page_does_not_load_automatically(page: Page, base_url):
+def test_tos_page_does_not_load_automatically(guest_homepage: Page, base_url, virtual_clock):
     """
     Verifies that the Terms of Service page does not load automatically
     without any user interaction.
     (Negative False Scenario - testing for a bug)
     """
-    # 1. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     
-    # 2. Wait a moment
-    page.wait_for_timeout(3000)
+    # 2. Fast-forward a moment of app time
+    assert_no_activity(page, window_ms=3000)
     
     # 3. Verify that content from the ToS page (e.g., the heading) is NOT visible
     tos_heading = page.get_by_role('heading', name='TERMS OF USE')
@@ -104,24 +99,22 @@ def test_tos_page_does_not_load_automatically(page: Page, base_url):
     expect(tos_heading).to_be_hidden()
     print("Test passed. ToS page did not load spontaneously.")
 
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
-def test_broken_tos_link_is_handled_gracefully(page: Page, base_url):
+@pytest.mark.block("third_party", "media", "fonts")
+def test_broken_tos_link_is_handled_gracefully(guest_homepage: Page, base_url):
     """
     Verifies that the system handles a broken 'Terms of Service' link
     gracefully without crashing.
     (Negative True Scenario)
     """
-    # 1. Simulate that the ToS link is broken by intercepting the navigation
+    # 1. The homepage is already loaded
+    page = guest_homepage
+
+    # 2. Simulate that the ToS link is broken by intercepting the navigation
     #    Replace '**/terms-of-service' with the actual ToS page URL.
     print("Simulating a broken link for the Terms of Service page...")
     page.route("**/terms-of-service", lambda route: route.abort())
-    
-    # 2. Open the main page
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    
+
     # 3. Find and click the Terms of Service link
     tos_link = page.get_by_role("link", name="Terms of Service")
     tos_link.scroll_into_view_if_needed()
@@ -134,19 +127,16 @@ def test_broken_tos_link_is_handled_gracefully(page: Page, base_url):
     print("Verifying the user remains on the current page...")
     expect(page).to_have_url(base_url)
     print("Test passed. Broken link was handled gracefully.")
-    
-    # Add a 5-second pause to ensure the final state is recorded
-    page.wait_for_timeout(5000)
 
 @pytest.mark.unit
-def test_terms_of_service_page_ui_elements_with_scroll(page: Page, base_url, take_screenshot):
+def test_terms_of_service_page_ui_elements_with_scroll(guest_homepage: Page, base_url, take_screenshot):
     """
     Verifies key UI elements on the Terms of Service page by scrolling
     to each element and checking its visibility. A single manual full-page screenshot
     is taken at the end.
     """
-    # 1. Navigate to the homepage and click the Terms of Service link
-    page.goto(base_url, timeout=LONG_TIMEOUT)
+    # 1. The homepage is already loaded
+    page = guest_homepage
     print("Opening the Terms of Service page...")
     tos_link = page.get_by_role("link", name="Terms of Service")
     tos_link.scroll_into_view_if_needed(timeout=MEDIUM_TIMEOUT)
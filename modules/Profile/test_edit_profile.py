@@ -1,7 +1,9 @@
 import pytest
-import re
-import time
 from playwright.sync_api import Page, expect
+from modules.pages import EditProfilePage, ProfilePage
+
+# Every test here starts from the cached login session (see the `auth_state` fixture)
+pytestmark = pytest.mark.authenticated
 
 # =====================================================================
 # Constants for Timeout
@@ -9,96 +11,54 @@ from playwright.sync_api import Page, expect
 LONG_TIMEOUT = 60000      # Timeout for page navigation and critical actions
 MEDIUM_TIMEOUT = 15000    # Timeout for standard element verification
 
-# =====================================================================
-# Helper function for login
-# =====================================================================
-def login_user(page: Page, base_url: str, username: str, password: str):
-    """Centralized function to navigate and perform login."""
-    print("Navigating to login page...")
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    page.get_by_role("link", name="Log In").click()
-    
-    print(f"Logging in with username: {username}...")
-    page.get_by_role("textbox", name="Enter your email or username").fill(username)
-    page.get_by_role("textbox", name="Enter your password").fill(password)
-    page.get_by_role("button", name="Log In").click()
-    
-    # Verify login was successful
-    expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible(timeout=LONG_TIMEOUT)
-    print("Login successful.")
-
 # =====================================================================
 # Smoke Test for Edit Profile Feature
 # =====================================================================
 
 @pytest.mark.smoke
-def test_edit_profile_successfully(page: Page, base_url, username, password):
+@pytest.mark.resource_lock("account")
+@pytest.mark.usefixtures("profile_snapshot")  # The original name and description are restored through the API
+def test_edit_profile_successfully(page: Page, base_url):
     """
     Smoke test to verify that a user can successfully edit their profile
     information and the changes are saved.
     """
-    # 1. Log in to the application
-    login_user(page, base_url, username, password)
-    
-    # 2. Navigate to the Edit Profile page
-    print("Navigating to the Edit Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    page.get_by_role("button", name="Edit Profile").click()
-    
-    # Wait for the edit page to be ready
-    full_name_input = page.get_by_role('textbox', name='Enter full name')
-    expect(full_name_input).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    # 1-2. Open the Edit Profile page (the cached login session is already in place)
+    edit_page = EditProfilePage(page, base_url).open()
 
     # 3. Define new profile information and fill the form
     #    Using a timestamp to ensure the name is unique for each test run
     new_full_name = f"Arnov Abdillah Rahman"
     new_description = f"Testing."
-    
-    print(f"Updating profile name to: '{new_full_name}'")
-    full_name_input.fill(new_full_name)
-    
-    print(f"Updating description...")
-    page.get_by_role('textbox', name='Enter description about me').fill(new_description)
+    edit_page.fill(full_name=new_full_name, description=new_description)
     
     # 4. Save the profile and verify the success alert
-    print("Saving profile changes...")
-    page.get_by_role("button", name="Save Profile").click()
-    
-    success_alert = page.get_by_text("Success update profile")
-    expect(success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    edit_page.save()
+    expect(edit_page.success_alert).to_be_visible(timeout=MEDIUM_TIMEOUT)
     print("Success alert verified.")
     
-    # 5. Re-navigate to the profile page to ensure changes are persistent
-    print("Re-navigating to profile to verify persistent changes...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile", exact=True).click()
+    # 5. Reload the profile page to ensure changes are persistent
+    print("Re-opening the profile to verify persistent changes...")
+    profile_page = ProfilePage(page, base_url).open()
     
     # 6. Verify that the new full name is displayed on the profile page
-    updated_name_heading = page.get_by_role('heading', name=new_full_name)
-    expect(updated_name_heading).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    expect(profile_page.name_heading(new_full_name)).to_be_visible(timeout=MEDIUM_TIMEOUT)
     
     print("Edit Profile smoke test passed successfully.")
 
 @pytest.mark.regression
-def test_notifies_user_with_error_for_invalid_fullname_format(page: Page, base_url, username, password):
+def test_notifies_user_with_error_for_invalid_fullname_format(page: Page, base_url):
     """
     Verifies the system shows an error alert for a full name with invalid characters.
     """
-    login_user(page, base_url, username, password)
-    print("Navigating to the Edit Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    page.get_by_role("button", name="Edit Profile").click()
-    
-    full_name_input = page.get_by_role('textbox', name='Enter full name')
-    expect(full_name_input).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    edit_page = EditProfilePage(page, base_url).open()
+    full_name_input = edit_page.full_name_input
 
     invalid_full_name = "Arnov123!@#"
     print(f"Entering invalid full name: '{invalid_full_name}'")
     full_name_input.fill(invalid_full_name)
     
-    page.get_by_role("button", name="Save Profile").click()
+    edit_page.save()
     
     print("Verifying that the correct error alert is displayed...")
     # --- MENGGUNAKAN LOCATOR BARU ANDA ---
@@ -107,50 +67,39 @@ def test_notifies_user_with_error_for_invalid_fullname_format(page: Page, base_u
     print("Test passed. Correct error alert was shown for invalid full name.")
 
 @pytest.mark.regression
-def test_prevents_save_for_invalid_fullname(page: Page, base_url, username, password):
+def test_prevents_save_for_invalid_fullname(page: Page, base_url):
     """
     Verifies the system prevents saving and does not show a success alert
     when the full name format is incorrect.
     """
-    login_user(page, base_url, username, password)
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    page.get_by_role("button", name="Edit Profile").click()
-    
-    full_name_input = page.get_by_role('textbox', name='Enter full name')
-    expect(full_name_input).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    edit_page = EditProfilePage(page, base_url).open()
+    full_name_input = edit_page.full_name_input
 
     invalid_full_name = "This Name Is Way Too Long And Should Be Rejectedddddddd"
     full_name_input.fill(invalid_full_name)
     
-    page.get_by_role("button", name="Save Profile").click()
+    edit_page.save()
     
     print("Verifying that the success alert is NOT displayed...")
-    success_alert = page.get_by_text("Success update profile")
-    expect(success_alert).to_be_hidden()
+    expect(edit_page.success_alert).to_be_hidden()
     
     print("Verifying that the user remains on the edit page...")
-    expect(page.get_by_role("button", name="Save Profile")).to_be_visible()
+    expect(edit_page.save_button).to_be_visible()
     
     print("Test passed. Save was correctly prevented for invalid full name.")
 
 @pytest.mark.regression
-def test_displays_error_alert_for_invalid_fullname(page: Page, base_url, username, password):
+def test_displays_error_alert_for_invalid_fullname(page: Page, base_url):
     """
     Verifies the system displays the error alert for an incorrect full name format.
     """
-    login_user(page, base_url, username, password)
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    page.get_by_role("button", name="Edit Profile").click()
-    
-    full_name_input = page.get_by_role('textbox', name='Enter full name')
-    expect(full_name_input).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    edit_page = EditProfilePage(page, base_url).open()
+    full_name_input = edit_page.full_name_input
 
     invalid_full_name = "Another Invalid Name 123"
     full_name_input.fill(invalid_full_name)
     
-    page.get_by_role("button", name="Save Profile").click()
+    edit_page.save()
     
     print("Verifying that the error alert is displayed...")
     # --- MENGGUNAKAN LOCATOR BARU ANDA ---
@@ -159,17 +108,13 @@ def test_displays_error_alert_for_invalid_fullname(page: Page, base_url, usernam
     print("Test passed. Error alert for invalid full name was displayed.")
 
 @pytest.mark.unit
-def test_edit_profile_page_ui_elements(page: Page, base_url, username, password, take_screenshot):
+def test_edit_profile_page_ui_elements(page: Page, base_url, take_screenshot):
     """
     Verifies that all key UI elements on the Edit Profile page are visible
     by scrolling to each one and taking a screenshot.
     """
-    # 1. Log in and navigate to the Edit Profile page
-    login_user(page, base_url, username, password)
-    print("Navigating to the Edit Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    page.get_by_role("button", name="Edit Profile").click()
+    # 1. Open the Edit Profile page
+    EditProfilePage(page, base_url).open()
     
     # Wait for the page to be ready by checking for a key element
     expect(page.locator('.edit-profile__avatar')).to_be_visible(timeout=MEDIUM_TIMEOUT)
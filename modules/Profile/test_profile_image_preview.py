@@ -1,6 +1,9 @@
 import pytest
-import re
 from playwright.sync_api import Page, expect
+from modules.pages import ProfilePage
+
+# Every test here starts from the cached login session (see the `auth_state` fixture)
+pytestmark = pytest.mark.authenticated
 
 # =====================================================================
 # Constants for Timeout
@@ -8,45 +11,21 @@ from playwright.sync_api import Page, expect
 LONG_TIMEOUT = 60000      # Timeout for page navigation and critical actions
 MEDIUM_TIMEOUT = 15000    # Timeout for standard element verification
 
-# =====================================================================
-# Helper function for login
-# =====================================================================
-def login_user(page: Page, base_url: str, username: str, password: str):
-    # return ""
-    """Centralized function to navigate and perform login."""
-    print("Navigating to login page...")
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    page.get_by_role("link", name="Log In").click()
-    
-    print(f"Logging in with username: {username}...")
-    page.get_by_role("textbox", name="Enter your email or username").fill(username)
-    page.get_by_role("textbox", name="Enter your password").fill(password)
-    page.get_by_role("button", name="Log In").click()
-    
-    # Verify login was successful
-    expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible(timeout=LONG_TIMEOUT)
-    print("Login successful.")
-
 # =====================================================================
 # Test for Profile Image Preview Feature
 # =====================================================================
 
 @pytest.mark.smoke
-def test_profile_image_preview_appears_on_click(page: Page, base_url, username, password):
+def test_profile_image_preview_appears_on_click(page: Page, base_url):
     # return ""
     """
     Verifies that clicking the user's profile image on their profile page
     successfully opens the image preview dialog.
     """
-    # 1. Log in to the application
-    login_user(page, base_url, username, password)
-    
-    # 2. Navigate to the Profile page
-    print("Navigating to the Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
+    # 1-2. Open the Profile page (the cached login session is already in place)
+    ProfilePage(page, base_url).open()
     
-    # Wait for the profile page to be ready
+    # Wait for the profile image
     profile_avatar = page.get_by_role('img', name='profile')
     expect(profile_avatar).to_be_visible(timeout=MEDIUM_TIMEOUT)
 
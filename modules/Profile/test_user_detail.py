@@ -1,6 +1,11 @@
 import pytest
 import re
 from playwright.sync_api import Page, expect
+from modules.utils.helpers import assert_no_activity
+from modules.pages import HomePage, ProfilePage
+
+# Every test here starts from the cached login session (see the `auth_state` fixture)
+pytestmark = pytest.mark.authenticated
 
 # =====================================================================
 # Constants for Timeout
@@ -8,48 +13,24 @@ from playwright.sync_api import Page, expect
 LONG_TIMEOUT = 60000      # Timeout for page navigation and critical actions
 MEDIUM_TIMEOUT = 15000    # Timeout for standard element verification
 
-# =====================================================================
-# Helper function for login
-# =====================================================================
-def login_user(page: Page, base_url: str, username: str, password: str):
-    """Centralized function to navigate and perform login."""
-    print("Navigating to login page...")
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    page.get_by_role("link", name="Log In").click()
-    
-    print(f"Logging in with username: {username}...")
-    page.get_by_role("textbox", name="Enter your email or username").fill(username)
-    page.get_by_role("textbox", name="Enter your password").fill(password)
-    page.get_by_role("button", name="Log In").click()
-    
-    # Verify login was successful
-    expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible(timeout=LONG_TIMEOUT)
-    print("Login successful.")
-
 # =====================================================================
 # Test for Profile Page Navigation and UI Elements
 # =====================================================================
 
 @pytest.mark.smoke
-def test_detail_user(page: Page, base_url, username, password):
+def test_detail_user(page: Page, base_url):
     """
     Verifies that a logged-in user can navigate to their profile page
     and that key profile elements are visible.
     """
-    # 1. Log in to the application
-    login_user(page, base_url, username, password)
-    
-    # 2. Navigate to the Profile page
-    print("Navigating to the Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
+    # 1-2. Open the dashboard and navigate to the Profile page through the header menu
+    #      (the navigation is what this test covers, so no deep link here)
+    profile_page = ProfilePage(page, base_url).open(via_ui=True)
     
     # 3. Verify that the user is on the profile page
     #    We can confirm this by looking for a unique element, like the user avatar.
     print("Verifying key elements on the Profile page...")
-    
-    # Use the locator from your script to find the avatar
-    profile_avatar = page.locator('.profile__user-avatar')
+    profile_avatar = profile_page.avatar
     
     # Assert that the avatar is visible
     expect(profile_avatar).to_be_visible(timeout=MEDIUM_TIMEOUT)
@@ -57,39 +38,39 @@ def test_detail_user(page: Page, base_url, username, password):
     print("Detail User successfully.")
 
 @pytest.mark.regression
-def test_opening_avatar_menu_takes_no_action(page: Page, base_url, username, password):
+def test_opening_avatar_menu_takes_no_action(page: Page, base_url, virtual_clock):
     """
     Verifies that opening the avatar menu without clicking 'Profile'
     does not navigate the user away from the current page.
     (Skenario Positive False)
     """
-    login_user(page, base_url, username, password)
+    home = HomePage(page, base_url).open()
     
     # Buka menu avatar/header
     print("Opening the avatar menu...")
-    page.get_by_role("button", name="header menu").click()
+    home.open_header_menu()
     
     # Pastikan menu muncul (dengan memeriksa link 'Profile')
     expect(page.get_by_text("Profile")).to_be_visible()
     
-    # Tunggu sebentar untuk memastikan tidak ada aksi otomatis
-    page.wait_for_timeout(3000)
+    # Majukan jam aplikasi untuk memastikan tidak ada aksi otomatis
+    assert_no_activity(page, window_ms=3000)
     
     # Verifikasi bahwa URL halaman tidak berubah
     expect(page).to_have_url(base_url)
     print("Test passed. No navigation occurred as expected.")
 
 @pytest.mark.regression
-def test_user_detail_page_does_not_load_automatically(page: Page, base_url, username, password):
+def test_user_detail_page_does_not_load_automatically(page: Page, base_url, virtual_clock):
     """
     Verifies that the User Detail page is not displayed automatically
     without the user clicking the profile button.
     (Skenario Negative False - menguji bug)
     """
-    login_user(page, base_url, username, password)
+    HomePage(page, base_url).open()
     
-    # Tunggu sebentar di halaman dashboard
-    page.wait_for_timeout(3000)
+    # Majukan jam aplikasi sebentar di halaman dashboard
+    assert_no_activity(page, window_ms=3000)
     
     # Verifikasi bahwa elemen unik dari halaman profil (misal: tombol 'Edit Profile')
     # TIDAK terlihat di halaman dashboard.
@@ -99,7 +80,7 @@ def test_user_detail_page_does_not_load_automatically(page: Page, base_url, user
     print("Test passed. User Detail page did not load spontaneously.")
 
 @pytest.mark.regression
-def test_profile_link_failure_is_handled_gracefully(page: Page, base_url, username, password):
+def test_profile_link_failure_is_handled_gracefully(page: Page, base_url):
     """
     Verifies that the system handles a failure to load the User Detail page
     without crashing.
@@ -108,26 +89,18 @@ def test_profile_link_failure_is_handled_gracefully(page: Page, base_url, userna
     print("Simulating a broken link for the Profile page...")
     page.route("**/profile*", lambda route: route.abort())
     
-    login_user(page, base_url, username, password)
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
+    HomePage(page, base_url).open().go_to_profile()
 
     print("Test passed. Broken profile link was handled gracefully.")
 
 @pytest.mark.unit
-def test_user_detail_page_ui_elements(page: Page, base_url, username, password, take_screenshot):
+def test_user_detail_page_ui_elements(page: Page, base_url, take_screenshot):
     """
     Verifies that all key UI elements on the User Detail (Profile) page
     are present and visible, taking a screenshot of each.
     """
-    # 1. Log in and navigate to the Profile page
-    login_user(page, base_url, username, password)
-    print("Navigating to the Profile page...")
-    page.get_by_role("button", name="header menu").click()
-    page.get_by_text("Profile").click()
-    
-    # Wait for the page to be ready by checking for a key element
-    expect(page.get_by_role("button", name="Edit Profile")).to_be_visible(timeout=MEDIUM_TIMEOUT)
+    # 1. Open the Profile page (waits for the "Edit Profile" button)
+    ProfilePage(page, base_url).open()
     take_screenshot("profile_page_loaded")
 
     # 2. Create a list of elements to verify on the page
@@ -1,7 +1,7 @@
 import re
 import pytest
 from playwright.sync_api import Page, expect
-from pathlib import Path
+from modules.pages import HomePage, LoginPage
 
 # -------------------------------
 # Helper
@@ -45,58 +45,47 @@ def test_login_success(page: Page, base_url, username, password):
     heading = page.get_by_role("heading", name="Recommendation for You")
     expect(heading).to_be_visible(timeout=10000)
     assert heading.inner_text().strip() == "Recommendation for You"
-    
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
+@pytest.mark.throttle("fast_4g", "cpu_4x")
+def test_login_on_mobile_network(page: Page, base_url, username, password):
+    """
+    Verifies the home feed loads and a login succeeds on a mobile network and CPU
+    (Fast 4G, 4x slowdown). The timings are recorded under results/perf/, tagged with the profiles.
+    """
+    home = HomePage(page, base_url).open()
+    home.go_to_login().wait_until_ready().login(username, password)
+
+@pytest.mark.regression
+@pytest.mark.block("third_party", "media", "fonts")
 def test_login_invalid_credentials_password_or_username(page: Page, base_url, username):
     """Verifies the error message for an incorrect password."""
-    page.goto(base_url, timeout=30000)
-    page.wait_for_load_state("domcontentloaded", timeout=30000)
+    login_page = LoginPage(page, base_url).open()
+    login_page.fill(username, "wrong_password_123").submit()
 
-    page.get_by_role("link", name="Log In").click()
-    fill_input(page, "Enter your email or username", username)
-    fill_input(page, "Enter your password", "wrong_password_123")
-
-    page.get_by_role("button", name="Log In").click()
-
-    error_message = page.locator("text=Email or Password incorrect")
+    error_message = login_page.error_message
     expect(error_message).to_be_visible(timeout=10000)
     assert error_message.inner_text().strip() == "Email or Password incorrect"
 
-    page.wait_for_timeout(5000)
-
 @pytest.mark.regression
+@pytest.mark.block("third_party", "media", "fonts")
 def test_login_button_disabled_when_empty(page: Page, base_url):
     """Verifies the login button is disabled when the form is empty."""
-    page.goto(base_url, timeout=30000)
-    page.wait_for_load_state("domcontentloaded", timeout=30000)
-
-    page.get_by_role("link", name="Log In").click()
-    login_button = page.get_by_role("button", name="Log In")
+    login_button = LoginPage(page, base_url).open().submit_button
     expect(login_button).to_be_disabled(timeout=1000)
     assert not login_button.is_enabled()
-    
-    page.wait_for_timeout(5000)
 
 @pytest.mark.regression
+@pytest.mark.block("third_party", "media", "fonts")
 def test_login_invalid_credentials(page: Page, base_url):
     """Verifies the error message for incorrect username and password."""
-    page.goto(base_url, timeout=30000)
-    page.wait_for_load_state("domcontentloaded", timeout=30000)
-
-    page.get_by_role("link", name="Log In").click()
-    fill_input(page, "Enter your email or username", "adawrong")
-    fill_input(page, "Enter your password", "wrong_password_123")
+    login_page = LoginPage(page, base_url).open()
+    login_page.fill("adawrong", "wrong_password_123").submit()
 
-    page.get_by_role("button", name="Log In").click()
-
-    error_message = page.locator("text=Email or Password incorrect")
+    error_message = login_page.error_message
     expect(error_message).to_be_visible(timeout=10000)
     assert error_message.inner_text().strip() == "Email or Password incorrect"
 
-    page.wait_for_timeout(5000)
-
 @pytest.mark.unit
 def test_login_page_ui_elements(page: Page, base_url, take_screenshot):
     """Unit test for UI elements on the login page."""
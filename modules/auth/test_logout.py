@@ -1,7 +1,7 @@
 import pytest
 import os
-import re  # Added to use regular expressions
 from playwright.sync_api import Page, expect, BrowserContext
+from modules.pages import HomePage
 
 # =====================================================================
 # Constants for Timeout
@@ -11,72 +11,47 @@ LONG_TIMEOUT = 30000      # For long processes like initial page loads
 MEDIUM_TIMEOUT = 15000    # For standard element verification
 SHORT_TIMEOUT = 5000      # For quick verifications
 
-# =====================================================================
-# Helper function for login
-# =====================================================================
-def login_user(page: Page, base_url: str, username: str, password: str):
-    """Centralized function to navigate and perform login."""
-    page.goto(base_url, timeout=LONG_TIMEOUT)
-    
-    login_link = page.get_by_role("link", name="Log In")
-    expect(login_link).to_be_visible(timeout=MEDIUM_TIMEOUT)
-    login_link.click()
-    
-    page.get_by_placeholder("Enter your email or username").fill(username)
-    page.get_by_placeholder("Enter your password").fill(password)
-    page.get_by_role("button", name="Log In").click()
-    
-    dashboard_heading = page.get_by_role("heading", name="Recommendation for You")
-    expect(dashboard_heading).to_be_visible(timeout=LONG_TIMEOUT)
-
 # =====================================================================
 # Test Suite
 # =====================================================================
 
 @pytest.mark.smoke
-def test_logout_success(page: Page, base_url, username, password):
+@pytest.mark.authenticated(fresh=True)  # Logging out must not revoke the cached session
+def test_logout_success(page: Page, base_url):
     """Verifies that the user can log out successfully."""
-    login_user(page, base_url, username, password)
+    home = HomePage(page, base_url).open()
     
-    # --- NEW LOGOUT FLOW ---
-    page.get_by_role("button", name="header menu").click()
-    # Using regex to match "Log Out" and ignore any icons
-    page.get_by_role("link", name=re.compile("Log Out")).click()
-    # Clicking the logout confirmation button
-    page.get_by_role("button", name="Log Out").click()
-    # --- END OF NEW LOGOUT FLOW ---
+    # Header menu -> Log Out -> confirm
+    home.log_out()
 
     # Verify logout was successful
-    expect(page.get_by_role("heading", name="Recommendation for You")).to_be_hidden(timeout=LONG_TIMEOUT)
-    
-    page.wait_for_timeout(5000)
+    expect(home.ready_locator()).to_be_hidden(timeout=LONG_TIMEOUT)
 
 @pytest.mark.regression
-def test_opening_menu_does_not_logout(page: Page, base_url, username, password):
+@pytest.mark.authenticated
+def test_opening_menu_does_not_logout(page: Page, base_url):
     """Verifies that just opening the menu does not log the user out."""
-    login_user(page, base_url, username, password)
-    page.get_by_role("button", name="header menu").click()
+    home = HomePage(page, base_url).open().open_header_menu()
     
     # Verify the menu appears and the user remains logged in
     # Selector updated for better reliability
-    expect(page.get_by_role("link", name=re.compile("Log Out"))).to_be_visible(timeout=LONG_TIMEOUT)
-    expect(page.get_by_role("heading", name="Recommendation for You")).to_be_visible()
-    
-    page.wait_for_timeout(5000)
+    expect(home.logout_link).to_be_visible(timeout=LONG_TIMEOUT)
+    expect(home.ready_locator()).to_be_visible()
 
 
 @pytest.mark.unit
-def test_logout_button_functionality(page: Page, base_url, username, password, take_screenshot):
+@pytest.mark.authenticated(fresh=True)
+def test_logout_button_functionality(page: Page, base_url, take_screenshot):
     """Verifies the functionality of the logout button and takes screenshots."""
-    login_user(page, base_url, username, password)
+    home = HomePage(page, base_url).open()
     take_screenshot("login_successful")
     
     # --- NEW LOGOUT FLOW ---
-    page.get_by_role("button", name="header menu").click()
+    home.open_header_menu()
     take_screenshot("header_menu_visible")
     
     # Click the logout link in the menu
-    logout_link = page.get_by_role("link", name=re.compile("Log Out"))
+    logout_link = home.logout_link
     expect(logout_link).to_be_visible(timeout=LONG_TIMEOUT)
     logout_link.click()
 
@@ -91,15 +66,16 @@ def test_logout_button_functionality(page: Page, base_url, username, password, t
 
 
 @pytest.mark.regression
-def test_session_persists_after_browser_close(browser: BrowserContext, page: Page, base_url, username, password):
+@pytest.mark.authenticated(fresh=True)
+def test_session_persists_after_browser_close(browser: BrowserContext, page: Page, base_url):
     """
     Verifies that a login session persists after closing and reopening the browser,
     using a new context with custom HTTP headers.
     """
     storage_state_path = "state.json"
     
-    # 1. Log in as usual and save the session state
-    login_user(page, base_url, username, password)
+    # 1. Start from a logged-in session (API login) and save the session state
+    HomePage(page, base_url).open()
     page.context.storage_state(path=storage_state_path)
     page.context.close()
     
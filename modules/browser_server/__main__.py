@@ -0,0 +1,41 @@
+"""
+Manage the long-lived Chrome used by `pytest --browser-server`:
+    python -m modules.browser_server start|stop|status [--port 9333] [--headed]
+"""
+import argparse
+import os
+import sys
+from .server import BrowserServer, serve
+
+DEFAULT_PORT = int(os.getenv("BROWSER_SERVER_PORT", "9333"))
+DEFAULT_STATE_DIR = os.getenv("BROWSER_SERVER_DIR", ".browser_server")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Long-lived Chrome reused across pytest runs")
+    parser.add_argument("command", choices=["start", "stop", "status", "serve"],
+                        help="'serve' is the helper process itself, started in the background by 'start'")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="DevTools port, on 127.0.0.1")
+    parser.add_argument("--state-dir", default=DEFAULT_STATE_DIR)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+
+    server = BrowserServer(args.state_dir, args.port, headless=not args.headed)
+    if args.command == "serve":
+        serve(args.port, server.headless, server.state_path)
+    elif args.command == "start":
+        state = server.ensure()
+        print(f"Browser server running at {server.endpoint} (pid {state.get('pid')}, Chrome {state.get('version')})")
+    elif args.command == "stop":
+        server.stop()
+        print("Browser server stopped")
+    elif server.healthy():
+        state = server.state()
+        print(f"Browser server running at {server.endpoint} (pid {state.get('pid')}, Chrome {state.get('version')})")
+    else:
+        print(f"No healthy browser server at {server.endpoint}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.error import URLError
+from urllib.request import urlopen
+from playwright.sync_api import Error as PlaywrightError, Playwright, sync_playwright
+
+# Seconds allowed for the helper to start Chrome and open its DevTools port
+START_TIMEOUT = 30
+# Seconds a health check waits for the DevTools endpoint to answer
+HEALTH_TIMEOUT = 2
+# Seconds after which a lock left behind by a killed process is ignored
+STALE_LOCK_SECONDS = 60
+
+
+def _endpoint_alive(endpoint: str) -> bool:
+    try:
+        with urlopen(f"{endpoint}/json/version", timeout=HEALTH_TIMEOUT) as response:
+            return "webSocketDebuggerUrl" in json.loads(response.read())
+    except (URLError, OSError, ValueError):
+        return False
+
+
+def _process_alive(pid) -> bool:
+    if not pid:
+        return False
+    try:
+        os.kill(pid, 0)
+        return True
+    except OSError:
+        return False
+
+
+def serve(port: int, headless: bool, state_path: Path):
+    """
+    Body of the helper process: keep a Chrome with its DevTools port open on 127.0.0.1:<port>
+    until the process is told to stop (SIGTERM / SIGINT) or Chrome goes away.
+    """
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *args: stop.set())
+    signal.signal(signal.SIGINT, lambda *args: stop.set())
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=headless, channel="chrome",
+                                    args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"])
+        endpoint = f"http://127.0.0.1:{port}"
+        Path(state_path).write_text(json.dumps({
+            "pid": os.getpid(), "port": port, "headless": headless, "endpoint": endpoint,
+            "version": browser.version, "started": time.time(),
+        }))
+        while not stop.wait(5):
+            if not _endpoint_alive(endpoint):
+                break
+        browser.close()
+
+
+class BrowserServer:
+    """
+    A Chrome kept running between pytest invocations by a detached helper process
+    (`python -m modules.browser_server serve`), reached over its DevTools endpoint with
+    `connect_over_cdp`. Each run attaches in a fraction of a second instead of launching
+    Chrome. The helper is started on first use and restarted when the health check fails
+    or it was started with other options. Its state lives in `state_dir`.
+    """
+
+    def __init__(self, state_dir: Path, port: int, headless: bool = True):
+        self.state_dir = Path(state_dir)
+        self.port = port
+        self.headless = headless
+        self.state_path = self.state_dir / "state.json"
+        self.lock_path = self.state_dir / "start.lock"
+        self.log_path = self.state_dir / "server.log"
+
+    @property
+    def endpoint(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def state(self) -> dict:
+        try:
+            return json.loads(self.state_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def healthy(self) -> bool:
+        """The helper is alive, serves on our port with our options, and Chrome answers."""
+        state = self.state()
+        return (_process_alive(state.get("pid")) and state.get("port") == self.port
+                and state.get("headless") == self.headless and _endpoint_alive(self.endpoint))
+
+    def ensure(self) -> dict:
+        """Start (or restart) the helper unless a healthy one is running; returns its state."""
+        if self.healthy():
+            return self.state()
+        with self._start_lock():
+            # Another worker may have started it while we waited for the lock
+            if not self.healthy():
+                self.stop()
+                self._start()
+        return self.state()
+
+    def connect(self, playwright: Playwright, slow_mo: float = 0):
+        """Attach to the running Chrome, restarting the helper once if the connection fails."""
+        self.ensure()
+        try:
+            return playwright.chromium.connect_over_cdp(self.endpoint, slow_mo=slow_mo, timeout=START_TIMEOUT * 1000)
+        except PlaywrightError as e:
+            print(f"\n[Browser server] connection failed, restarting: {e}")
+            with self._start_lock():
+                self.stop()
+                self._start()
+            return playwright.chromium.connect_over_cdp(self.endpoint, slow_mo=slow_mo, timeout=START_TIMEOUT * 1000)
+
+    def stop(self):
+        """Stop the helper (and its Chrome), if one is running."""
+        pid = self.state().get("pid")
+        if _process_alive(pid):
+            os.kill(pid, signal.SIGTERM)
+            deadline = time.time() + 10
+            while _process_alive(pid) and time.time() < deadline:
+                try:
+                    os.waitpid(pid, os.WNOHANG)  # Reaped here when the helper was started by this process
+                except (ChildProcessError, AttributeError, OSError):
+                    pass
+                time.sleep(0.1)
+        self.state_path.unlink(missing_ok=True)
+
+    def _start(self):
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path.unlink(missing_ok=True)
+        command = [sys.executable, "-m", "modules.browser_server", "serve", "--port", str(self.port),
+                   "--state-dir", str(self.state_dir)] + ([] if self.headless else ["--headed"])
+        with open(self.log_path, "ab") as log:
+            # A session of its own, so the helper outlives this pytest run and its Ctrl+C
+            process = subprocess.Popen(command, stdout=log, stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL,
+                                       cwd=Path(__file__).resolve().parents[2], start_new_session=True)
+        deadline = time.time() + START_TIMEOUT
+        while time.time() < deadline:
+            if process.poll() is not None:
+                raise RuntimeError(f"Browser server exited with status {process.returncode}, see {self.log_path}")
+            if self.state().get("pid") == process.pid and _endpoint_alive(self.endpoint):
+                print(f"\n[Browser server] started Chrome {self.state().get('version')} at {self.endpoint}")
+                return
+            time.sleep(0.1)
+        process.terminate()
+        raise RuntimeError(f"Browser server did not start within {START_TIMEOUT}s, see {self.log_path}")
+
+    @contextmanager
+    def _start_lock(self):
+        """Serializes starts between xdist workers and concurrent runs."""
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + START_TIMEOUT * 2
+        while True:
+            try:
+                os.close(os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - self.lock_path.stat().st_mtime > STALE_LOCK_SECONDS:
+                        self.lock_path.unlink(missing_ok=True)  # Left behind by a killed process
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError(f"Timed out waiting for {self.lock_path}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            self.lock_path.unlink(missing_ok=True)
@@ -0,0 +1,3 @@
+from .journeys import JOURNEYS, STEPS, JourneySession
+from .report import LoadReport, percentile
+from .runner import LoadRunner, load_accounts
@@ -0,0 +1,93 @@
+"""
+Replay the suite's user journeys under load:
+    python -m modules.load --stub-server --users 20 --ramp 30 --duration 120
+    python -m modules.load --base-url https://staging.panorra.com/ --accounts accounts.json --users 10
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from modules.stub_server import StubServer, DEFAULT_PASSWORD
+from .journeys import JOURNEYS
+from .runner import LoadRunner, load_accounts
+
+RESULTS_DIR = Path("results") / "load"
+
+
+def _accounts(args):
+    if args.stub_server:
+        # The stand-in is seeded with a pool of its own, one account per user
+        return [(f"load.user{index:03d}", DEFAULT_PASSWORD) for index in range(1, args.users + 1)]
+    if args.accounts:
+        return load_accounts(args.accounts)
+    username, password = os.getenv("TEST_USERNAME"), os.getenv("TEST_PASSWORD")
+    return [(username, password)] if username and password else []
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description="Synthetic load from the suite's user journeys")
+    parser.add_argument("--base-url", default=os.getenv("BASE_URL", "https://dev.panorra.com/"))
+    parser.add_argument("--stub-server", action="store_true",
+                        help="Start a local stand-in server (see modules.stub_server) and load it instead of --base-url")
+    parser.add_argument("--stub-latency-ms", type=int, default=0, help="Delay the stand-in adds to every response")
+    parser.add_argument("--journey", choices=list(JOURNEYS), default="full")
+    parser.add_argument("--users", type=int, default=5, help="Concurrent virtual users (browser contexts)")
+    parser.add_argument("--ramp", type=float, default=10, help="Seconds over which the users are started")
+    parser.add_argument("--duration", type=float, default=60, help="Seconds after which no new journey is started")
+    parser.add_argument("--iterations", type=int, default=None, help="Journeys per user at most")
+    parser.add_argument("--accounts", default=os.getenv("LOAD_ACCOUNTS_FILE"),
+                        help="JSON list of {username, password} objects (default: TEST_USERNAME / TEST_PASSWORD)")
+    parser.add_argument("--step-timeout", type=int, default=30000, help="Milliseconds a step may take before it fails")
+    parser.add_argument("--think-time-ms", type=int, default=0, help="Pause of a user between two steps")
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--output", default=None, help="JSON report path (default: results/load/load_<journey>_<time>.json)")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Exit with status 1 when more than this fraction of the journeys failed")
+    args = parser.parse_args()
+    if args.users < 1 or args.ramp < 0 or args.duration <= 0:
+        parser.error("--users must be at least 1, --ramp at least 0 and --duration positive")
+
+    accounts = _accounts(args)
+    if not accounts:
+        parser.error("No accounts: pass --accounts, set TEST_USERNAME / TEST_PASSWORD, or use --stub-server")
+
+    access_code = os.getenv("ACCESS_CODE")
+    server = None
+    base_url = args.base_url
+    if args.stub_server:
+        server = StubServer(latency_ms=args.stub_latency_ms, accounts=dict(accounts), access_code=access_code)
+        server.start()
+        base_url = server.url
+    print(f"[Load] '{args.journey}' journey against {base_url}: {args.users} user(s), "
+          f"{args.ramp}s ramp, {args.duration}s, {len(accounts)} account(s)")
+
+    runner = LoadRunner(
+        base_url, accounts, journey=args.journey, users=args.users, ramp=args.ramp, duration=args.duration,
+        iterations=args.iterations, step_timeout=args.step_timeout, think_time_ms=args.think_time_ms,
+        headless=not args.headed and os.getenv("HEADLESS", "true").lower() == "true",
+        context_args={
+            "viewport": {'width': 1280, 'height': 720},
+            "extra_http_headers": {"Access-Code": access_code} if access_code else {},
+        },
+    )
+    try:
+        report = runner.run()
+    finally:
+        if server:
+            server.stop()
+
+    report.print_summary()
+    output = args.output or RESULTS_DIR / f"load_{args.journey}_{time.strftime('%Y%m%d-%H%M%S')}.json"
+    print(f"[Load] Report written to {report.write(output)}")
+
+    error_rate = report.summary()["journeys"]["error_rate"]
+    if args.max_error_rate is not None and error_rate > args.max_error_rate:
+        print(f"[Load] Journey error rate {error_rate:.1%} is above --max-error-rate {args.max_error_rate:.1%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+from playwright.async_api import Page, expect
+from modules.pages import EditProfilePage, HomePage, LoginPage, PostDetailPage, ProfilePage
+
+# =====================================================================
+# The suite's user journeys (tests of modules/auth, modules/Profile and
+# the post alerts) as timed steps, driven with the async API so many
+# virtual users can share one browser. The locators and routes come from
+# the page objects the tests use.
+# =====================================================================
+
+LONG_TIMEOUT = 60000      # Timeout for page navigation
+
+
+class JourneySession:
+    """
+    State of one virtual user's journey: its page, the account it logs in with, and how
+    long (ms) a step waits for the screen it leads to.
+    """
+
+    def __init__(self, page: Page, base_url: str, username: str, password: str, timeout: int):
+        self.page = page
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self.home = HomePage(page, base_url)
+
+
+async def home(session: JourneySession):
+    """Open the feed."""
+    await session.page.goto(session.base_url, timeout=LONG_TIMEOUT)
+    await expect(session.home.ready_locator()).to_be_visible(timeout=session.timeout)
+
+
+async def open_login(session: JourneySession):
+    """The header's "Log In" link, as in `login_user`."""
+    await session.home.login_link.click()
+    await expect(LoginPage(session.page, session.base_url).ready_locator()).to_be_visible(timeout=session.timeout)
+
+
+async def login(session: JourneySession):
+    """Submit the login form and wait for the header menu of a logged-in user."""
+    login_page = LoginPage(session.page, session.base_url)
+    await login_page.username_input.fill(session.username)
+    await login_page.password_input.fill(session.password)
+    await login_page.submit_button.click()
+    await expect(session.home.header_menu).to_be_visible(timeout=session.timeout)
+
+
+async def open_first_post(session: JourneySession):
+    await session.home.first_post.click()
+    await expect(PostDetailPage(session.page, session.base_url).ready_locator()).to_be_visible(timeout=session.timeout)
+
+
+async def open_profile(session: JourneySession):
+    """Header menu -> Profile."""
+    await session.home.header_menu.click()
+    await session.home.profile_link.click()
+    await expect(ProfilePage(session.page, session.base_url).ready_locator()).to_be_visible(timeout=session.timeout)
+
+
+async def open_edit_profile(session: JourneySession):
+    await ProfilePage(session.page, session.base_url).edit_profile_button.click()
+    await expect(EditProfilePage(session.page, session.base_url).ready_locator()).to_be_visible(timeout=session.timeout)
+
+
+async def save_profile(session: JourneySession):
+    """Save the profile with its current values, so the account is left as it was."""
+    edit_page = EditProfilePage(session.page, session.base_url)
+    await edit_page.full_name_input.fill(await edit_page.full_name_input.input_value())
+    await edit_page.description_input.fill(await edit_page.description_input.input_value())
+    await edit_page.save_button.click()
+    await expect(edit_page.success_alert).to_be_visible(timeout=session.timeout)
+
+
+# Every step, by the name it is reported under
+STEPS = {
+    "home": home,
+    "open_login": open_login,
+    "login": login,
+    "open_first_post": open_first_post,
+    "back_to_feed": home,
+    "open_profile": open_profile,
+    "open_edit_profile": open_edit_profile,
+    "save_profile": save_profile,
+}
+
+_LOGIN = ["home", "open_login", "login"]
+
+# Journeys a virtual user can repeat; each one starts logged out, in a fresh context
+JOURNEYS = {
+    "login": _LOGIN,
+    "browse": _LOGIN + ["open_first_post"],
+    "profile": _LOGIN + ["open_profile"],
+    "edit_profile": _LOGIN + ["open_profile", "open_edit_profile", "save_profile"],
+    "full": _LOGIN + ["open_first_post", "back_to_feed", "open_profile", "open_edit_profile", "save_profile"],
+}
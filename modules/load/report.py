@@ -0,0 +1,111 @@
+import json
+import time
+from collections import Counter
+from pathlib import Path
+
+# Latency percentiles reported for every step
+PERCENTILES = (50, 90, 95, 99)
+# Distinct error messages kept per step in the JSON report
+MAX_ERROR_SAMPLES = 5
+
+
+def percentile(sorted_values, p: float):
+    """The p-th percentile of already sorted values, interpolated between the closest ranks."""
+    if not sorted_values:
+        return None
+    rank = (len(sorted_values) - 1) * p / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (rank - lower)
+
+
+def _error_text(error: BaseException) -> str:
+    lines = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {lines[0] if lines else ''}"[:200]
+
+
+class LoadReport:
+    """Step timings and journey outcomes of a load run, summarized as percentiles, throughput and error rates."""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.steps = {}          # step -> durations (ms) of its successful runs
+        self.step_errors = {}    # step -> Counter of error messages
+        self.journeys = Counter()
+        self.started = None
+        self.finished = None
+
+    def start(self):
+        self.started = time.time()
+
+    def finish(self):
+        self.finished = time.time()
+
+    def add_step(self, step: str, duration_ms: float, error: BaseException = None):
+        self.steps.setdefault(step, [])
+        self.step_errors.setdefault(step, Counter())
+        if error is None:
+            self.steps[step].append(duration_ms)
+        else:
+            self.step_errors[step][_error_text(error)] += 1
+
+    def add_journey(self, passed: bool):
+        self.journeys["passed" if passed else "failed"] += 1
+
+    @property
+    def elapsed(self) -> float:
+        return max((self.finished or time.time()) - (self.started or time.time()), 1e-6)
+
+    def _step_summary(self, step: str) -> dict:
+        durations = sorted(self.steps[step])
+        errors = sum(self.step_errors[step].values())
+        runs = len(durations) + errors
+        summary = {
+            "runs": runs,
+            "errors": errors,
+            "error_rate": round(errors / runs, 4) if runs else 0.0,
+            "throughput_per_s": round(runs / self.elapsed, 3),
+            "min_ms": round(durations[0], 1) if durations else None,
+            "mean_ms": round(sum(durations) / len(durations), 1) if durations else None,
+            "max_ms": round(durations[-1], 1) if durations else None,
+        }
+        for p in PERCENTILES:
+            value = percentile(durations, p)
+            summary[f"p{p}_ms"] = round(value, 1) if value is not None else None
+        summary["error_samples"] = dict(self.step_errors[step].most_common(MAX_ERROR_SAMPLES))
+        return summary
+
+    def summary(self) -> dict:
+        journeys = self.journeys["passed"] + self.journeys["failed"]
+        return {
+            "config": self.config,
+            "started": self.started,
+            "duration_s": round(self.elapsed, 2),
+            "journeys": {
+                "runs": journeys,
+                "failed": self.journeys["failed"],
+                "error_rate": round(self.journeys["failed"] / journeys, 4) if journeys else 0.0,
+                "throughput_per_s": round(journeys / self.elapsed, 3),
+            },
+            "steps": {step: self._step_summary(step) for step in self.steps},
+        }
+
+    def write(self, path: Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2))
+        return path
+
+    def print_summary(self):
+        summary = self.summary()
+        journeys = summary["journeys"]
+        print(f"\n[Load] {journeys['runs']} journey(s) in {summary['duration_s']}s: "
+              f"{journeys['throughput_per_s']}/s, {journeys['failed']} failed ({journeys['error_rate']:.1%})")
+        columns = ["runs", "errors"] + [f"p{p}_ms" for p in PERCENTILES] + ["max_ms"]
+        width = max([len(step) for step in summary["steps"]] + [4])
+        print(f"  {'step':<{width}} " + " ".join(f"{column:>8}" for column in columns))
+        for step, stats in summary["steps"].items():
+            values = ["-" if stats[column] is None else stats[column] for column in columns]
+            print(f"  {step:<{width}} " + " ".join(f"{value:>8}" for value in values))
+            for message, count in stats["error_samples"].items():
+                print(f"  {'':<{width}}   {count}x {message}")
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+from playwright.async_api import Browser, async_playwright
+from .journeys import JOURNEYS, STEPS, JourneySession
+from .report import LoadReport
+
+
+def load_accounts(path: Path) -> list:
+    """Account pool file: a JSON list of {"username": ..., "password": ...} objects."""
+    accounts = json.loads(Path(path).read_text())
+    if not accounts or not all("username" in account and "password" in account for account in accounts):
+        raise ValueError(f"{path} must be a non-empty JSON list of {{'username', 'password'}} objects")
+    return [(account["username"], account["password"]) for account in accounts]
+
+
+class LoadRunner:
+    """
+    Replays a journey with `users` virtual users, each in its own browser context of one
+    shared browser. Users start one after another over `ramp` seconds and repeat the
+    journey until `duration` seconds have passed since the start (or `iterations` times).
+    Every iteration checks an account out of the pool for itself, so two users never
+    drive the same account at once; with fewer accounts than users, users wait their turn.
+    """
+
+    def __init__(self, base_url: str, accounts: list, journey: str = "full", users: int = 1, ramp: float = 0,
+                 duration: float = 60, iterations: int = None, step_timeout: int = 30000, think_time_ms: int = 0,
+                 headless: bool = True, context_args: dict = None):
+        if journey not in JOURNEYS:
+            raise ValueError(f"Unknown journey '{journey}', expected one of: {', '.join(JOURNEYS)}")
+        if not accounts:
+            raise ValueError("The account pool is empty")
+        self.base_url = base_url
+        self.accounts = accounts
+        self.journey = journey
+        self.users = users
+        self.ramp = ramp
+        self.duration = duration
+        self.iterations = iterations
+        self.step_timeout = step_timeout
+        self.think_time_ms = think_time_ms
+        self.headless = headless
+        self.context_args = context_args or {}
+        self.deadline = None
+        self.report = LoadReport({
+            "base_url": base_url, "journey": journey, "steps": JOURNEYS[journey], "users": users, "ramp_s": ramp,
+            "duration_s": duration, "iterations": iterations, "accounts": len(accounts),
+            "step_timeout_ms": step_timeout, "think_time_ms": think_time_ms,
+        })
+
+    def run(self) -> LoadReport:
+        asyncio.run(self._run())
+        return self.report
+
+    async def _run(self):
+        pool = asyncio.Queue()
+        for account in self.accounts:
+            pool.put_nowait(account)
+        if len(self.accounts) < self.users:
+            print(f"[Load] {len(self.accounts)} account(s) for {self.users} users, some users will wait for an account")
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=self.headless, channel="chrome")
+            self.deadline = time.monotonic() + self.duration
+            self.report.start()
+            try:
+                await asyncio.gather(*(self._virtual_user(index, browser, pool) for index in range(self.users)))
+            finally:
+                self.report.finish()
+                await browser.close()
+
+    def _running(self, iteration: int) -> bool:
+        return time.monotonic() < self.deadline and (self.iterations is None or iteration < self.iterations)
+
+    async def _virtual_user(self, index: int, browser: Browser, pool: asyncio.Queue):
+        await asyncio.sleep(self.ramp * index / self.users)
+        print(f"[Load] user {index + 1}/{self.users} started")
+        iteration = 0
+        while self._running(iteration):
+            account = await pool.get()
+            try:
+                if not self._running(iteration):
+                    break
+                await self._iteration(browser, account)
+            finally:
+                pool.put_nowait(account)
+            iteration += 1
+
+    async def _iteration(self, browser: Browser, account):
+        """One run of the journey in a fresh context; the first failing step ends it."""
+        ctx = await browser.new_context(**self.context_args)
+        try:
+            page = await ctx.new_page()
+            page.set_default_timeout(self.step_timeout)
+            session = JourneySession(page, self.base_url, *account, timeout=self.step_timeout)
+            for step in JOURNEYS[self.journey]:
+                start = time.perf_counter()
+                try:
+                    await STEPS[step](session)
+                except Exception as e:
+                    self.report.add_step(step, (time.perf_counter() - start) * 1000, e)
+                    self.report.add_journey(False)
+                    return
+                self.report.add_step(step, (time.perf_counter() - start) * 1000)
+                if self.think_time_ms:
+                    await asyncio.sleep(self.think_time_ms / 1000)
+            self.report.add_journey(True)
+        finally:
+            await ctx.close()
@@ -0,0 +1,14 @@
+from .base import BasePage
+from .home import HomePage
+from .login import LoginPage
+from .profile import ProfilePage, EditProfilePage
+from .post import PostDetailPage
+
+__all__ = [
+    "BasePage",
+    "HomePage",
+    "LoginPage",
+    "ProfilePage",
+    "EditProfilePage",
+    "PostDetailPage"
+]
@@ -0,0 +1,63 @@
+import os
+from abc import ABC, abstractmethod
+from urllib.parse import urljoin
+from playwright.sync_api import Page, expect
+
+# =====================================================================
+# Constants for Timeout
+# =====================================================================
+LONG_TIMEOUT = 60000      # Timeout for page navigation
+MEDIUM_TIMEOUT = 15000    # Timeout for the "page is ready" check
+
+# Whether pages are opened by URL when a test does not ask for the click path. Off by
+# default: the routes (LOGIN_ROUTE, PROFILE_ROUTE, ...) are only confirmed against the
+# local stand-in server. Set DEEP_LINKS=true once they match the app under test.
+DEEP_LINKS = os.getenv("DEEP_LINKS", "false").lower() == "true"
+
+
+class BasePage(ABC):
+    """
+    A screen of the Panorra web app. `open()` reaches it through the clicks a user would
+    make or, with DEEP_LINKS on, by URL (one navigation), falling back to the clicks when
+    the screen does not show up at that URL. `via_ui=True` always takes the click path, for
+    tests where that navigation is what is being tested. Either way it returns once the
+    screen is ready.
+    """
+
+    # Route of the screen, relative to base_url (None when it has no URL of its own)
+    path = None
+
+    def __init__(self, page: Page, base_url: str):
+        self.page = page
+        self.base_url = base_url
+
+    @property
+    def url(self) -> str:
+        return urljoin(self.base_url, self.path)
+
+    @abstractmethod
+    def ready_locator(self):
+        """Element whose visibility means the screen has finished loading."""
+
+    @abstractmethod
+    def navigate_via_ui(self):
+        """Reach the screen through the UI, starting from wherever the click path starts."""
+
+    def open(self, via_ui: bool = None):
+        if via_ui or (via_ui is None and (not DEEP_LINKS or self.path is None)):
+            self.navigate_via_ui()
+            return self.wait_until_ready()
+        print(f"Opening {self.url} ...")
+        self.page.goto(self.url, timeout=LONG_TIMEOUT)
+        try:
+            return self.wait_until_ready()
+        except AssertionError:
+            if via_ui is False:
+                raise
+            print(f"{type(self).__name__} did not load at {self.url}, taking the click path instead...")
+            self.navigate_via_ui()
+            return self.wait_until_ready()
+
+    def wait_until_ready(self, timeout: int = MEDIUM_TIMEOUT):
+        expect(self.ready_locator()).to_be_visible(timeout=timeout)
+        return self
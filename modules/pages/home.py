@@ -0,0 +1,77 @@
+import re
+from .base import BasePage, LONG_TIMEOUT, MEDIUM_TIMEOUT
+
+
+class HomePage(BasePage):
+    """The feed ("Recommendation for You") with the header menu of a logged-in user."""
+
+    path = "/"
+
+    @property
+    def url(self) -> str:
+        return self.base_url
+
+    def ready_locator(self):
+        return self.page.get_by_role("heading", name="Recommendation for You")
+
+    def navigate_via_ui(self):
+        self.page.goto(self.base_url, timeout=LONG_TIMEOUT)
+
+    def wait_until_ready(self, timeout: int = LONG_TIMEOUT):
+        return super().wait_until_ready(timeout)
+
+    @property
+    def header_menu(self):
+        return self.page.get_by_role("button", name="header menu")
+
+    @property
+    def logout_link(self):
+        return self.page.get_by_role("link", name=re.compile("Log Out"))
+
+    @property
+    def login_link(self):
+        return self.page.get_by_role("link", name="Log In")
+
+    @property
+    def profile_link(self):
+        """The header menu's "Profile" entry."""
+        return self.page.get_by_text("Profile", exact=True)
+
+    @property
+    def first_post(self):
+        return self.page.locator(".d-block.w-100").first
+
+    def open_header_menu(self):
+        self.header_menu.click()
+        return self
+
+    def go_to_profile(self):
+        """Header menu -> Profile."""
+        from .profile import ProfilePage
+        print("Navigating to the Profile page...")
+        self.open_header_menu()
+        self.profile_link.click()
+        return ProfilePage(self.page, self.base_url)
+
+    def go_to_login(self):
+        """The header's "Log In" link (guests only)."""
+        from .login import LoginPage
+        self.login_link.click()
+        return LoginPage(self.page, self.base_url)
+
+    def open_first_post(self):
+        """Open the first post of the feed."""
+        from .post import PostDetailPage
+        print("Opening the first post...")
+        self.first_post.click()
+        return PostDetailPage(self.page, self.base_url)
+
+    def log_out(self):
+        """Header menu -> Log Out, then confirm."""
+        print("Logging out...")
+        self.open_header_menu()
+        self.logout_link.click()
+        confirm = self.page.get_by_role("button", name="Log Out")
+        confirm.wait_for(timeout=MEDIUM_TIMEOUT)
+        confirm.click()
+        return self
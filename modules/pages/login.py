@@ -0,0 +1,51 @@
+import os
+from .base import BasePage, LONG_TIMEOUT
+
+
+class LoginPage(BasePage):
+    """The "Log In to Panorra" form."""
+
+    path = os.getenv("LOGIN_ROUTE", "/login")
+
+    def ready_locator(self):
+        return self.username_input
+
+    def navigate_via_ui(self):
+        from .home import HomePage
+        self.page.goto(self.base_url, timeout=LONG_TIMEOUT)
+        self.page.wait_for_load_state("domcontentloaded", timeout=LONG_TIMEOUT)
+        HomePage(self.page, self.base_url).go_to_login()
+
+    @property
+    def username_input(self):
+        return self.page.get_by_placeholder("Enter your email or username")
+
+    @property
+    def password_input(self):
+        return self.page.get_by_placeholder("Enter your password")
+
+    @property
+    def submit_button(self):
+        return self.page.get_by_role("button", name="Log In")
+
+    @property
+    def error_message(self):
+        return self.page.locator("text=Email or Password incorrect")
+
+    def fill(self, username: str, password: str):
+        self.username_input.fill(username)
+        self.password_input.fill(password)
+        return self
+
+    def submit(self):
+        self.submit_button.click(timeout=LONG_TIMEOUT)
+        return self
+
+    def login(self, username: str, password: str):
+        """Log in through the form and wait for the dashboard."""
+        from .home import HomePage
+        print(f"Logging in with username: {username}...")
+        self.fill(username, password).submit()
+        home = HomePage(self.page, self.base_url).wait_until_ready()
+        print("Login successful.")
+        return home
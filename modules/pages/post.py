@@ -0,0 +1,52 @@
+import os
+from .base import BasePage
+
+# Route of a post, {post_id} is replaced by the post's id
+POST_ROUTE = os.getenv("POST_ROUTE", "/post/{post_id}")
+
+
+class PostDetailPage(BasePage):
+    """
+    A single post with its options menu. Without a `post_id` there is no URL to open,
+    so `open()` clicks the first post of the feed instead.
+    """
+
+    def __init__(self, page, base_url: str, post_id=None):
+        super().__init__(page, base_url)
+        self.post_id = post_id
+        self.path = POST_ROUTE.format(post_id=post_id) if post_id is not None else None
+
+    def ready_locator(self):
+        return self.menu_button
+
+    def navigate_via_ui(self):
+        from .home import HomePage
+        HomePage(self.page, self.base_url).open(via_ui=True).open_first_post()
+
+    @property
+    def menu_button(self):
+        return self.page.get_by_role("button", name="button menu")
+
+    @property
+    def confirm_button(self):
+        return self.page.get_by_role("button", name="Confirm")
+
+    @property
+    def cancel_button(self):
+        return self.page.get_by_role("button", name="Cancel")
+
+    @property
+    def block_success_alert(self):
+        return self.page.get_by_text("Success Block Post")
+
+    def start_block(self):
+        """Options menu -> Block Post, which asks for confirmation."""
+        print("Blocking the post...")
+        self.menu_button.click()
+        self.page.get_by_role("link", name="Block Post").click()
+        return self
+
+    def block(self):
+        self.start_block()
+        self.confirm_button.click()
+        return self
@@ -0,0 +1,77 @@
+import os
+from .base import BasePage
+
+
+class ProfilePage(BasePage):
+    """The logged-in user's own profile (user detail)."""
+
+    path = os.getenv("PROFILE_ROUTE", "/profile")
+
+    def ready_locator(self):
+        return self.edit_profile_button
+
+    def navigate_via_ui(self):
+        from .home import HomePage
+        HomePage(self.page, self.base_url).open(via_ui=True).go_to_profile()
+
+    @property
+    def avatar(self):
+        return self.page.locator(".profile__user-avatar")
+
+    @property
+    def edit_profile_button(self):
+        return self.page.get_by_role("button", name="Edit Profile")
+
+    def name_heading(self, full_name):
+        return self.page.get_by_role("heading", name=full_name)
+
+    def go_to_edit_profile(self):
+        print("Navigating to the Edit Profile page...")
+        self.edit_profile_button.click()
+        return EditProfilePage(self.page, self.base_url)
+
+
+class EditProfilePage(BasePage):
+    """The Edit Profile form."""
+
+    path = os.getenv("EDIT_PROFILE_ROUTE", "/profile/edit")
+
+    def ready_locator(self):
+        return self.full_name_input
+
+    def navigate_via_ui(self):
+        ProfilePage(self.page, self.base_url).open(via_ui=True).go_to_edit_profile()
+
+    @property
+    def full_name_input(self):
+        return self.page.get_by_role("textbox", name="Enter full name")
+
+    @property
+    def description_input(self):
+        return self.page.get_by_role("textbox", name="Enter description about me")
+
+    @property
+    def save_button(self):
+        return self.page.get_by_role("button", name="Save Profile")
+
+    @property
+    def success_alert(self):
+        return self.page.get_by_text("Success update profile")
+
+    @property
+    def fullname_error_alert(self):
+        return self.page.get_by_text("Not valid fullname, fullname")
+
+    def fill(self, full_name: str = None, description: str = None):
+        if full_name is not None:
+            print(f"Updating profile name to: '{full_name}'")
+            self.full_name_input.fill(full_name)
+        if description is not None:
+            print("Updating description...")
+            self.description_input.fill(description)
+        return self
+
+    def save(self):
+        print("Saving profile changes...")
+        self.save_button.click()
+        return self
@@ -0,0 +1 @@
+from .server import StubServer, DEFAULT_USERNAME, DEFAULT_PASSWORD
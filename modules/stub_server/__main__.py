@@ -0,0 +1,26 @@
+"""Run the Panorra stand-in server on its own: python -m modules.stub_server --port 8000"""
+import argparse
+from .server import StubServer, DEFAULT_USERNAME, DEFAULT_PASSWORD
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Panorra web app")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=int, default=0, help="Delay added to every response")
+    parser.add_argument("--username", default=DEFAULT_USERNAME)
+    parser.add_argument("--password", default=DEFAULT_PASSWORD)
+    parser.add_argument("--access-code", default=None, help="Reject requests without this Access-Code header")
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, args.latency_ms, {args.username: args.password},
+                        args.access_code, verbose=True)
+    print(f"Panorra stand-in server running at {server.url} (login: {args.username} / {args.password})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
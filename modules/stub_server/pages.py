@@ -0,0 +1,381 @@
+"""HTML, CSS, JS and image templates served by the Panorra stand-in server."""
+from html import escape
+
+APP_CSS = """
+* { box-sizing: border-box; }
+body { margin: 0; font-family: Arial, sans-serif; color: #222; background: #fafafa; }
+header { display: flex; align-items: center; justify-content: space-between; padding: 12px 24px; background: #fff; border-bottom: 1px solid #eee; }
+header .logo { font-weight: bold; font-size: 20px; color: #e4405f; text-decoration: none; }
+.header-user { position: relative; }
+.header-user button { border: 0; background: none; cursor: pointer; }
+.header-user img, .edit-profile__avatar img { width: 40px; height: 40px; border-radius: 50%; }
+.header-dropdown { position: absolute; right: 0; top: 48px; display: flex; flex-direction: column; min-width: 160px; background: #fff; border: 1px solid #ddd; z-index: 10; }
+.header-dropdown a, .dropdown-menu a { padding: 8px 12px; color: #222; text-decoration: none; display: block; }
+.layout { display: flex; gap: 24px; padding: 24px; }
+.left-nav { width: 200px; }
+.left-nav ul { list-style: none; padding: 0; margin: 0; }
+.left-nav li { padding: 8px 0; }
+main { flex: 1; max-width: 720px; }
+.banner img { display: block; width: 100%; height: 120px; }
+.d-block { display: block; }
+.w-100 { width: 100%; }
+.post-card img { height: 200px; object-fit: cover; }
+.feed { display: grid; gap: 16px; }
+footer { margin-top: 48px; padding-bottom: 48px; }
+.store-links { display: flex; gap: 12px; list-style: none; padding: 0; }
+.store-links img { width: 135px; height: 40px; }
+.footer-links a { margin-right: 16px; }
+.login-card, .edit-profile, .profile, .post-detail, .document { max-width: 640px; margin: 24px auto; padding: 24px; background: #fff; }
+.form-field { display: flex; flex-direction: column; margin-bottom: 12px; }
+.form-field input, .form-field select, .form-field textarea { padding: 8px; }
+.login-error { color: #c62828; }
+.profile__user-avatar, .edit-profile__avatar { width: 96px; height: 96px; border-radius: 50%; display: block; }
+.edit-profile__avatar img { width: 96px; height: 96px; }
+.profile__stats span, .profile__tabs span { margin-right: 12px; }
+virtual-scroller { display: block; min-height: 40px; }
+.flex-align-center { display: flex; align-items: center; justify-content: space-between; }
+.header-more { position: relative; }
+.dropdown-menu { position: absolute; right: 0; background: #fff; border: 1px solid #ddd; min-width: 160px; }
+.modal-overlay { position: fixed; inset: 0; background: rgba(0, 0, 0, 0.4); display: flex; align-items: center; justify-content: center; }
+.modal { background: #fff; padding: 24px; min-width: 320px; }
+.modal img { max-width: 320px; }
+.toast-container { position: fixed; top: 16px; right: 16px; z-index: 20; }
+.toast { padding: 12px 16px; margin-bottom: 8px; color: #fff; background: #2e7d32; }
+.toast--error { background: #c62828; }
+.offline { text-align: center; padding: 96px 24px; }
+"""
+
+APP_JS = """
+(function () {
+  function api(method, url, body) {
+    return fetch(url, {
+      method: method,
+      credentials: 'same-origin',
+      headers: { 'Content-Type': 'application/json' },
+      body: body ? JSON.stringify(body) : undefined
+    }).then(function (response) {
+      return response.json().then(function (data) { return { ok: response.ok, data: data }; });
+    });
+  }
+
+  function toast(message, kind) {
+    var container = document.querySelector('.toast-container');
+    if (!container) {
+      container = document.createElement('div');
+      container.className = 'toast-container';
+      document.body.appendChild(container);
+    }
+    var item = document.createElement('div');
+    item.className = 'toast toast--' + kind;
+    item.setAttribute('role', 'alert');
+    var body = document.createElement('div');
+    body.className = 'toast__body';
+    body.textContent = message;
+    item.appendChild(body);
+    container.appendChild(item);
+    setTimeout(function () { item.remove(); }, 6000);
+  }
+
+  function openDialog(build) {
+    var overlay = document.createElement('div');
+    overlay.className = 'modal-overlay';
+    var dialog = document.createElement('div');
+    dialog.className = 'modal';
+    dialog.setAttribute('role', 'dialog');
+    dialog.setAttribute('aria-modal', 'true');
+    overlay.appendChild(dialog);
+    build(dialog, function () { overlay.remove(); });
+    document.body.appendChild(overlay);
+  }
+
+  function confirmDialog(message, confirmLabel, onConfirm) {
+    openDialog(function (dialog, close) {
+      var text = document.createElement('p');
+      text.textContent = message;
+      var cancel = document.createElement('button');
+      cancel.type = 'button';
+      cancel.textContent = 'Cancel';
+      cancel.addEventListener('click', close);
+      var confirm = document.createElement('button');
+      confirm.type = 'button';
+      confirm.textContent = confirmLabel;
+      confirm.addEventListener('click', function () { close(); onConfirm(); });
+      dialog.appendChild(text);
+      dialog.appendChild(cancel);
+      dialog.appendChild(confirm);
+    });
+  }
+
+  function toggleHeaderMenu(button) {
+    var existing = document.querySelector('.header-dropdown');
+    if (existing) { existing.remove(); return; }
+    var menu = document.createElement('div');
+    menu.className = 'header-dropdown';
+    menu.innerHTML = '<a href="/profile">Profile</a>' +
+      '<a href="#" data-action="logout"><span aria-hidden="true">&#x21A6;</span> Log Out</a>';
+    button.parentNode.appendChild(menu);
+  }
+
+  document.addEventListener('click', function (event) {
+    var target = event.target.closest('[data-action]');
+    if (!target) { return; }
+    var action = target.getAttribute('data-action');
+    if (action === 'header-menu') {
+      toggleHeaderMenu(target);
+    } else if (action === 'logout') {
+      event.preventDefault();
+      confirmDialog('Are you sure you want to leave?', 'Log Out', function () {
+        api('POST', '/api/auth/logout').then(function () { window.location.href = '/login'; });
+      });
+    } else if (action === 'post-menu') {
+      var menu = target.parentNode.querySelector('.dropdown-menu');
+      menu.hidden = !menu.hidden;
+    } else if (action === 'block-post') {
+      event.preventDefault();
+      target.closest('.dropdown-menu').hidden = true;
+      var postId = target.getAttribute('data-post-id');
+      confirmDialog('Do you want to block this post?', 'Confirm', function () {
+        api('POST', '/api/posts/' + postId + '/block').then(function (result) {
+          toast(result.data.message, result.ok ? 'success' : 'error');
+        });
+      });
+    } else if (action === 'preview-avatar') {
+      openDialog(function (dialog, close) {
+        var image = document.createElement('img');
+        image.src = target.getAttribute('src');
+        image.alt = 'preview';
+        var dismiss = document.createElement('button');
+        dismiss.type = 'button';
+        dismiss.textContent = 'Close';
+        dismiss.addEventListener('click', close);
+        dialog.appendChild(image);
+        dialog.appendChild(dismiss);
+      });
+    } else if (action === 'save-profile') {
+      api('POST', '/api/profile', {
+        fullname: document.querySelector('[name="fullname"]').value,
+        description: document.querySelector('[name="description"]').value
+      }).then(function (result) {
+        toast(result.data.message, result.ok ? 'success' : 'error');
+      });
+    } else if (action === 'retry') {
+      if (navigator.onLine) { window.location.reload(); }
+    }
+  });
+
+  var loginForm = document.getElementById('login-form');
+  if (loginForm) {
+    var identity = loginForm.querySelector('[name="identity"]');
+    var password = loginForm.querySelector('[name="password"]');
+    var submit = loginForm.querySelector('button[type="submit"]');
+    var updateSubmit = function () { submit.disabled = !(identity.value && password.value); };
+    identity.addEventListener('input', updateSubmit);
+    password.addEventListener('input', updateSubmit);
+    loginForm.addEventListener('submit', function (event) {
+      event.preventDefault();
+      api('POST', '/api/auth/login', { username: identity.value, password: password.value }).then(function (result) {
+        if (result.ok) {
+          window.location.href = '/';
+        } else {
+          var error = loginForm.querySelector('.login-error');
+          error.textContent = result.data.message;
+          error.hidden = false;
+        }
+      });
+    });
+  }
+
+  window.addEventListener('offline', function () {
+    document.getElementById('app').innerHTML =
+      '<div class="offline"><h1>Connect with Internet</h1>' +
+      '<p>Please check your connection and try again.</p>' +
+      '<button type="button" data-action="retry">Retry</button></div>';
+  });
+  window.addEventListener('online', function () { window.location.reload(); });
+})();
+"""
+
+PRIVACY_SECTIONS = [
+    "1. How we obtain your data",
+    "2. Personal data we Collect",
+    "3. Processing of Your Personal Data",
+    "4. THIRD-PARTY SERVICES",
+    "5. Cookies and DIGITAL Tracking Technologies",
+    "6. Obtaining, rectifying and deleting your data",
+    "7. Data Storage, Retention and Transfer",
+    "8. Children",
+    "9. DO NOT TRACK DISCLOSURE",
+    '10. CALIFORNIA "SHINE THE LIGHT" LAW',
+    "11. YOUR CALIFORNIA PRIVACY RIGHTS",
+    "12. European users and rights",
+    "13. Change of Ownership or Business Transition",
+    "14. Security",
+    "15. CONTACT PREFERENCES",
+    "16. Updates",
+]
+
+TERMS_SECTIONS = [
+    "1. UPDATES",
+    "2. SCOPE OF SERVICE; ACCESS TO THE SERVICE",
+    "3. ADVERTISEMENTS",
+    "4. USE OF THE SERVICE",
+    "5. TERMINATION",
+    "6. OWNERSHIP RIGHTS",
+    "7. DISCLAIMER, LIMITATION OF LIABILITY AND INDEMNITY",
+    "8. GENERAL",
+]
+
+PLACEHOLDER_TEXT = "Placeholder copy served by the local Panorra stand-in server."
+
+
+def svg_image(label: str, width: int, height: int, color: str) -> str:
+    """Simple coloured SVG used for banners, posts, avatars and store badges."""
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}">'
+        f'<rect width="100%" height="100%" fill="{color}"/>'
+        f'<text x="50%" y="50%" fill="#fff" font-size="16" text-anchor="middle">{escape(label)}</text></svg>'
+    )
+
+
+def layout(body: str, user=None, header: bool = True) -> str:
+    """Page shell shared by every stand-in page."""
+    if user:
+        account = (
+            '<div class="header-user">'
+            '<button type="button" aria-label="header menu" data-action="header-menu">'
+            '<img src="/static/avatar.svg" alt=""></button></div>'
+        )
+    else:
+        account = '<a href="/login">Log In</a>'
+    top = f'<header><a class="logo" href="/">Panorra</a>{account}</header>' if header else ""
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Panorra</title>'
+        '<link rel="stylesheet" href="/static/app.css"></head>'
+        f'<body><div id="app">{top}{body}</div><script src="/static/app.js"></script></body></html>'
+    )
+
+
+def home_page(user, posts) -> str:
+    cards = "".join(
+        f'<div class="post-card"><a href="/post/{post["id"]}">'
+        f'<img class="d-block w-100" src="/static/post-{post["id"]}.svg" alt="post image"></a>'
+        f'<p>{escape(post["title"])}</p></div>'
+        for post in posts
+    )
+    body = (
+        '<div class="layout">'
+        '<div class="left-nav"><ul><li>Recent</li><li>Just for You</li><li>Nearest</li></ul></div>'
+        '<main>'
+        '<a class="banner" aria-label="banner" href="/promo" target="_blank"><img src="/static/banner.svg" alt=""></a>'
+        '<h2>Recommendation for You</h2>'
+        '<button type="button" aria-label="next popular">&rsaquo;</button>'
+        f'<div class="feed">{cards}</div>'
+        '<footer><h3>Find Us On</h3>'
+        '<ul class="store-links">'
+        '<li><a href="/store/google-play" target="_blank"><img src="/static/google-play.svg" alt=""></a></li>'
+        '<li><a href="/store/app-store" target="_blank"><img src="/static/app-store.svg" alt=""></a></li>'
+        '</ul>'
+        '<p class="footer-links"><a href="/terms-of-service" target="_blank">Terms of Service</a>'
+        '<a href="/privacy-policy" target="_blank">Privacy Policy</a></p>'
+        '</footer></main></div>'
+    )
+    return layout(body, user)
+
+
+def login_page() -> str:
+    body = (
+        '<div class="login-card"><h1>Log In to Panorra</h1>'
+        '<form id="login-form">'
+        '<div class="form-field"><label>Email/Username</label>'
+        '<input name="identity" placeholder="Enter your email or username"></div>'
+        '<div class="form-field"><label>Password</label>'
+        '<input name="password" type="password" placeholder="Enter your password"></div>'
+        '<a href="#">Forgot your password?</a>'
+        '<p class="login-error" hidden></p>'
+        '<button type="submit" disabled>Log In</button>'
+        '</form>'
+        '<div class="divider">OR</div>'
+        '<p>Need a Panorra account? <a href="#">Sign Up</a></p></div>'
+    )
+    return layout(body)
+
+
+def profile_page(user, posts) -> str:
+    items = "".join(f'<p>{escape(post["title"])}</p>' for post in posts)
+    body = (
+        '<div class="profile">'
+        '<img class="profile__user-avatar" src="/static/avatar.svg" alt="profile" data-action="preview-avatar">'
+        f'<h1>{escape(user["fullname"])}</h1>'
+        f'<p>@{escape(user["username"])}</p>'
+        f'<div class="profile__stats"><span>{len(posts)} Posts</span> <span>340 Followers</span> <span>180 Following</span></div>'
+        '<a href="/profile/edit"><button type="button">Edit Profile</button></a>'
+        '<div class="profile__actions"><button type="button">Report User</button><button type="button">Block User</button></div>'
+        '<div class="profile__tabs"><span>Posts</span><span>Tagged</span><span>About</span></div>'
+        f'<virtual-scroller>{items}</virtual-scroller>'
+        '</div>'
+    )
+    return layout(body, user)
+
+
+def edit_profile_page(user) -> str:
+    body = (
+        '<div class="edit-profile">'
+        '<div class="edit-profile__avatar"><img src="/static/avatar.svg" alt=""></div>'
+        f'<div class="form-field"><label>Email*</label><input placeholder="Enter email" value="{escape(user["email"])}" disabled></div>'
+        f'<div class="form-field"><label>Full Name*</label><input name="fullname" placeholder="Enter full name" value="{escape(user["fullname"])}"></div>'
+        f'<div class="form-field"><label>Username*</label><input placeholder="Enter username" value="{escape(user["username"])}"></div>'
+        '<div class="form-field"><label>Birthday</label><input type="date"></div>'
+        '<div class="form-field"><label>Gender</label><select><option>Male</option><option>Female</option></select></div>'
+        '<div class="form-field"><label>Country</label><select><option>Indonesia</option></select></div>'
+        '<h3>Contact Info</h3>'
+        '<div class="form-field"><label>Phone Number</label><input placeholder="Enter phone number"></div>'
+        '<h3>About Me</h3>'
+        f'<div class="form-field"><textarea name="description" placeholder="Enter description about me">{escape(user["description"])}</textarea></div>'
+        '<button type="button" data-action="save-profile">Save Profile</button>'
+        '</div>'
+    )
+    return layout(body, user)
+
+
+def post_page(user, post) -> str:
+    body = (
+        '<div class="post-detail">'
+        '<div class="flex-align-center">'
+        f'<span>{escape(post["author"])}</span>'
+        '<app-detail-menu><div class="header-more">'
+        '<button type="button" id="dropdownBasic1" aria-label="button menu" data-action="post-menu">&hellip;</button>'
+        '<div class="dropdown-menu" hidden>'
+        f'<a href="#" data-action="block-post" data-post-id="{post["id"]}">Block Post</a>'
+        '<a href="#">Report Post</a>'
+        '</div></div></app-detail-menu>'
+        '</div>'
+        f'<img class="d-block w-100" src="/static/post-{post["id"]}.svg" alt="post image">'
+        f'<h1>{escape(post["title"])}</h1>'
+        '</div>'
+    )
+    return layout(body, user)
+
+
+def document_page(title: str, sections, intro: str = "") -> str:
+    content = "".join(f"<h2>{escape(section)}</h2><p>{PLACEHOLDER_TEXT}</p>" for section in sections)
+    return layout(f'<div class="document"><h1>{escape(title)}</h1>{intro}{content}</div>', header=False)
+
+
+def terms_page() -> str:
+    intro = (
+        '<p>Effective Date: 28th April 2024</p>'
+        '<p>BY CLICKING "I AGREE" OR ACCESSING PANORRA YOU ACCEPT THESE TERMS.</p>'
+    )
+    return document_page("TERMS OF USE", TERMS_SECTIONS, intro)
+
+
+def privacy_page() -> str:
+    return document_page("PRIVACY POLICY", PRIVACY_SECTIONS)
+
+
+def store_page(heading: str) -> str:
+    return layout(f'<div class="document"><h1>{escape(heading)}</h1><p>{PLACEHOLDER_TEXT}</p></div>', header=False)
+
+
+def promo_page() -> str:
+    return layout(f'<div class="document"><h1>Panorra Promo</h1><p>{PLACEHOLDER_TEXT}</p></div>', header=False)
@@ -0,0 +1,367 @@
+import hashlib
+import json
+import re
+import secrets
+import threading
+import time
+from email.utils import formatdate
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from . import pages
+
+# Account seeded when no credentials are given (the suite's defaults in stub mode)
+DEFAULT_USERNAME = "panorra.tester"
+DEFAULT_PASSWORD = "Panorra123!"
+DEFAULT_FULLNAME = "Arnov Abdillah Rahman"
+
+SESSION_COOKIE = "panorra_session"
+LOGIN_ERROR = "Email or Password incorrect"
+FULLNAME_ERROR = "Not valid fullname, fullname must only contain letters and spaces (max 50 characters)"
+FULLNAME_PATTERN = re.compile(r"^[A-Za-z ]{1,50}$")
+
+SEED_POSTS = [
+    ("Sunset over Bromo", "Raka Pratama"),
+    ("Street food in Jogja", "Dewi Lestari"),
+    ("Morning at Kuta beach", "Bima Santoso"),
+    ("Old town Jakarta", "Sari Wulandari"),
+    ("Rice terraces of Ubud", "Yoga Saputra"),
+    ("Night market in Bandung", "Intan Permata"),
+]
+
+STATIC_COLORS = {"banner": "#e4405f", "avatar": "#607d8b", "google-play": "#000000", "app-store": "#1c1c1e"}
+STATIC_SIZES = {"banner": (720, 120), "avatar": (96, 96), "google-play": (135, 40), "app-store": (135, 40)}
+
+
+class StubState:
+    """In-memory accounts, sessions and posts shared by every request thread."""
+
+    def __init__(self, accounts):
+        self.lock = threading.Lock()
+        self.users = {}
+        for username, password in accounts.items():
+            self.users[username] = {
+                "username": username,
+                "password": password,
+                "email": f"{username}@panorra.test",
+                "fullname": DEFAULT_FULLNAME,
+                "description": "Testing the Panorra web app.",
+                "blocked": set(),
+            }
+        self.sessions = {}
+        self.posts = {index: {"id": index, "title": title, "author": author}
+                      for index, (title, author) in enumerate(SEED_POSTS, start=1)}
+
+    def login(self, identity, password):
+        with self.lock:
+            for user in self.users.values():
+                if identity in (user["username"], user["email"]) and password == user["password"]:
+                    token = secrets.token_hex(16)
+                    self.sessions[token] = user["username"]
+                    return token, user
+        return None, None
+
+    def user_for(self, token):
+        with self.lock:
+            username = self.sessions.get(token)
+            return self.users.get(username) if username else None
+
+    def feed(self, user):
+        with self.lock:
+            blocked = user["blocked"] if user else set()
+            return [post for post in self.posts.values() if post["id"] not in blocked]
+
+
+def _public_user(user):
+    return {key: user[key] for key in ("username", "email", "fullname", "description")}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the stand-in pages, static assets and JSON API of one `StubServer`."""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "PanorraStub/1.0"
+
+    # --- plumbing -----------------------------------------------------------
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _delay(self):
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, status, payload, headers=None):
+        self._send(status, json.dumps(payload), "application/json", headers)
+
+    def _redirect(self, location):
+        self._send(HTTPStatus.FOUND, headers={"Location": location})
+
+    def _token(self):
+        authorization = self.headers.get("Authorization", "")
+        if authorization.startswith("Bearer "):
+            return authorization[len("Bearer "):]
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        return cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+
+    def _user(self):
+        token = self._token()
+        return self.server.state.user_for(token) if token else None
+
+    def _body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return {}
+
+    def _access_denied(self):
+        expected = self.server.access_code
+        return expected is not None and self.headers.get("Access-Code") != expected
+
+    def _dispatch(self, routes):
+        self._delay()
+        if self._access_denied():
+            return self._json(HTTPStatus.FORBIDDEN, {"message": "Invalid access code"})
+        path = urlsplit(self.path).path
+        for pattern, handler in routes:
+            match = re.fullmatch(pattern, path)
+            if match:
+                return handler(self, *match.groups())
+        self._send(HTTPStatus.NOT_FOUND, "Not Found", "text/plain; charset=utf-8")
+
+    def do_GET(self):
+        self._dispatch(GET_ROUTES)
+
+    def do_HEAD(self):
+        self._dispatch(GET_ROUTES)
+
+    def do_POST(self):
+        self._dispatch(POST_ROUTES)
+
+    # --- pages --------------------------------------------------------------
+    def home(self):
+        user = self._user()
+        self._send(HTTPStatus.OK, pages.home_page(user, self.server.state.feed(user)))
+
+    def login_page(self):
+        self._send(HTTPStatus.OK, pages.login_page())
+
+    def profile(self):
+        user = self._user()
+        if not user:
+            return self._redirect("/login")
+        self._send(HTTPStatus.OK, pages.profile_page(user, self.server.state.feed(user)))
+
+    def edit_profile(self):
+        user = self._user()
+        if not user:
+            return self._redirect("/login")
+        self._send(HTTPStatus.OK, pages.edit_profile_page(user))
+
+    def post(self, post_id):
+        post = self.server.state.posts.get(int(post_id))
+        if not post:
+            return self._send(HTTPStatus.NOT_FOUND, "Not Found", "text/plain; charset=utf-8")
+        self._send(HTTPStatus.OK, pages.post_page(self._user(), post))
+
+    def terms(self):
+        self._send(HTTPStatus.OK, pages.terms_page())
+
+    def privacy(self):
+        self._send(HTTPStatus.OK, pages.privacy_page())
+
+    def promo(self):
+        self._send(HTTPStatus.OK, pages.promo_page())
+
+    def google_play(self):
+        self._send(HTTPStatus.OK, pages.store_page("Panorra"))
+
+    def app_store(self):
+        self._send(HTTPStatus.OK, pages.store_page("Panorra 4+"))
+
+    # --- static assets (cacheable, with validators) ---------------------------
+    def static(self, name, extension):
+        if extension == "css" and name == "app":
+            body, content_type = pages.APP_CSS, "text/css; charset=utf-8"
+        elif extension == "js" and name == "app":
+            body, content_type = pages.APP_JS, "application/javascript; charset=utf-8"
+        elif extension == "svg" and (name in STATIC_COLORS or name.startswith("post-")):
+            color = STATIC_COLORS.get(name, "#8d6e63")
+            width, height = STATIC_SIZES.get(name, (720, 400))
+            body, content_type = pages.svg_image(name, width, height, color), "image/svg+xml"
+        else:
+            return self._send(HTTPStatus.NOT_FOUND, "Not Found", "text/plain; charset=utf-8")
+        body = body.encode("utf-8")
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        headers = {
+            "ETag": etag,
+            "Last-Modified": self.server.started_http_date,
+            "Cache-Control": "no-cache",
+        }
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            for header, value in headers.items():
+                self.send_header(header, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(HTTPStatus.OK, body, content_type, headers)
+
+    # --- API ----------------------------------------------------------------
+    def api_login(self):
+        data = self._body()
+        token, user = self.server.state.login(data.get("username", ""), data.get("password", ""))
+        if not token:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": LOGIN_ERROR})
+        cookie = f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"
+        self._json(HTTPStatus.OK, {"token": token, "user": _public_user(user)}, {"Set-Cookie": cookie})
+
+    def api_logout(self):
+        token = self._token()
+        with self.server.state.lock:
+            self.server.state.sessions.pop(token, None)
+        cookie = f"{SESSION_COOKIE}=; Path=/; Max-Age=0"
+        self._json(HTTPStatus.OK, {"message": "Success log out"}, {"Set-Cookie": cookie})
+
+    def api_profile(self):
+        user = self._user()
+        if not user:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": "Unauthorized"})
+        self._json(HTTPStatus.OK, _public_user(user))
+
+    def api_update_profile(self):
+        user = self._user()
+        if not user:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": "Unauthorized"})
+        data = self._body()
+        fullname = data.get("fullname", user["fullname"]).strip()
+        if not FULLNAME_PATTERN.match(fullname):
+            return self._json(HTTPStatus.UNPROCESSABLE_ENTITY, {"message": FULLNAME_ERROR})
+        with self.server.state.lock:
+            user["fullname"] = fullname
+            user["description"] = data.get("description", user["description"])
+        self._json(HTTPStatus.OK, {"message": "Success update profile", "user": _public_user(user)})
+
+    def api_feed(self):
+        self._json(HTTPStatus.OK, {"posts": self.server.state.feed(self._user())})
+
+    def api_blocked(self):
+        user = self._user()
+        if not user:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": "Unauthorized"})
+        with self.server.state.lock:
+            posts = [self.server.state.posts[post_id] for post_id in sorted(user["blocked"])]
+        self._json(HTTPStatus.OK, {"posts": posts})
+
+    def api_create_post(self):
+        user = self._user()
+        if not user:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": "Unauthorized"})
+        title = self._body().get("title") or "Untitled"
+        with self.server.state.lock:
+            post_id = max(self.server.state.posts, default=0) + 1
+            post = {"id": post_id, "title": title, "author": user["fullname"]}
+            self.server.state.posts[post_id] = post
+        self._json(HTTPStatus.CREATED, {"message": "Success create post", "post": post})
+
+    def api_block(self, post_id, blocked=True):
+        user = self._user()
+        if not user:
+            return self._json(HTTPStatus.UNAUTHORIZED, {"message": "Unauthorized"})
+        if int(post_id) not in self.server.state.posts:
+            return self._json(HTTPStatus.NOT_FOUND, {"message": "Post not found"})
+        with self.server.state.lock:
+            if blocked:
+                user["blocked"].add(int(post_id))
+            else:
+                user["blocked"].discard(int(post_id))
+        self._json(HTTPStatus.OK, {"message": "Success Block Post" if blocked else "Success Unblock Post"})
+
+    def api_unblock(self, post_id):
+        self.api_block(post_id, blocked=False)
+
+
+GET_ROUTES = [
+    (r"/", StubHandler.home),
+    (r"/login", StubHandler.login_page),
+    (r"/profile", StubHandler.profile),
+    (r"/profile/edit", StubHandler.edit_profile),
+    (r"/post/(\d+)", StubHandler.post),
+    (r"/terms-of-service", StubHandler.terms),
+    (r"/privacy-policy", StubHandler.privacy),
+    (r"/promo", StubHandler.promo),
+    (r"/store/google-play", StubHandler.google_play),
+    (r"/store/app-store", StubHandler.app_store),
+    (r"/static/([\w-]+)\.(css|js|svg)", StubHandler.static),
+    (r"/api/profile", StubHandler.api_profile),
+    (r"/api/posts", StubHandler.api_feed),
+    (r"/api/posts/blocked", StubHandler.api_blocked),
+]
+
+POST_ROUTES = [
+    (r"/api/auth/login", StubHandler.api_login),
+    (r"/api/auth/logout", StubHandler.api_logout),
+    (r"/api/profile", StubHandler.api_update_profile),
+    (r"/api/posts", StubHandler.api_create_post),
+    (r"/api/posts/(\d+)/block", StubHandler.api_block),
+    (r"/api/posts/(\d+)/unblock", StubHandler.api_unblock),
+]
+
+
+class StubServer:
+    """
+    Local stand-in for the Panorra web app, serving the pages and API flows the
+    suite exercises from memory. Every response is delayed by `latency_ms`;
+    when `access_code` is set, requests without a matching `Access-Code` header
+    are rejected like on the real environment.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency_ms=0, accounts=None, access_code=None, verbose=False):
+        self._httpd = ThreadingHTTPServer((host, port), StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.state = StubState(accounts or {DEFAULT_USERNAME: DEFAULT_PASSWORD})
+        self._httpd.latency_ms = latency_ms
+        self._httpd.access_code = access_code
+        self._httpd.verbose = verbose
+        self._httpd.started_http_date = formatdate(usegmt=True)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def state(self):
+        return self._httpd.state
+
+    def start(self):
+        """Serve in a background thread and return the base URL."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self.url
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
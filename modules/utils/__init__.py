@@ -1,9 +1,15 @@
 from .browser import launch_browser
-from .helpers import wait, take_screenshot, assert_text
+from .helpers import wait, take_screenshot, assert_text, assert_no_activity
+from .auth import login_user, api_login, fresh_storage_state, ensure_storage_state
 
 __all__ = [
     "launch_browser",
     "wait",
     "take_screenshot",
-    "assert_text"
+    "assert_text",
+    "assert_no_activity",
+    "login_user",
+    "api_login",
+    "fresh_storage_state",
+    "ensure_storage_state"
 ]
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from playwright.sync_api import BrowserContext, Route
+
+# Only these request types are cached; documents, XHR/fetch and media always hit the network
+STATIC_RESOURCE_TYPES = ("script", "stylesheet", "image", "font")
+# Describe the transfer, not the content; the cached body is stored decoded
+TRANSFER_HEADERS = ("content-length", "content-encoding", "transfer-encoding", "connection", "keep-alive")
+MAX_AGE = re.compile(r"max-age=(\d+)")
+# Eviction scans the whole cache, so it runs every this many stores or once this share of `max_mb` was written
+EVICT_EVERY = 200
+EVICT_HIGH_WATER = 0.1
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _fresh_until(headers: dict) -> float:
+    """Time until which a response may be served without revalidation (0 = always revalidate)."""
+    cache_control = headers.get("cache-control", "").lower()
+    match = MAX_AGE.search(cache_control)
+    if "no-cache" in cache_control or not match:
+        return 0
+    return time.time() + int(match.group(1))
+
+
+class AssetCache:
+    """
+    Route-level HTTP cache for static assets, stored on disk and shared by every
+    context and xdist worker.
+
+    Bodies are stored once per content hash under `objects/`; `index/` maps each
+    URL to its body and validators. Fresh entries (max-age) are served without a
+    request, stale ones are revalidated with If-None-Match / If-Modified-Since so
+    only a 304 crosses the network. Least recently used bodies are evicted once
+    the cache grows beyond `max_mb`, checked every `EVICT_EVERY` stores or after
+    `EVICT_HIGH_WATER` of it was written.
+    """
+
+    def __init__(self, cache_dir: Path, max_mb: int = 512):
+        self.cache_dir = Path(cache_dir)
+        self.objects_dir = self.cache_dir / "objects"
+        self.index_dir = self.cache_dir / "index"
+        self.max_bytes = max_mb * 1024 * 1024
+        self.hits = self.revalidated = self.misses = 0
+        self._stores_since_evict = self._bytes_since_evict = 0
+        for folder in (self.objects_dir, self.index_dir):
+            folder.mkdir(parents=True, exist_ok=True)
+
+    def attach(self, ctx: BrowserContext):
+        """Serve the static assets of every page in `ctx` through the cache."""
+        ctx.route("**/*", self._handle)
+
+    def _entry_path(self, url: str) -> Path:
+        return self.index_dir / f"{_digest(url.encode())}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.objects_dir / digest[:2] / digest
+
+    def _load(self, url: str):
+        try:
+            entry = json.loads(self._entry_path(url).read_text())
+            body_path = self._object_path(entry["digest"])
+            body = body_path.read_bytes()
+            os.utime(body_path)  # Recently used, evicted last
+        except (OSError, ValueError, KeyError):
+            # Missing, evicted by another worker (even after the read), or half written: treat as a miss
+            return None, None
+        return entry, body
+
+    def _store(self, url: str, status: int, headers: dict, body: bytes):
+        digest = _digest(body)
+        body_path = self._object_path(digest)
+        if not body_path.exists():
+            _write_atomic(body_path, body)
+            self._bytes_since_evict += len(body)
+        entry = {
+            "url": url,
+            "status": status,
+            "headers": {name: value for name, value in headers.items() if name not in TRANSFER_HEADERS},
+            "digest": digest,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "fresh_until": _fresh_until(headers),
+        }
+        _write_atomic(self._entry_path(url), json.dumps(entry).encode())
+        self._stores_since_evict += 1
+        if (self._stores_since_evict >= EVICT_EVERY
+                or self._bytes_since_evict >= self.max_bytes * EVICT_HIGH_WATER):
+            self._evict()
+
+    def _evict(self):
+        self._stores_since_evict = self._bytes_since_evict = 0
+        files = []
+        for path in self.objects_dir.glob("*/*"):
+            if path.name.endswith(".tmp"):
+                continue
+            try:
+                files.append((path.stat(), path))
+            except FileNotFoundError:
+                continue  # Evicted by another worker since the glob
+        total = sum(stat.st_size for stat, _ in files)
+        for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+    def _handle(self, route: Route):
+        request = route.request
+        if request.method != "GET" or request.resource_type not in STATIC_RESOURCE_TYPES:
+            route.fallback()
+            return
+        entry, body = self._load(request.url)
+        if entry and entry["fresh_until"] > time.time():
+            self.hits += 1
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+            return
+
+        headers = dict(request.headers)
+        if entry and entry["etag"]:
+            headers["if-none-match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["if-modified-since"] = entry["last_modified"]
+        try:
+            response = route.fetch(headers=headers)
+        except Exception:
+            # Offline or unreachable, fail the request like the browser would
+            route.abort()
+            return
+
+        if entry and response.status == 304:
+            self.revalidated += 1
+            self._store(request.url, entry["status"], {**entry["headers"], **response.headers}, body)
+            route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+            return
+        self.misses += 1
+        response_body = response.body()
+        cacheable = "no-store" not in response.headers.get("cache-control", "").lower() and (
+            response.headers.get("etag") or response.headers.get("last-modified") or _fresh_until(response.headers))
+        if response.status == 200 and cacheable:
+            self._store(request.url, response.status, response.headers, response_body)
+        route.fulfill(response=response, body=response_body)
+
+    def summary(self) -> str:
+        return f"{self.hits} fresh hits, {self.revalidated} revalidated, {self.misses} downloaded"
@@ -0,0 +1,58 @@
+import asyncio
+import sys
+from asyncio import events
+from contextlib import contextmanager
+from playwright.async_api import BrowserContext
+
+_BaseLoop = asyncio.ProactorEventLoop if sys.platform == "win32" else asyncio.SelectorEventLoop
+
+
+@contextmanager
+def released_sync_loop():
+    """
+    The sync Playwright API keeps its own event loop marked as running in the main thread
+    between calls, so asyncio refuses to run any other loop there. Unmark it while an async
+    fixture or test runs, and mark it again afterwards for the sync fixtures and tests.
+    """
+    previous = events._get_running_loop()
+    events._set_running_loop(None)
+    try:
+        yield
+    finally:
+        events._set_running_loop(previous)
+
+
+class _SyncCompatibleLoop(_BaseLoop):
+    def run_until_complete(self, future):
+        if events._get_running_loop() in (None, self):
+            return super().run_until_complete(future)
+        with released_sync_loop():
+            return super().run_until_complete(future)
+
+
+class SyncCompatibleLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    """Event loop policy for pytest-asyncio whose loops can run next to the sync Playwright API."""
+
+    def new_event_loop(self):
+        return _SyncCompatibleLoop()
+
+
+async def run_concurrently(context: BrowserContext, checks: dict) -> dict:
+    """
+    Run independent read-only checks at the same time, each on a page of its own in `context`.
+    `checks` maps a name to `async def check(page)`. Every check runs to the end, then all
+    failures are raised together; otherwise the results are returned by name.
+    """
+    async def run(check):
+        page = await context.new_page()
+        try:
+            return await check(page)
+        finally:
+            await page.close()
+
+    results = await asyncio.gather(*(run(check) for check in checks.values()), return_exceptions=True)
+    failures = [f"{name}: {type(result).__name__}: {result}"
+                for name, result in zip(checks, results) if isinstance(result, BaseException)]
+    if failures:
+        raise AssertionError(f"{len(failures)} of {len(checks)} concurrent checks failed:\n  " + "\n  ".join(failures))
+    return dict(zip(checks, results))
@@ -0,0 +1,135 @@
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urljoin, urlsplit
+from playwright.sync_api import Browser, Page, Playwright, expect
+from modules.pages import HomePage, LoginPage
+
+# =====================================================================
+# Constants for Timeout
+# =====================================================================
+LONG_TIMEOUT = 60000      # Timeout for page navigation and the login round-trip
+MEDIUM_TIMEOUT = 15000    # Timeout for the session validity probe
+
+# Auth endpoint used for API logins, and the localStorage key the web app keeps its token under
+AUTH_API_PATH = os.getenv("AUTH_API_PATH", "/api/auth/login")
+TOKEN_STORAGE_KEY = os.getenv("AUTH_TOKEN_STORAGE_KEY", "token")
+
+
+def login_user(page: Page, base_url: str, username: str, password: str):
+    """Centralized function to navigate and perform login through the UI."""
+    print("Navigating to login page...")
+    LoginPage(page, base_url).open(via_ui=True).login(username, password)
+
+
+def _find_token(payload):
+    """Look for an access token in a login response body ({"token": ...}, {"data": {"access_token": ...}}, ...)."""
+    if isinstance(payload, dict):
+        for key in ("token", "access_token", "accessToken"):
+            if isinstance(payload.get(key), str):
+                return payload[key]
+        for value in payload.values():
+            token = _find_token(value)
+            if token:
+                return token
+    return None
+
+
+def api_login(playwright: Playwright, base_url: str, username: str, password: str, headers: dict = None) -> dict:
+    """
+    Authenticate against the auth endpoint without a browser and return the session as a
+    Playwright storage state: the cookies set by the response, plus the token in the app's
+    localStorage when the response carries one. Each login gets a request context of its
+    own, so its cookies never mix with another session's.
+    """
+    api = playwright.request.new_context(base_url=base_url, extra_http_headers=headers or {})
+    try:
+        response = api.post(urljoin(base_url, AUTH_API_PATH),
+                            data={"username": username, "password": password}, timeout=MEDIUM_TIMEOUT)
+        if not response.ok:
+            raise AssertionError(f"API login failed with HTTP {response.status}: {response.text()[:200]}")
+        state = api.storage_state()
+        try:
+            token = _find_token(response.json())
+        except ValueError:
+            token = None
+    finally:
+        api.dispose()
+    if token and TOKEN_STORAGE_KEY:
+        parts = urlsplit(base_url)
+        state["origins"] = [{
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "localStorage": [{"name": TOKEN_STORAGE_KEY, "value": token}],
+        }]
+    return state
+
+
+def is_storage_state_valid(browser: Browser, base_url: str, storage_state, context_args: dict) -> bool:
+    """
+    Probe a storage state (a saved file or a state dict) by checking that the header
+    menu of a logged-in user is shown.
+    """
+    if isinstance(storage_state, Path):
+        storage_state = str(storage_state)
+    ctx = browser.new_context(storage_state=storage_state, **context_args)
+    try:
+        page = ctx.new_page()
+        page.goto(base_url, timeout=LONG_TIMEOUT)
+        expect(HomePage(page, base_url).header_menu).to_be_visible(timeout=MEDIUM_TIMEOUT)
+        return True
+    except Exception as e:
+        print(f"\n[Auth state invalid] {e}")
+        return False
+    finally:
+        ctx.close()
+
+
+def ui_login_state(browser: Browser, base_url: str, username: str, password: str, context_args: dict) -> dict:
+    """Log in through the UI in a throwaway context and return its storage state."""
+    ctx = browser.new_context(**context_args)
+    try:
+        page = ctx.new_page()
+        login_user(page, base_url, username, password)
+        expect(HomePage(page, base_url).header_menu).to_be_visible(timeout=MEDIUM_TIMEOUT)
+        return ctx.storage_state()
+    finally:
+        ctx.close()
+
+
+def fresh_storage_state(browser: Browser, playwright: Playwright, base_url: str, username: str,
+                        password: str, context_args: dict) -> dict:
+    """
+    Storage state of a new login. The API login is used when it yields a session that
+    passes the validity probe; when it fails (e.g. AUTH_API_PATH or AUTH_TOKEN_STORAGE_KEY
+    do not match the environment) the login goes through the UI instead.
+    """
+    try:
+        state = api_login(playwright, base_url, username, password, context_args.get("extra_http_headers"))
+    except Exception as e:
+        print(f"\n[API login failed] {e}")
+        state = None
+    if state and is_storage_state_valid(browser, base_url, state, context_args):
+        return state
+    print("\n[Auth] falling back to the UI login")
+    return ui_login_state(browser, base_url, username, password, context_args)
+
+
+def ensure_storage_state(browser: Browser, playwright: Playwright, base_url: str, username: str,
+                         password: str, state_path: Path, ttl: int, context_args: dict) -> Path:
+    """
+    Return a storage state file for an authenticated session.
+    A cached file is reused while it is younger than `ttl` seconds and still passes
+    the validity probe; otherwise a fresh login (see `fresh_storage_state`) is saved.
+    """
+    state_path = Path(state_path)
+    if state_path.exists() and time.time() - state_path.stat().st_mtime < ttl:
+        if is_storage_state_valid(browser, base_url, state_path, context_args):
+            print(f"\n[Auth state reused] {state_path}")
+            return state_path
+
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(fresh_storage_state(browser, playwright, base_url, username, password,
+                                                         context_args)))
+    print(f"\n[Auth state saved] {state_path}")
+    return state_path
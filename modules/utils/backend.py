@@ -0,0 +1,82 @@
+import json
+import os
+from pathlib import Path
+from playwright.sync_api import APIRequestContext, Playwright
+from .auth import MEDIUM_TIMEOUT, TOKEN_STORAGE_KEY
+
+# Backend endpoints used to put the test account into a known state. The defaults are the
+# local stand-in server's; point them at the environment's API, like AUTH_API_PATH.
+PROFILE_PATH = os.getenv("PROFILE_API_PATH", "/api/profile")
+POSTS_PATH = os.getenv("POSTS_API_PATH", "/api/posts")
+BLOCKED_POSTS_PATH = os.getenv("BLOCKED_POSTS_API_PATH", "/api/posts/blocked")
+# {post_id} is replaced by the post's id
+BLOCK_POST_PATH = os.getenv("BLOCK_POST_API_PATH", "/api/posts/{post_id}/block")
+UNBLOCK_POST_PATH = os.getenv("UNBLOCK_POST_API_PATH", "/api/posts/{post_id}/unblock")
+
+# Profile fields restored after tests that edit the profile
+PROFILE_FIELDS = ("fullname", "description")
+
+
+class EndpointNotFound(Exception):
+    """
+    The backend has no such endpoint: HTTP 404, or a non-JSON answer such as the web app's
+    catch-all page, e.g. when the *_API_PATH settings do not match the environment.
+    """
+
+
+class PanorraApi:
+    """
+    Backend client acting as the test account, used by fixtures to seed data before
+    a test and restore it afterwards without going through the UI.
+    """
+
+    def __init__(self, api_request: APIRequestContext):
+        self.api = api_request
+
+    @classmethod
+    def from_storage_state(cls, playwright: Playwright, base_url: str, state_path: Path, headers: dict):
+        """Client authenticated with a saved session (cookies, plus the app token as a bearer token)."""
+        state = json.loads(Path(state_path).read_text())
+        headers = dict(headers)
+        for origin in state.get("origins", []):
+            for item in origin.get("localStorage", []):
+                if item["name"] == TOKEN_STORAGE_KEY:
+                    headers["Authorization"] = f"Bearer {item['value']}"
+        return cls(playwright.request.new_context(base_url=base_url, storage_state=str(state_path),
+                                                  extra_http_headers=headers))
+
+    def _call(self, method: str, path: str, data=None) -> dict:
+        response = self.api.fetch(path.lstrip("/"), method=method, data=data, timeout=MEDIUM_TIMEOUT)
+        if response.status == 404:
+            raise EndpointNotFound(f"{method} {path} returned HTTP 404")
+        if not response.ok:
+            raise AssertionError(f"{method} {path} failed with HTTP {response.status}: {response.text()[:200]}")
+        try:
+            return response.json()
+        except ValueError:
+            raise EndpointNotFound(f"{method} {path} did not return JSON "
+                                   f"({response.headers.get('content-type', 'no content type')})")
+
+    def profile(self) -> dict:
+        return self._call("GET", PROFILE_PATH)
+
+    def update_profile(self, **fields) -> dict:
+        return self._call("POST", PROFILE_PATH, fields)
+
+    def feed(self) -> list:
+        return self._call("GET", POSTS_PATH)["posts"]
+
+    def blocked_posts(self) -> list:
+        return self._call("GET", BLOCKED_POSTS_PATH)["posts"]
+
+    def create_post(self, title: str) -> dict:
+        return self._call("POST", POSTS_PATH, {"title": title})["post"]
+
+    def block_post(self, post_id):
+        self._call("POST", BLOCK_POST_PATH.format(post_id=post_id))
+
+    def unblock_post(self, post_id):
+        self._call("POST", UNBLOCK_POST_PATH.format(post_id=post_id))
+
+    def dispose(self):
+        self.api.dispose()
@@ -0,0 +1,76 @@
+import ipaddress
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext, Request, Route
+
+# Hosts of ad networks and analytics; a request is matched on the host or any of its subdomains
+AD_HOSTS = ("doubleclick.net", "googlesyndication.com", "googleadservices.com", "adservice.google.com",
+            "amazon-adsystem.com", "adnxs.com", "criteo.com", "taboola.com", "outbrain.com")
+ANALYTICS_HOSTS = ("google-analytics.com", "googletagmanager.com", "analytics.google.com", "hotjar.com",
+                   "segment.io", "mixpanel.com", "clarity.ms", "connect.facebook.net")
+
+# Profiles usable in @pytest.mark.block(...) and what each one aborts
+BLOCK_PROFILES = {
+    "ads": "requests to known ad networks",
+    "analytics": "requests to known analytics and tag managers",
+    "third_party": "every request outside the site's own domain (covers ads and analytics)",
+    "images": "images",
+    "media": "images, audio and video",
+    "fonts": "web fonts",
+}
+
+
+def _site(host: str) -> str:
+    """Registrable part of a host (example.com for api.example.com); IPs and single labels stay as they are."""
+    try:
+        ipaddress.ip_address(host)
+        return host
+    except ValueError:
+        return ".".join(host.split(".")[-2:])
+
+
+def _matches_host(host: str, domains) -> bool:
+    return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+
+def make_blocker(profiles, base_url: str):
+    """
+    Returns a predicate telling whether a request is blocked by any of `profiles`.
+    Raises ValueError for unknown profile names.
+    """
+    unknown = set(profiles) - set(BLOCK_PROFILES)
+    if unknown:
+        raise ValueError(f"Unknown block profile(s) {sorted(unknown)}; available: {sorted(BLOCK_PROFILES)}")
+    site = _site(urlsplit(base_url).hostname or "")
+    resource_types = set()
+    if "images" in profiles:
+        resource_types.add("image")
+    if "media" in profiles:
+        resource_types.update(("image", "media"))
+    if "fonts" in profiles:
+        resource_types.add("font")
+
+    def is_blocked(request: Request) -> bool:
+        if request.resource_type in resource_types:
+            return True
+        host = urlsplit(request.url).hostname
+        if not host:
+            return False  # data:, blob: and about: URLs never leave the browser
+        if "third_party" in profiles and request.resource_type != "document" and _site(host) != site:
+            return True
+        return ("ads" in profiles and _matches_host(host, AD_HOSTS)) or \
+               ("analytics" in profiles and _matches_host(host, ANALYTICS_HOSTS))
+
+    return is_blocked
+
+
+def apply_blocking(ctx: BrowserContext, profiles, base_url: str):
+    """Abort requests of `ctx` matched by the blocking `profiles`; everything else is left untouched."""
+    is_blocked = make_blocker(profiles, base_url)
+
+    def handle(route: Route):
+        if is_blocked(route.request):
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    ctx.route("**/*", handle)
@@ -0,0 +1,100 @@
+import json
+from urllib.parse import urlsplit
+from playwright.sync_api import Browser, BrowserContext
+
+# Blank document served on each origin while its web storage is being reset
+RESET_PATH = "/__context_pool_reset__"
+
+CLEAR_STORAGE_SCRIPT = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) {
+            indexedDB.deleteDatabase(db.name);
+        }
+    }
+}"""
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class ContextPool:
+    """
+    Hands out warm browser contexts and resets them between tests instead of
+    creating and closing a context for every test.
+
+    Contexts are keyed by their creation arguments, so only contexts created with
+    the same options are shared. A reset closes all pages and clears routes,
+    offline mode, cookies, permissions and web storage, then restores the
+    storage state the context was created with. Contexts released as dirty, or
+    whose reset fails, are closed and replaced by a fresh one on the next acquire.
+    """
+
+    def __init__(self, browser: Browser, origins=(), max_idle: int = 2):
+        self.browser = browser
+        self.origins = {_origin(url) for url in origins}
+        self.max_idle = max_idle
+        self._idle = {}
+        self._keys = {}
+
+    @staticmethod
+    def _key(context_args: dict) -> str:
+        return json.dumps(context_args, sort_keys=True, default=str)
+
+    def acquire(self, context_args: dict) -> BrowserContext:
+        """Return an idle context created with `context_args`, or a new one."""
+        key = self._key(context_args)
+        idle = self._idle.get(key)
+        ctx = idle.pop() if idle else self.browser.new_context(**context_args)
+        self._keys[ctx] = (key, context_args)
+        return ctx
+
+    def release(self, ctx: BrowserContext, dirty: bool = False):
+        """Reset `ctx` and keep it for reuse, or close it when it cannot be reused."""
+        key, context_args = self._keys.pop(ctx)
+        idle = self._idle.setdefault(key, [])
+        if not dirty and len(idle) < self.max_idle:
+            try:
+                self._reset(ctx, context_args.get("storage_state"))
+                idle.append(ctx)
+                return
+            except Exception as e:
+                print(f"\n[Context reset failed] {e}")
+        ctx.close()
+
+    def _reset(self, ctx: BrowserContext, storage_state=None):
+        for page in list(ctx.pages):
+            page.close()
+        ctx.unroute_all(behavior="ignoreErrors")
+        ctx.set_offline(False)
+        ctx.clear_permissions()
+        ctx.clear_cookies()
+
+        state = {}
+        if storage_state:
+            with open(storage_state) as f:
+                state = json.load(f)
+        saved_storage = {entry["origin"]: entry.get("localStorage", []) for entry in state.get("origins", [])}
+
+        page = ctx.new_page()
+        try:
+            page.route(f"**{RESET_PATH}", lambda route: route.fulfill(body="", content_type="text/html"))
+            for origin in sorted(self.origins | set(saved_storage)):
+                page.goto(origin + RESET_PATH)
+                page.evaluate(CLEAR_STORAGE_SCRIPT)
+                for item in saved_storage.get(origin, []):
+                    page.evaluate("([name, value]) => localStorage.setItem(name, value)", [item["name"], item["value"]])
+        finally:
+            page.close()
+        if state.get("cookies"):
+            ctx.add_cookies(state["cookies"])
+
+    def close(self):
+        """Close every idle context held by the pool."""
+        for idle in self._idle.values():
+            for ctx in idle:
+                ctx.close()
+        self._idle.clear()
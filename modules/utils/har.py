@@ -0,0 +1,25 @@
+from pathlib import Path
+from playwright.sync_api import BrowserContext
+
+# Storage state saved next to the recordings, so replayed runs never log in over the network
+HAR_AUTH_STATE = "auth_state.json"
+
+
+def har_file(har_dir: Path, version: str, node) -> Path:
+    """HAR recording of a test: <har_dir>/<version>/<module>/<test>.har."""
+    return Path(har_dir) / version / Path(node.fspath).stem / f"{node.name}.har"
+
+
+def apply_har(ctx: BrowserContext, path: Path, record: bool, not_found: str = "abort"):
+    """
+    Route the context through a HAR file. When recording, every request goes to the
+    network and the HAR is written when the context closes. When replaying, requests
+    are answered from the HAR; unmatched ones are aborted or sent to the network
+    depending on `not_found` ("abort" or "fallback").
+    """
+    path = Path(path)
+    if record:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        ctx.route_from_har(path, update=True, update_content="embed", update_mode="full")
+    else:
+        ctx.route_from_har(path, not_found=not_found)
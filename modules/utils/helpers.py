@@ -14,3 +14,38 @@ def assert_text(page, selector, expected_text):
     """Assert teks elemen sesuai harapan."""
     element_text = page.inner_text(selector).strip()
     assert element_text == expected_text, f"Expected '{expected_text}' but got '{element_text}'"
+
+def assert_no_activity(page, window_ms: int = 3000, settle_ms: int = 250):
+    """
+    Fast-forward the page's virtual clock by `window_ms` and assert that no navigation,
+    popup or dialog was triggered. The clock must be installed before the page is loaded
+    (see the `virtual_clock` fixture); only `settle_ms` of real time is spent.
+    """
+    activity = []
+    start_url = page.url
+
+    def on_request(request):
+        if request.is_navigation_request() and request.frame == page.main_frame:
+            activity.append(f"navigation to {request.url}")
+
+    def on_popup(popup):
+        activity.append(f"popup {popup.url}")
+
+    def on_dialog(dialog):
+        activity.append(f"{dialog.type} dialog '{dialog.message}'")
+        dialog.dismiss()
+
+    page.on("request", on_request)
+    page.on("popup", on_popup)
+    page.on("dialog", on_dialog)
+    try:
+        page.clock.run_for(window_ms)
+        # Give triggered navigations/popups a moment to reach the event listeners
+        page.wait_for_timeout(settle_ms)
+    finally:
+        page.remove_listener("request", on_request)
+        page.remove_listener("popup", on_popup)
+        page.remove_listener("dialog", on_dialog)
+
+    assert not activity, f"Unexpected activity within {window_ms} ms: {', '.join(activity)}"
+    assert page.url == start_url, f"Expected to stay on '{start_url}' but got '{page.url}'"
@@ -0,0 +1,166 @@
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+from collections import namedtuple
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS test_phases (
+    run_id      TEXT NOT NULL,
+    nodeid      TEXT NOT NULL,
+    attempt     INTEGER NOT NULL,
+    phase       TEXT NOT NULL,
+    outcome     TEXT NOT NULL,
+    duration    REAL NOT NULL,
+    git_commit  TEXT,
+    environment TEXT,
+    worker      TEXT,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_phases_lookup ON test_phases (environment, nodeid, run_id);
+"""
+
+# Number of most recent runs of a test its expected duration is computed from
+RECENT_RUNS = 10
+# Number of most recent runs of a test its flake rate is computed from
+FLAKE_WINDOW = 20
+
+FlakeStats = namedtuple("FlakeStats", "runs flaky rate")
+
+
+def current_commit() -> str:
+    """Commit under test (GITHUB_SHA in CI, else the local HEAD), or "unknown" outside a git checkout."""
+    if os.getenv("GITHUB_SHA"):
+        return os.environ["GITHUB_SHA"]
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+class HistoryStore:
+    """
+    SQLite history of per-test phase durations and outcomes, shared by all xdist workers
+    (WAL mode, one connection per process). Rows are keyed by run, git commit and
+    environment so expectations are only learned from comparable runs.
+    """
+
+    def __init__(self, path: Path, run_id: str, git_commit: str, environment: str):
+        self.path = Path(path)
+        self.run_id = run_id
+        self.git_commit = git_commit
+        self.environment = environment
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def record(self, nodeid: str, attempt: int, phases):
+        """Append the (phase, outcome, duration) rows of one test attempt in a single transaction."""
+        worker = os.getenv("PYTEST_XDIST_WORKER", "main")
+        now = time.time()
+        with self._db:
+            self._db.executemany(
+                "INSERT INTO test_phases VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self.run_id, nodeid, attempt, phase, outcome, duration, self.git_commit, self.environment,
+                  worker, now) for phase, outcome, duration in phases],
+            )
+
+    def expected_durations(self) -> dict:
+        """
+        nodeid -> median wall time (all phases of an attempt) over its last RECENT_RUNS runs in
+        this environment. Rows of the current run are ignored, so every worker sees the same data.
+        """
+        rows = self._db.execute(
+            """SELECT nodeid, run_id, attempt, SUM(duration), MAX(recorded_at) FROM test_phases
+               WHERE environment = ? AND run_id != ?
+               GROUP BY nodeid, run_id, attempt ORDER BY MAX(recorded_at) DESC""",
+            (self.environment, self.run_id),
+        ).fetchall()
+        samples = {}
+        for nodeid, _, _, total, _ in rows:
+            runs = samples.setdefault(nodeid, [])
+            if len(runs) < RECENT_RUNS:
+                runs.append(total)
+        return {nodeid: statistics.median(runs) for nodeid, runs in samples.items()}
+
+    def flake_rates(self) -> dict:
+        """
+        nodeid -> FlakeStats over its last FLAKE_WINDOW runs in this environment. A run counts as
+        flaky when the test failed and then passed on a rerun, or failed on a commit where another
+        run of it passed. Failures on a commit it never passed on are treated as real failures.
+        Only setup and call failures count: teardown errors and exceeded performance budgets
+        (outcome 'budget') say nothing about whether the test itself is flaky.
+        """
+        rows = self._db.execute(
+            """SELECT nodeid, run_id, git_commit, MAX(phase IN ('setup', 'call') AND outcome = 'failed'),
+                      MAX(phase = 'call' AND outcome = 'passed'), MAX(recorded_at) FROM test_phases
+               WHERE environment = ? AND run_id != ?
+               GROUP BY nodeid, run_id, attempt ORDER BY MAX(recorded_at) DESC""",
+            (self.environment, self.run_id),
+        ).fetchall()
+        runs = {}
+        for nodeid, run_id, commit, failed, passed, _ in rows:
+            per_run = runs.setdefault(nodeid, {})
+            if run_id not in per_run:
+                if len(per_run) >= FLAKE_WINDOW:
+                    continue
+                per_run[run_id] = [commit, False, False]
+            per_run[run_id][1] |= bool(failed)
+            per_run[run_id][2] |= bool(passed)
+
+        stats = {}
+        for nodeid, per_run in runs.items():
+            executed = [run for run in per_run.values() if run[1] or run[2]]
+            if not executed:
+                continue
+            passing_commits = {commit for commit, _, passed in executed if passed}
+            flaky = sum(1 for commit, failed, passed in executed if failed and (passed or commit in passing_commits))
+            stats[nodeid] = FlakeStats(len(executed), flaky, flaky / len(executed))
+        return stats
+
+    def close(self):
+        self._db.close()
+
+
+def _group_of(item):
+    """Tests sharing an xdist group have to run on the same worker, so they are scheduled as one unit."""
+    group = item.get_closest_marker("xdist_group")
+    return f"group:{group.args[0]}" if group else item.nodeid
+
+
+def longest_first(items, durations: dict):
+    """
+    Sort `items` in place so the longest known tests (and test groups) start first. Tests
+    without history are assumed to be as long as the longest known one, so they start early.
+    """
+    default = max(durations.values(), default=1.0)
+    unit_cost = {}
+    for item in items:
+        unit_cost[_group_of(item)] = unit_cost.get(_group_of(item), 0.0) + durations.get(item.nodeid, default)
+    first_index = {}
+    for index, item in enumerate(items):
+        first_index.setdefault(_group_of(item), index)
+    items.sort(key=lambda item: (-unit_cost[_group_of(item)], first_index[_group_of(item)]))
+
+
+def shard(items, durations: dict, index: int, count: int):
+    """
+    Split `items` into `count` shards of similar expected duration (longest-first greedy
+    assignment to the least loaded shard) and return (kept, deselected) for shard `index` (1-based).
+    """
+    longest_first(items, durations)
+    default = max(durations.values(), default=1.0)
+    loads = [0.0] * count
+    assigned = {}
+    for item in items:
+        unit = _group_of(item)
+        if unit not in assigned:
+            assigned[unit] = loads.index(min(loads))
+        loads[assigned[unit]] += durations.get(item.nodeid, default)
+    kept = [item for item in items if assigned[_group_of(item)] == index - 1]
+    deselected = [item for item in items if assigned[_group_of(item)] != index - 1]
+    return kept, deselected
@@ -0,0 +1,31 @@
+import os
+
+# Rough memory footprint of one worker (Python process + its own Chrome instance)
+DEFAULT_WORKER_MEMORY_MB = 1024
+
+
+def available_memory_mb():
+    """Return the available system memory in MB, or None when it cannot be determined."""
+    try:
+        with open("/proc/meminfo") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (ValueError, OSError, AttributeError):
+        return None
+
+
+def auto_worker_count(memory_per_worker_mb: int = DEFAULT_WORKER_MEMORY_MB) -> int:
+    """
+    Number of parallel workers the machine can sustain: one per CPU core,
+    capped by how many browsers fit into the currently available memory.
+    """
+    workers = os.cpu_count() or 1
+    memory_mb = available_memory_mb()
+    if memory_mb is not None:
+        workers = min(workers, memory_mb // max(memory_per_worker_mb, 1))
+    return max(workers, 1)
@@ -0,0 +1,216 @@
+import json
+import os
+import re
+import time
+import weakref
+from pathlib import Path
+from urllib.parse import urlsplit
+from playwright.sync_api import BrowserContext
+
+# Binding the in-page collector reports finished navigations through
+REPORT_BINDING = "__panorraPerfReport"
+
+# Runs in every document of the context. Keeps one record per navigation: the document
+# load itself, then one per SPA route change (history API / hash changes). A record is
+# reported when the route changes or the page is hidden; the last one is taken by
+# PerfRecorder.flush() when the test ends.
+PERF_SCRIPT = """(() => {
+  if (window.__panorraPerf || window.top !== window) return;
+  try { performance.setResourceTimingBufferSize(1000); } catch (e) {}
+  let current = { kind: 'navigation', url: location.href, from_url: null, start: 0, cls: 0, fcp: null, lcp: null };
+
+  const observe = (type, callback) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({ type, buffered: true });
+    } catch (e) { /* entry type not supported */ }
+  };
+  observe('paint', entry => {
+    if (entry.name === 'first-contentful-paint' && current.kind === 'navigation') current.fcp = entry.startTime;
+  });
+  observe('largest-contentful-paint', entry => {
+    if (current.kind === 'navigation') current.lcp = entry.renderTime || entry.startTime;
+  });
+  observe('layout-shift', entry => { if (!entry.hadRecentInput) current.cls += entry.value; });
+
+  const round = value => (value === null || value === undefined) ? null : Math.round(value * 10) / 10;
+
+  const resources = since => {
+    const entries = performance.getEntriesByType('resource').filter(entry => entry.startTime >= since);
+    const byType = {};
+    let bytes = 0, scriptBytes = 0;
+    for (const entry of entries) {
+      byType[entry.initiatorType] = (byType[entry.initiatorType] || 0) + 1;
+      const size = entry.transferSize || entry.encodedBodySize || 0;
+      bytes += size;
+      if (entry.initiatorType === 'script' || /\\.m?js(\\?|$)/.test(entry.name)) scriptBytes += size;
+    }
+    return { count: entries.length, by_type: byType, transfer_kb: round(bytes / 1024), js_kb: round(scriptBytes / 1024) };
+  };
+
+  const snapshot = () => {
+    const record = {
+      kind: current.kind, url: current.url, from_url: current.from_url,
+      cls: Math.round(current.cls * 10000) / 10000, resources: resources(current.start),
+    };
+    if (current.kind === 'navigation') {
+      const nav = performance.getEntriesByType('navigation')[0];
+      Object.assign(record, {
+        fcp_ms: round(current.fcp),
+        lcp_ms: round(current.lcp),
+        ttfb_ms: nav ? round(nav.responseStart) : null,
+        timing: nav ? {
+          type: nav.type,
+          dns_ms: round(nav.domainLookupEnd - nav.domainLookupStart),
+          connect_ms: round(nav.connectEnd - nav.connectStart),
+          request_ms: round(nav.responseStart - nav.requestStart),
+          response_ms: round(nav.responseEnd - nav.responseStart),
+          dom_interactive_ms: round(nav.domInteractive),
+          dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+          load_ms: round(nav.loadEventEnd),
+          document_kb: round(nav.transferSize / 1024),
+        } : null,
+      });
+    } else {
+      record.elapsed_ms = round(performance.now() - current.start);
+    }
+    return record;
+  };
+
+  const take = () => {
+    if (current.reported) return null;
+    current.reported = true;
+    return snapshot();
+  };
+  const report = () => {
+    const record = take();
+    if (record && window[BINDING]) window[BINDING](record);
+  };
+
+  const routeChanged = () => {
+    if (location.href === current.url) return;
+    const from = current.url;
+    report();
+    current = { kind: 'route-change', url: location.href, from_url: from, start: performance.now(), cls: 0 };
+  };
+  for (const method of ['pushState', 'replaceState']) {
+    const original = history[method];
+    history[method] = function (...args) {
+      const result = original.apply(this, args);
+      routeChanged();
+      return result;
+    };
+  }
+  window.addEventListener('popstate', routeChanged);
+  window.addEventListener('hashchange', routeChanged);
+  window.addEventListener('pagehide', report);
+
+  window.__panorraPerf = { take };
+})();""".replace("BINDING", repr(REPORT_BINDING))
+
+TAKE_SCRIPT = "() => window.__panorraPerf ? window.__panorraPerf.take() : null"
+
+# Metrics a performance budget can limit, and their location in a navigation record
+BUDGET_METRICS = {
+    "lcp_ms": ("lcp_ms",),
+    "fcp_ms": ("fcp_ms",),
+    "ttfb_ms": ("ttfb_ms",),
+    "cls": ("cls",),
+    "js_kb": ("resources", "js_kb"),
+    "transfer_kb": ("resources", "transfer_kb"),
+    "requests": ("resources", "count"),
+}
+
+# Recorder of the test currently using each context (pooled contexts outlive a test)
+_recorders = weakref.WeakKeyDictionary()
+
+
+class PerfRecorder:
+    """
+    Collects the navigation records of one test and writes each one as it arrives to
+    <perf_dir>/<marker>/<module>/<test>_<NN>.json, tagged with the test id, marker and URL.
+    """
+
+    def __init__(self, perf_dir: Path, node, marker: str, tags=None):
+        self.dir = Path(perf_dir) / marker / Path(node.fspath).stem
+        self.name = node.name
+        self.test_id = node.nodeid
+        self.marker = marker
+        self.tags = dict(tags or {})
+        self.records = []
+        self.closed = False
+
+    def add(self, record: dict):
+        if self.closed or not record:
+            return
+        record = {
+            "test_id": self.test_id,
+            "marker": self.marker,
+            "worker": os.getenv("PYTEST_XDIST_WORKER", "main"),
+            "timestamp": time.time(),
+            **self.tags,
+            **record,
+        }
+        self.records.append(record)
+        self.dir.mkdir(parents=True, exist_ok=True)
+        (self.dir / f"{self.name}_{len(self.records):02d}.json").write_text(json.dumps(record, indent=2))
+
+    def flush(self, ctx: BrowserContext):
+        """Take the pending record of every open page, then ignore anything reported later."""
+        try:
+            for page in ctx.pages:
+                try:
+                    self.add(page.evaluate(TAKE_SCRIPT))
+                except Exception:
+                    pass  # Closed or crashed page, its record is lost
+        finally:
+            self.closed = True
+
+
+def install_perf(ctx: BrowserContext, recorder: PerfRecorder):
+    """Collect the navigations of every page in `ctx` into `recorder`."""
+    if ctx not in _recorders:
+        ctx.add_init_script(PERF_SCRIPT)
+        ctx.expose_binding(REPORT_BINDING, lambda source, record: _recorders[ctx].add(record))
+    _recorders[ctx] = recorder
+
+
+def load_budgets(path: Path) -> dict:
+    """
+    Read the central budget file: route name -> {"path": <regex on the URL path>, <metric>: <limit>, ...}.
+    Routes are matched in file order. A missing file means no central budgets.
+    """
+    path = Path(path)
+    if not path.exists():
+        return {}
+    budgets = json.loads(path.read_text())
+    for route, budget in budgets.items():
+        unknown = set(budget) - set(BUDGET_METRICS) - {"path"}
+        if unknown or "path" not in budget:
+            raise ValueError(f"{path}: route '{route}' needs a 'path' and only these metrics: {', '.join(BUDGET_METRICS)}")
+    return budgets
+
+
+def route_budget(url: str, budgets: dict):
+    """Name and limits of the first route whose path pattern matches `url`, or (None, {})."""
+    path = urlsplit(url).path or "/"
+    for route, budget in budgets.items():
+        if re.fullmatch(budget["path"], path):
+            return route, {metric: limit for metric, limit in budget.items() if metric != "path"}
+    return None, {}
+
+
+def budget_violations(records, budgets: dict, overrides=None) -> list:
+    """
+    Check navigation records against their route's budget, with `overrides` (the test's
+    perf_budget marker) taking precedence. Returns one message per exceeded limit.
+    """
+    violations = []
+    for record in records:
+        route, limits = route_budget(record["url"], budgets)
+        for metric, limit in {**limits, **(overrides or {})}.items():
+            value = record
+            for key in BUDGET_METRICS[metric]:
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is not None and value > limit:
+                violations.append(f"{metric} {value} > {limit} on {route or 'unbudgeted route'} ({record['url']})")
+    return violations
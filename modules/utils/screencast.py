@@ -0,0 +1,73 @@
+import base64
+import time
+from collections import deque
+from pathlib import Path
+from playwright.sync_api import Page
+
+# Display time of the last frame, it has no successor to measure against
+LAST_FRAME_SECONDS = 0.5
+# ffmpeg concat list written next to the dumped frames
+FRAMES_LIST = "frames.txt"
+
+
+class ScreencastBuffer:
+    """
+    Rolling in-memory buffer of the last `seconds` of a page's screencast frames
+    (Chromium `Page.startScreencast`). Nothing is encoded or written to disk
+    unless `dump()` is called, e.g. when the test failed.
+    """
+
+    def __init__(self, page: Page, seconds: int = 20, quality: int = 60, size=(1280, 720)):
+        self.seconds = seconds
+        self.frames = deque()
+        self._session = page.context.new_cdp_session(page)
+        self._session.on("Page.screencastFrame", self._on_frame)
+        self._session.send("Page.startScreencast", {
+            "format": "jpeg",
+            "quality": quality,
+            "maxWidth": size[0],
+            "maxHeight": size[1],
+        })
+
+    def _on_frame(self, params):
+        timestamp = params.get("metadata", {}).get("timestamp")
+        if timestamp is None:
+            timestamp = time.time()
+        self.frames.append((timestamp, base64.b64decode(params["data"])))
+        while self.frames and timestamp - self.frames[0][0] > self.seconds:
+            self.frames.popleft()
+        try:
+            self._session.send("Page.screencastFrameAck", {"sessionId": params["sessionId"]})
+        except Exception:
+            # The page is closing, there is nothing left to acknowledge
+            pass
+
+    def stop(self):
+        """Stop capturing; buffered frames are kept for `dump()`."""
+        try:
+            self._session.send("Page.stopScreencast")
+            self._session.detach()
+        except Exception:
+            pass
+
+    def dump(self, frames_dir: Path):
+        """
+        Write the buffered frames as JPEGs plus an ffmpeg concat list (`frames.txt`) that
+        keeps the original frame timing. Encoding is left to `VideoPipeline`.
+        Returns the directory, or None when no frame was captured.
+        """
+        if not self.frames:
+            return None
+        frames_dir = Path(frames_dir)
+        frames_dir.mkdir(parents=True, exist_ok=True)
+        frames = list(self.frames)
+        lines = []
+        for index, (timestamp, data) in enumerate(frames):
+            name = f"frame_{index:05d}.jpg"
+            (frames_dir / name).write_bytes(data)
+            next_timestamp = frames[index + 1][0] if index + 1 < len(frames) else timestamp + LAST_FRAME_SECONDS
+            lines.append(f"file '{name}'\nduration {max(next_timestamp - timestamp, 0.001):.3f}")
+        # The concat demuxer only applies the last duration when the file is listed twice
+        lines.append(f"file 'frame_{len(frames) - 1:05d}.jpg'")
+        (frames_dir / FRAMES_LIST).write_text("\n".join(lines) + "\n")
+        return frames_dir
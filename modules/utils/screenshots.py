@@ -0,0 +1,85 @@
+import hashlib
+import io
+import os
+import queue
+import threading
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, it is only needed for WebP output
+    Image = None
+
+# Formats the browser can encode itself; WebP is converted from PNG by the writer thread
+BROWSER_FORMATS = ("png", "jpeg")
+
+
+class ScreenshotWriter:
+    """
+    Captures screenshots in the test thread and hands the bytes to a background
+    thread that converts and writes them, so tests never block on encoding or disk.
+    Frames identical to the previous frame of the same series (usually one test)
+    are not written again.
+    """
+
+    def __init__(self, image_format: str = "png", quality: int = 80):
+        if image_format == "webp" and Image is None:
+            print("\n[Screenshot] Pillow is not installed, falling back from webp to jpeg")
+            image_format = "jpeg"
+        self.image_format = image_format
+        self.quality = quality
+        self._last_digest = {}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def capture(self, page, target: Path, series=None, full_page: bool = True):
+        """
+        Screenshot `page` and queue it for `target` (path without suffix).
+        Returns the file that will be written, or None when the frame was unchanged.
+        """
+        capture_type = self.image_format if self.image_format in BROWSER_FORMATS else "png"
+        options = {"type": capture_type, "full_page": full_page}
+        if capture_type == "jpeg":
+            options["quality"] = self.quality
+        data = page.screenshot(**options)
+
+        digest = hashlib.sha1(data).hexdigest()
+        if series is not None:
+            if self._last_digest.get(series) == digest:
+                return None
+            self._last_digest[series] = digest
+
+        suffix = "jpg" if self.image_format == "jpeg" else self.image_format
+        path = Path(target).with_name(f"{Path(target).name}.{suffix}")
+        self._queue.put((data, path))
+        return path
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                data, path = item
+                if self.image_format == "webp":
+                    buffer = io.BytesIO()
+                    Image.open(io.BytesIO(data)).save(buffer, "WEBP", quality=self.quality)
+                    data = buffer.getvalue()
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(path.name + ".tmp")
+                tmp.write_bytes(data)
+                os.replace(tmp, path)
+            except Exception as e:
+                print(f"\n[Screenshot write failed] {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self):
+        """Block until every queued screenshot is on disk."""
+        self._queue.join()
+
+    def close(self):
+        """Flush pending screenshots and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
@@ -0,0 +1,117 @@
+import ast
+import inspect
+import textwrap
+from contextlib import contextmanager
+
+# Calls that change how a page loads or whether it can load at all. A test making them
+# on the shared page would leave it behind in a state the next test does not expect.
+ISOLATING_CALLS = {
+    "route": "routes requests",
+    "route_from_har": "routes requests",
+    "set_offline": "goes offline",
+    "add_init_script": "adds an init script",
+    "set_extra_http_headers": "changes request headers",
+}
+
+
+def isolating_calls(function) -> list:
+    """Descriptions of the ISOLATING_CALLS made directly in the body of a test function."""
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return []
+    names = {node.func.attr for node in ast.walk(tree)
+             if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and node.func.attr in ISOLATING_CALLS}
+    return sorted({ISOLATING_CALLS[name] for name in names})
+
+
+class SharedPage:
+    """
+    One loaded page handed to several read-only tests in turn. While a test runs, changes
+    that would leak into the next one are watched for: navigating away, and the
+    ISOLATING_CALLS on the page or its context. The page (and, for context-level changes,
+    the context) is replaced and loaded again before it is handed out next. `prepare_page`,
+    when given, is called with every new page before it loads; the `prepare_context` of
+    `acquire()` with the context before the page is (re)loaded for that caller.
+    """
+
+    def __init__(self, new_context, url: str, timeout: int, prepare_page=None):
+        self._new_context = new_context
+        self._prepare_page = prepare_page
+        self.url = url
+        self.timeout = timeout
+        self.context = None
+        self.page = None
+        self.loads = 0
+        self.uses = 0
+        self._changed = None    # (scope, reason) of the first leaking change
+        self._watching = False
+
+    def _watch_calls(self, target, scope):
+        for name in ISOLATING_CALLS:
+            original = getattr(target, name, None)
+            if original is None:
+                continue
+
+            def watched(*args, _original=original, _name=name, **kwargs):
+                self._mark(scope, f"{_name}()")
+                return _original(*args, **kwargs)
+            setattr(target, name, watched)
+
+    def _mark(self, scope, reason):
+        # Only changes made by a test count, not the suite's own per-test setup
+        if self._watching and (self._changed is None or scope == "context"):
+            self._changed = (scope, reason)
+
+    def _on_navigated(self, frame):
+        if frame.parent_frame is None:
+            self._mark("page", f"navigated to {frame.url}")
+
+    def acquire(self, prepare_context=None):
+        """
+        The loaded page, replaced first when the previous test changed it. `prepare_context`
+        is called with the context before any load, so a load done here is seen by it.
+        """
+        if self._changed and self._changed[0] == "context" and self.context:
+            self.context.close()
+            self.context = self.page = None
+        if self.context is None:
+            self.context = self._new_context()
+            self._watch_calls(self.context, "context")
+        if prepare_context:
+            prepare_context(self.context)
+        if self.page is None or self.page.is_closed() or self._changed:
+            if self.page and not self.page.is_closed():
+                self.page.close()
+            self.page = self.context.new_page()
+            if self._prepare_page:
+                self._prepare_page(self.page)
+            self._watch_calls(self.page, "page")
+            self.page.goto(self.url, timeout=self.timeout)
+            self.page.on("framenavigated", self._on_navigated)
+            self.loads += 1
+        self._changed = None
+        self.uses += 1
+        return self.page
+
+    @contextmanager
+    def watch(self):
+        """Watch for leaking changes while the block (the test) runs."""
+        self._watching = True
+        try:
+            yield self.page
+        finally:
+            self._watching = False
+
+    def release(self):
+        """Close the pages the test opened (popups); returns why the page will be reloaded, if it will."""
+        for page in list(self.context.pages) if self.context else []:
+            if page is not self.page:
+                page.close()
+        if self.page is None or self.page.is_closed():
+            self._changed = self._changed or ("page", "page closed")
+        return self._changed and self._changed[1]
+
+    def close(self):
+        if self.context:
+            self.context.close()
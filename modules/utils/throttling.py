@@ -0,0 +1,103 @@
+from playwright.sync_api import BrowserContext, Page
+
+# Network conditions of the profiles usable in @pytest.mark.throttle(...) / --throttle, as Chrome
+# DevTools defines them: round-trip latency (ms) and throughput (bytes/s)
+NETWORK_PROFILES = {
+    "slow_3g": {"latency": 2000, "downloadThroughput": 500 * 1000 / 8 * 0.8, "uploadThroughput": 500 * 1000 / 8 * 0.8},
+    "fast_4g": {"latency": 165, "downloadThroughput": 9000 * 1000 / 8 * 0.9, "uploadThroughput": 1500 * 1000 / 8 * 0.9},
+}
+# CPU slowdown factors
+CPU_PROFILES = {
+    "cpu_4x": 4,
+}
+
+# Every profile and what it emulates
+THROTTLE_PROFILES = {
+    "slow_3g": "Slow 3G: 2 s round trips, 400 kbit/s down and up",
+    "fast_4g": "Fast 4G: 165 ms round trips, 8.1 Mbit/s down, 1.35 Mbit/s up",
+    "cpu_4x": "a CPU 4 times slower (a mid-range phone)",
+}
+
+# Conditions restoring an unthrottled network
+NO_NETWORK_THROTTLING = {"latency": 0, "downloadThroughput": -1, "uploadThroughput": -1}
+
+
+def resolve_throttling(profiles):
+    """
+    (network conditions, CPU slowdown rate) of a combination of profiles: at most one network
+    and one CPU profile. Raises ValueError for unknown names or conflicting profiles.
+    """
+    unknown = set(profiles) - set(THROTTLE_PROFILES)
+    if unknown:
+        raise ValueError(f"Unknown throttle profile(s) {sorted(unknown)}; available: {', '.join(THROTTLE_PROFILES)}")
+    network = [profile for profile in profiles if profile in NETWORK_PROFILES]
+    cpu = [profile for profile in profiles if profile in CPU_PROFILES]
+    if len(network) > 1 or len(cpu) > 1:
+        raise ValueError(f"Throttle profiles {list(profiles)} combine more than one network or CPU profile")
+    return (NETWORK_PROFILES[network[0]] if network else NO_NETWORK_THROTTLING,
+            CPU_PROFILES[cpu[0]] if cpu else 1)
+
+
+def throttle_tag(profiles) -> str:
+    """How the profiles are recorded in the perf records ("none" when unthrottled)."""
+    return "+".join(profiles) or "none"
+
+
+class Throttling:
+    """
+    Emulates throttle profiles on every page of a Chromium context, current and future ones,
+    through a CDP session per page (Network.emulateNetworkConditions and
+    Emulation.setCPUThrottlingRate). Pages opened by the page itself (popups) are covered
+    once the context reports them, which can be after their first requests.
+    """
+
+    def __init__(self, ctx: BrowserContext, profiles=()):
+        self.ctx = ctx
+        self.profiles = ()
+        self._network, self._cpu_rate = resolve_throttling(())
+        self._sessions = {}    # page -> its CDP sessions
+        ctx.on("page", self.cover)
+        self.set(*profiles)
+
+    @property
+    def tag(self) -> str:
+        return throttle_tag(self.profiles)
+
+    def set(self, *profiles):
+        """Switch to another combination of profiles (none: unthrottled)."""
+        self._network, self._cpu_rate = resolve_throttling(profiles)
+        self.profiles = tuple(profiles)
+        for page in self.ctx.pages:
+            self._emulate(page, self._sessions.get(page) or [])
+
+    def cover(self, page: Page):
+        """Emulate the profiles on `page`; call it before the page's first navigation."""
+        if page.is_closed() or self._sessions.get(page):
+            return
+        if page not in self._sessions:
+            page.on("close", lambda closed: self._sessions.pop(closed, None))
+        # Still empty while the "page" listener is creating its session: both emulate the same profiles
+        sessions = self._sessions.setdefault(page, [])
+        session = self.ctx.new_cdp_session(page)
+        session.send("Network.enable")
+        sessions.append(session)
+        self._emulate(page, [session])
+
+    def _emulate(self, page: Page, sessions, network=None, cpu_rate=None):
+        for session in sessions:
+            if page.is_closed():
+                return
+            session.send("Network.emulateNetworkConditions", {"offline": False, **(network or self._network)})
+            session.send("Emulation.setCPUThrottlingRate", {"rate": cpu_rate or self._cpu_rate})
+
+    def stop(self):
+        """Stop throttling the context, e.g. before it is reused by another test."""
+        self.ctx.remove_listener("page", self.cover)
+        for page, sessions in list(self._sessions.items()):
+            try:
+                self._emulate(page, sessions, NO_NETWORK_THROTTLING, 1)
+                for session in sessions:
+                    session.detach()
+            except Exception:
+                pass  # Page closed meanwhile, its emulation went with it
+        self._sessions.clear()
@@ -0,0 +1,31 @@
+import weakref
+from pathlib import Path
+from playwright.sync_api import BrowserContext
+
+# Contexts tracing has been started on (pooled contexts outlive a test)
+_traced = weakref.WeakSet()
+
+
+class TraceChunk:
+    """
+    One test's slice of a context-wide Playwright trace. Tracing is started once per
+    context; every test then records a chunk of its own, which is only written to disk
+    (as a zip for `playwright show-trace`) when `stop()` is given a path.
+    """
+
+    def __init__(self, ctx: BrowserContext, title: str):
+        self.ctx = ctx
+        if ctx not in _traced:
+            ctx.tracing.start(screenshots=True, snapshots=True, sources=True)
+            _traced.add(ctx)
+        ctx.tracing.start_chunk(title=title)
+
+    def stop(self, path: Path = None):
+        """End the chunk, saving it to `path`, or dropping it when no path is given."""
+        if path is None:
+            self.ctx.tracing.stop_chunk()
+            return None
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.ctx.tracing.stop_chunk(path=str(path))
+        return path
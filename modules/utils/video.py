@@ -0,0 +1,74 @@
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from .screencast import FRAMES_LIST
+
+# Encoder settings per output format (mp4 matches what CI used to produce)
+ENCODERS = {
+    "mp4": ["-c:v", "libx264", "-preset", "veryfast", "-crf", "23"],
+    "webm": ["-c:v", "libvpx", "-deadline", "realtime", "-b:v", "1M"],
+}
+
+
+def finalize_video(source: Path, target: Path, video_format: str = "mp4", ffmpeg=None) -> Path:
+    """
+    Turn a finished recording into its final artifact at `target` (without suffix).
+    `source` is either a Playwright .webm file or a directory of screencast frames
+    written by `ScreencastBuffer.dump()`. Without ffmpeg, .webm files are moved as
+    they are and frame directories are kept as JPEG sequences.
+    """
+    source, target = Path(source), Path(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    is_frames = source.is_dir()
+
+    if not ffmpeg or (not is_frames and video_format == "webm"):
+        final = target if is_frames else target.with_suffix(".webm")
+        if final.exists():
+            shutil.rmtree(final) if final.is_dir() else final.unlink()
+        shutil.move(str(source), str(final))
+        return final
+
+    final = target.with_suffix(f".{video_format}")
+    if is_frames:
+        inputs = ["-f", "concat", "-safe", "0", "-i", str(source / FRAMES_LIST)]
+    else:
+        inputs = ["-i", str(source)]
+    subprocess.run(
+        [ffmpeg, *inputs, "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2", *ENCODERS[video_format],
+         "-pix_fmt", "yuv420p", "-y", str(final), "-loglevel", "error"],
+        check=True,
+    )
+    shutil.rmtree(source) if is_frames else source.unlink()
+    return final
+
+
+class VideoPipeline:
+    """
+    Transcodes and moves finished videos in the background while the remaining
+    tests keep running. The heavy lifting happens in ffmpeg child processes, the
+    pool threads only start them and wait, so the Playwright driver is never forked.
+    """
+
+    def __init__(self, video_format: str = "mp4", workers=None):
+        self.video_format = video_format
+        self.ffmpeg = shutil.which("ffmpeg")
+        self._executor = ThreadPoolExecutor(max_workers=workers or max(1, (os.cpu_count() or 2) // 2),
+                                            thread_name_prefix="video")
+        self._jobs = []
+
+    def submit(self, source: Path, target: Path):
+        """Queue `source` to be finalized into `target` (path without suffix)."""
+        future = self._executor.submit(finalize_video, source, target, self.video_format, self.ffmpeg)
+        self._jobs.append((target, future))
+
+    def wait(self):
+        """Block until every queued video is finalized and report the outcome."""
+        for target, future in self._jobs:
+            try:
+                print(f"\n[Video saved] {future.result()}")
+            except Exception as e:
+                print(f"\n[Video save failed] {target}: {e}")
+        self._jobs.clear()
+        self._executor.shutdown(wait=True)